@@ -98,6 +98,7 @@ class LocalDocsAdapter(Adapter):
         self._rag_index: DocumentIndex | None = None
         self._embedding_provider: EmbeddingProvider | None = None
         self._rag_initialized = False
+        self._rag_index_mtime: float | None = None
 
     def _classify_doc_type(self, file_path: Path) -> DocType:
         """Classify a document based on its path.
@@ -309,16 +310,13 @@ class LocalDocsAdapter(Adapter):
             self._embedding_provider = get_embedding_provider(self._config.rag)
 
             # Initialize and load document index
-            self._rag_index = DocumentIndex(self._config.rag.index_path)
+            self._rag_index = DocumentIndex(
+                self._config.rag.index_path,
+                dtype=self._config.rag.index_dtype,
+                backend=self._config.rag.index_backend,
+            )
             if self._rag_index.exists():
-                self._rag_index.load()
-                logger.info(
-                    "RAG index loaded",
-                    extra={
-                        "sections": self._rag_index.section_count,
-                        "model": self._rag_index.model,
-                    },
-                )
+                self._refresh_rag_index()
             else:
                 logger.warning(
                     "RAG enabled but index not found. "
@@ -341,6 +339,35 @@ class LocalDocsAdapter(Adapter):
             )
             return False
 
+    def _refresh_rag_index(self) -> None:
+        """Load the RAG index if the index file changed since the last load.
+
+        The index stays in memory between calls; a stat of the index file
+        decides whether 'devscontext index-docs' has rebuilt it meanwhile.
+        save() writes the embeddings sidecar before the JSON file, so a new
+        JSON mtime means the sidecar is already complete.
+        """
+        if self._rag_index is None or not self._config.rag:
+            return
+
+        try:
+            mtime = Path(self._config.rag.index_path).stat().st_mtime
+        except OSError:
+            return
+
+        if mtime == self._rag_index_mtime:
+            return
+
+        self._rag_index.load()
+        self._rag_index_mtime = mtime
+        logger.info(
+            "RAG index loaded",
+            extra={
+                "sections": self._rag_index.section_count,
+                "model": self._rag_index.model,
+            },
+        )
+
     async def _find_docs_via_rag(self, ticket: JiraTicket) -> DocsContext:
         """Find relevant docs using embedding-based semantic search.
 
@@ -359,6 +386,8 @@ class LocalDocsAdapter(Adapter):
             query += " " + ticket.description[:500]
 
         try:
+            self._refresh_rag_index()
+
             # Get query embedding
             query_embedding = await self._embedding_provider.embed_query(query)
 
@@ -522,7 +551,11 @@ class LocalDocsAdapter(Adapter):
 
         # Initialize components
         provider = get_embedding_provider(self._config.rag)
-        index = DocumentIndex(self._config.rag.index_path)
+        index = DocumentIndex(
+            self._config.rag.index_path,
+            disk_dtype=self._config.rag.index_disk_dtype,
+            backend=self._config.rag.index_backend,
+        )
 
         # Handle rebuild
         if rebuild and index.exists():
@@ -574,13 +607,21 @@ class LocalDocsAdapter(Adapter):
             extra={"sections": len(texts), "model": self._config.rag.embedding_model},
         )
 
+        # Embed in length order so each batch holds similarly sized texts and
+        # the model pads less, then restore the original section order.
+        import numpy as np
+
         batch_size = 32
-        all_embeddings: list[list[float]] = []
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        batches = []
+
+        for i in range(0, len(order), batch_size):
+            batch = [texts[j] for j in order[i : i + batch_size]]
+            batches.append(await provider.embed_array(batch))
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            embeddings = await provider.embed(batch)
-            all_embeddings.extend(embeddings)
+        sorted_embeddings = np.concatenate(batches)
+        all_embeddings = np.empty_like(sorted_embeddings)
+        all_embeddings[order] = sorted_embeddings
 
         # Add to index and save
         index.add_sections(indexed_sections, all_embeddings, self._config.rag.embedding_model)
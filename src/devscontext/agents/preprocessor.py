@@ -20,6 +20,7 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
@@ -211,8 +212,11 @@ class PreprocessingPipeline:
         if jira_ctx is None:
             raise ValueError(f"Could not fetch Jira ticket: {task_id}")
 
-        meeting_ctx = await self._broad_meeting_search(jira_ctx.ticket)
-        docs_ctx = await self._thorough_doc_match(jira_ctx.ticket)
+        # Meetings and docs only depend on the ticket, so fetch them together
+        meeting_ctx, docs_ctx = await asyncio.gather(
+            self._broad_meeting_search(jira_ctx.ticket),
+            self._thorough_doc_match(jira_ctx.ticket),
+        )
 
         # 2. Multi-pass synthesis
         synthesized, quality_score, gaps = await self._multi_pass_synthesis(
@@ -333,28 +337,33 @@ class PreprocessingPipeline:
             return MeetingContext(meetings=[])
 
         try:
-            # Strategy 1: Search by ticket ID
-            ctx_by_id = await fireflies.fetch_task_context(ticket.ticket_id, ticket)
-
-            # Strategy 2: Search by title keywords
+            # Strategy 2 query: title keywords
             keywords = extract_keywords(ticket.title)
             keyword_query = " ".join(keywords[:3])  # Use top 3 keywords
 
+            # Strategy 1 (ticket ID) and strategy 2 are independent searches
+            if keyword_query:
+                ctx_by_id, ctx_by_keywords = await asyncio.gather(
+                    fireflies.fetch_task_context(ticket.ticket_id, ticket),
+                    fireflies.fetch_task_context(keyword_query, ticket),
+                )
+            else:
+                ctx_by_id = await fireflies.fetch_task_context(ticket.ticket_id, ticket)
+                ctx_by_keywords = None
+
             all_meetings = []
             if isinstance(ctx_by_id.data, MeetingContext):
                 all_meetings.extend(ctx_by_id.data.meetings)
 
-            # Search by keywords if we have them
-            if keyword_query:
-                ctx_by_keywords = await fireflies.fetch_task_context(keyword_query, ticket)
-                if isinstance(ctx_by_keywords.data, MeetingContext):
-                    # Deduplicate by meeting title + date
-                    existing = {(m.meeting_title, m.meeting_date) for m in all_meetings}
-                    for meeting in ctx_by_keywords.data.meetings:
-                        key = (meeting.meeting_title, meeting.meeting_date)
-                        if key not in existing:
-                            all_meetings.append(meeting)
-                            existing.add(key)
+            # Merge keyword results if we searched for them
+            if ctx_by_keywords is not None and isinstance(ctx_by_keywords.data, MeetingContext):
+                # Deduplicate by meeting title + date
+                existing = {(m.meeting_title, m.meeting_date) for m in all_meetings}
+                for meeting in ctx_by_keywords.data.meetings:
+                    key = (meeting.meeting_title, meeting.meeting_date)
+                    if key not in existing:
+                        all_meetings.append(meeting)
+                        existing.add(key)
 
             return MeetingContext(meetings=all_meetings)
 
@@ -432,24 +441,23 @@ class PreprocessingPipeline:
         # === Pass 1: Extraction ===
         logger.debug("Pass 1: Extracting from sources")
 
-        # Extract from Jira
         jira_data = self._format_jira_for_extraction(jira_ctx)
-        jira_prompt = EXTRACTION_PROMPT_JIRA.format(jira_data=jira_data)
-        jira_summary = await provider.generate(jira_prompt, max_tokens=1500)
+        prompts = {"jira": EXTRACTION_PROMPT_JIRA.format(jira_data=jira_data)}
 
-        # Extract from meetings (if any)
-        meeting_summary = "No meeting discussions found."
         if meeting_ctx.meetings:
             meeting_data = self._format_meetings_for_extraction(meeting_ctx)
-            meeting_prompt = EXTRACTION_PROMPT_MEETINGS.format(meeting_data=meeting_data)
-            meeting_summary = await provider.generate(meeting_prompt, max_tokens=1500)
+            prompts["meetings"] = EXTRACTION_PROMPT_MEETINGS.format(meeting_data=meeting_data)
 
-        # Extract from docs (if any)
-        docs_summary = "No relevant documentation found."
         if docs_ctx.sections:
             docs_data = self._format_docs_for_extraction(docs_ctx)
-            docs_prompt = EXTRACTION_PROMPT_DOCS.format(docs_data=docs_data)
-            docs_summary = await provider.generate(docs_prompt, max_tokens=1500)
+            prompts["docs"] = EXTRACTION_PROMPT_DOCS.format(docs_data=docs_data)
+
+        # The per-source extractions are independent, so send them as one batch
+        responses = await provider.generate_batch(list(prompts.values()), max_tokens=1500)
+        summaries = dict(zip(prompts, responses, strict=True))
+        jira_summary = summaries["jira"]
+        meeting_summary = summaries.get("meetings", "No meeting discussions found.")
+        docs_summary = summaries.get("docs", "No relevant documentation found.")
 
         # === Pass 2: Combination ===
         logger.debug("Pass 2: Combining extracted facts")
@@ -772,4 +780,7 @@ Consider addressing these before or during implementation:
 
     async def close(self) -> None:
         """Close resources."""
+        if self._provider is not None:
+            await self._provider.close()
+            self._provider = None
         await self._registry.close_all()
@@ -697,6 +697,7 @@ def status(ctx: click.Context) -> None:
         try:
             await storage.initialize()
             stats = await storage.get_stats()
+            await storage.optimize()
             return stats
         finally:
             await storage.close()
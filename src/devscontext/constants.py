@@ -22,6 +22,14 @@ DEFAULT_CACHE_MAX_SIZE: Final[int] = 100
 # =============================================================================
 DEFAULT_HTTP_TIMEOUT_SECONDS: Final[float] = 30.0
 DEFAULT_HTTP_MAX_RETRIES: Final[int] = 3
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 10
+LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS: Final[float] = 60.0
+LLM_SDK_TIMEOUT_SECONDS: Final[float] = 600.0  # Anthropic/OpenAI SDK default request timeout
+
+# =============================================================================
+# PLUGIN LIFECYCLE
+# =============================================================================
+ADAPTER_CLOSE_TIMEOUT_SECONDS: Final[float] = 5.0  # Per-adapter bound on close() at shutdown
 
 # =============================================================================
 # JIRA API
@@ -48,17 +56,30 @@ SUPPORTED_DOC_EXTENSIONS: Final[tuple[str, ...]] = (".md", ".markdown", ".txt",
 MAX_DOC_FILE_SIZE_BYTES: Final[int] = 1_000_000  # 1MB
 MAX_DOCS_TO_SEARCH: Final[int] = 100
 
+# =============================================================================
+# RAG EMBEDDINGS
+# =============================================================================
+OLLAMA_EMBED_CONCURRENCY: Final[int] = 16  # Override with OLLAMA_EMBED_CONCURRENCY env var
+EMBED_QUERY_CACHE_SIZE: Final[int] = 1024  # Query embeddings kept per provider
+OPENAI_EMBED_BATCH_SIZE: Final[int] = 256  # Inputs per embeddings.create call
+OPENAI_EMBED_CONCURRENCY: Final[int] = 8  # Concurrent embeddings.create calls
+
 # =============================================================================
 # SYNTHESIS / LLM
 # =============================================================================
 DEFAULT_LLM_MODEL: Final[str] = "claude-3-haiku-20240307"
 MAX_CONTEXT_LENGTH_CHARS: Final[int] = 100_000
 MAX_SYNTHESIS_INPUT_CHARS: Final[int] = 50_000
+SYNTHESIS_PROMPT_CACHE_SIZE: Final[int] = 256  # Synthesized results kept per plugin (LRU)
+LLM_BATCH_CONCURRENCY: Final[int] = 4  # In-flight requests per generate_batch call
 
 # =============================================================================
 # MCP SERVER
 # =============================================================================
 MCP_SERVER_NAME: Final[str] = "devscontext"
+TASK_CONTEXT_CACHE_MAX_SIZE: Final[int] = 512  # Task contexts kept by the server (LRU)
+MCP_RESPONSE_CHUNK_CHARS: Final[int] = 65_536  # Large responses split into TextContent parts
+CONFIG_CHECK_INTERVAL_SECONDS: Final[float] = 2.0  # Min time between config file mtime checks
 
 # =============================================================================
 # CONFIG FILE
@@ -29,14 +29,22 @@ from __future__ import annotations
 import asyncio
 import time
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypedDict
 
 from devscontext.cache import SimpleCache
 from devscontext.logging import get_logger
-from devscontext.models import DocsContext, JiraContext, JiraTicket, MeetingContext, TaskContext
+from devscontext.models import (
+    CacheConfig,
+    DocsContext,
+    JiraContext,
+    JiraTicket,
+    MeetingContext,
+    TaskContext,
+)
 from devscontext.plugins.base import SourceContext
 from devscontext.plugins.registry import PluginRegistry
 from devscontext.storage import PrebuiltContextStorage
+from devscontext.utils import clip_text
 
 if TYPE_CHECKING:
     from devscontext.models import DevsContextConfig, PrebuiltContext
@@ -44,6 +52,16 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+class SearchContextResult(TypedDict):
+    """Result of DevsContextCore.search_context."""
+
+    query: str
+    results: str
+    sources: list[str]
+    result_count: int
+    duration_ms: int
+
+
 class DevsContextCore:
     """Core orchestration for fetching and synthesizing engineering context.
 
@@ -119,11 +137,19 @@ class DevsContextCore:
             },
         )
 
+    @property
+    def cache_config(self) -> CacheConfig:
+        """Cache settings in effect; the defaults in demo mode."""
+        if self._config is None:
+            return CacheConfig()
+        return self._config.cache
+
     async def get_task_context(
         self,
         task_id: str,
         *,
         use_cache: bool = True,
+        use_prebuilt: bool | None = None,
     ) -> TaskContext:
         """Get aggregated and synthesized context for a task.
 
@@ -135,6 +161,9 @@ class DevsContextCore:
         Args:
             task_id: The task identifier (e.g., Jira ticket ID).
             use_cache: Whether to use cached results.
+            use_prebuilt: Whether to check pre-built context storage.
+                Defaults to use_cache; pass True with use_cache=False to
+                bypass only the in-memory cache.
 
         Returns:
             TaskContext with synthesized markdown and metadata.
@@ -147,7 +176,9 @@ class DevsContextCore:
         cache_key = f"context:{task_id}"
 
         # Check pre-built context storage first (instant return with rich context)
-        if use_cache and self._storage is not None:
+        if use_prebuilt is None:
+            use_prebuilt = use_cache
+        if use_prebuilt and self._storage is not None:
             prebuilt = await self._get_prebuilt_context(task_id)
             if prebuilt is not None and not prebuilt.is_expired():
                 logger.info(
@@ -466,7 +497,7 @@ class DevsContextCore:
             self._cache.clear()
             logger.debug("Cache cleared")
 
-    async def search_context(self, query: str) -> dict[str, str | list[str] | int]:
+    async def search_context(self, query: str) -> SearchContextResult:
         """Search across all sources by keyword.
 
         Searches Jira, meetings, and local docs in parallel for freeform queries
@@ -479,7 +510,8 @@ class DevsContextCore:
             query: The search query.
 
         Returns:
-            Dictionary with formatted results and metadata.
+            SearchContextResult with formatted results and metadata. The
+            sources list is never empty; it is ["none"] when nothing matched.
         """
         # Demo mode: return sample search results
         if self._demo_mode:
@@ -593,10 +625,7 @@ class DevsContextCore:
             date_str = meeting.meeting_date.strftime("%Y-%m-%d")
             parts.append(f"\n**{meeting.meeting_title}** ({date_str})")
             # Truncate excerpt for search results
-            excerpt = meeting.excerpt
-            if len(excerpt) > 300:
-                excerpt = excerpt[:300] + "..."
-            parts.append(excerpt)
+            parts.append(clip_text(meeting.excerpt, 300))
         return "\n".join(parts)
 
     def _format_docs_search_results(self, context: DocsContext) -> str:
@@ -608,10 +637,7 @@ class DevsContextCore:
             parts.append(f"\n**{title}** {doc_type}")
             parts.append(f"*Source: {section.file_path}*")
             # Truncate content for search results
-            content = section.content
-            if len(content) > 200:
-                content = content[:200] + "..."
-            parts.append(content)
+            parts.append(clip_text(section.content, 200))
         return "\n".join(parts)
 
     async def get_standards(
@@ -763,7 +789,7 @@ Try one of the areas above, or omit the area parameter to see all standards.
             )
             return None
 
-    def _get_demo_search_results(self, query: str) -> dict[str, str | list[str] | int]:
+    def _get_demo_search_results(self, query: str) -> SearchContextResult:
         """Get demo search results for any query.
 
         Args:
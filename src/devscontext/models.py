@@ -12,6 +12,11 @@ Models are organized by domain:
 - Result models (TaskContext, ContextData)
 
 All datetime fields use timezone-aware UTC datetimes.
+
+Adapter and synthesis config models are frozen: they are built once when the
+config file is loaded and then shared by reference with the plugins, so they
+must be treated as immutable after construction. Use model_copy(update=...)
+to derive a modified config.
 """
 
 from __future__ import annotations
@@ -19,16 +24,22 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # =============================================================================
 # CONFIG MODELS
 # =============================================================================
 
+# Shared by adapter/synthesis config schemas. Frozen instances are never copied
+# or revalidated when nested in a parent model or handed to a plugin.
+PLUGIN_CONFIG = ConfigDict(frozen=True, revalidate_instances="never")
+
 
 class JiraConfig(BaseModel):
     """Jira adapter configuration."""
 
+    model_config = PLUGIN_CONFIG
+
     base_url: str = Field(default="", description="Jira instance URL")
     email: str = Field(default="", description="Jira authentication email")
     api_token: str = Field(default="", description="Jira API token (from env)")
@@ -43,6 +54,8 @@ class JiraConfig(BaseModel):
 class FirefliesConfig(BaseModel):
     """Fireflies.ai adapter configuration."""
 
+    model_config = PLUGIN_CONFIG
+
     api_key: str = Field(default="", description="Fireflies.ai API key (from env)")
     enabled: bool = Field(default=False, description="Whether adapter is enabled")
     primary: bool = Field(default=False, description="Whether this is a primary source")
@@ -57,6 +70,8 @@ class RagConfig(BaseModel):
     Requires: pip install devscontext[rag]
     """
 
+    model_config = PLUGIN_CONFIG
+
     enabled: bool = Field(default=False, description="Enable RAG for doc matching")
     embedding_provider: Literal["local", "openai", "ollama"] = Field(
         default="local",
@@ -66,10 +81,26 @@ class RagConfig(BaseModel):
         default="all-MiniLM-L6-v2",
         description="Model for generating embeddings",
     )
+    embedding_precision: Literal["fp32", "fp16", "int8", "onnx-int8"] = Field(
+        default="fp32",
+        description="Local model precision (fp16 needs CUDA, onnx-int8 needs onnxruntime)",
+    )
     index_path: str = Field(
         default=".devscontext/doc_index.json",
         description="Path to the embedding index file",
     )
+    index_dtype: Literal["float32", "int8"] = Field(
+        default="float32",
+        description="In-memory embedding storage (int8 uses 4x less memory)",
+    )
+    index_disk_dtype: Literal["fp32", "fp16"] = Field(
+        default="fp32",
+        description="On-disk embedding format (fp16 is compressed and ~2x smaller)",
+    )
+    index_backend: Literal["numpy", "faiss-flat", "faiss-hnsw"] = Field(
+        default="numpy",
+        description="Search backend (faiss-* requires: pip install devscontext[faiss])",
+    )
     top_k: int = Field(
         default=10,
         ge=1,
@@ -87,6 +118,8 @@ class RagConfig(BaseModel):
 class DocsConfig(BaseModel):
     """Local documentation adapter configuration."""
 
+    model_config = PLUGIN_CONFIG
+
     paths: list[str] = Field(
         default_factory=lambda: ["./docs/"],
         description="Paths to documentation directories",
@@ -101,6 +134,8 @@ class DocsConfig(BaseModel):
 class SlackConfig(BaseModel):
     """Slack adapter configuration."""
 
+    model_config = PLUGIN_CONFIG
+
     bot_token: str = Field(default="", description="Slack bot token (from env)")
     channels: list[str] = Field(
         default_factory=list,
@@ -126,6 +161,8 @@ class SlackConfig(BaseModel):
 class GmailConfig(BaseModel):
     """Gmail adapter configuration."""
 
+    model_config = PLUGIN_CONFIG
+
     credentials_path: str = Field(
         default="",
         description="Path to OAuth2 credentials JSON (from env)",
@@ -155,6 +192,8 @@ class GmailConfig(BaseModel):
 class GitHubConfig(BaseModel):
     """GitHub adapter configuration."""
 
+    model_config = PLUGIN_CONFIG
+
     token: str = Field(default="", description="GitHub Personal Access Token (from env)")
     repos: list[str] = Field(
         default_factory=list,
@@ -179,6 +218,8 @@ class GitHubConfig(BaseModel):
 class SynthesisConfig(BaseModel):
     """Synthesis configuration supporting multiple synthesis plugins."""
 
+    model_config = PLUGIN_CONFIG
+
     plugin: Literal["llm", "template", "passthrough"] = Field(
         default="llm",
         description="Synthesis plugin to use (llm, template, passthrough)",
@@ -209,6 +250,52 @@ class SynthesisConfig(BaseModel):
         default=None,
         description="Path to Jinja2 template (only used when plugin=template)",
     )
+    small_model: str | None = Field(
+        default=None,
+        description="Cheaper model for small prompts (only used when plugin=llm)",
+    )
+    small_provider: Literal["anthropic", "openai", "ollama"] | None = Field(
+        default=None,
+        description="Provider for small_model (defaults to provider)",
+    )
+    small_api_key: str | None = Field(
+        default=None,
+        description="API key for small_provider (defaults to api_key when the provider is shared)",
+    )
+    small_model_threshold_tokens: int = Field(
+        default=2000,
+        ge=0,
+        description="Prompts estimated below this many tokens are routed to small_model",
+    )
+
+    @model_validator(mode="after")
+    def _check_small_model_credentials(self) -> SynthesisConfig:
+        """Reject a small model whose provider has no API key.
+
+        Caught at load time; otherwise every small prompt would quietly
+        degrade to the raw fallback.
+        """
+        if self.small_model is not None:
+            provider = self.small_provider or self.provider
+            if provider != "ollama" and not self.get_small_api_key():
+                raise ValueError(
+                    f"small_model requires an API key for {provider}: set small_api_key"
+                    + (" or api_key" if provider == self.provider else "")
+                )
+        return self
+
+    def get_small_api_key(self) -> str | None:
+        """Get the API key used for small_model.
+
+        Returns:
+            small_api_key if set, else api_key when small_model runs on the
+            main provider, else None.
+        """
+        if self.small_api_key:
+            return self.small_api_key
+        if (self.small_provider or self.provider) == self.provider:
+            return self.api_key
+        return None
 
 
 class CacheConfig(BaseModel):
@@ -217,12 +304,29 @@ class CacheConfig(BaseModel):
     enabled: bool = Field(default=True, description="Whether caching is enabled")
     ttl_minutes: int = Field(default=15, ge=1, le=1440, description="Cache entry TTL in minutes")
     max_size: int = Field(default=100, ge=1, description="Maximum cache entries")
+    stale_ttl_minutes: int = Field(
+        default=60,
+        ge=1,
+        le=1440,
+        description="Max age in minutes of a task context served while it refreshes",
+    )
+    fetch_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        le=600,
+        description="Seconds get_task_context waits for a fetch before answering",
+    )
 
     @property
     def ttl_seconds(self) -> int:
         """Return TTL in seconds for compatibility."""
         return self.ttl_minutes * 60
 
+    @property
+    def stale_ttl_seconds(self) -> int:
+        """Return the stale TTL in seconds."""
+        return self.stale_ttl_minutes * 60
+
 
 class AgentTriggerConfig(BaseModel):
     """Configuration for how the pre-processing agent is triggered."""
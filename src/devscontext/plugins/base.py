@@ -53,6 +53,8 @@ from typing import TYPE_CHECKING, Any, ClassVar
 from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from devscontext.models import JiraTicket
 
 
@@ -312,6 +314,25 @@ class SynthesisPlugin(ABC):
         """
         ...
 
+    async def synthesize_stream(
+        self,
+        task_id: str,
+        source_contexts: dict[str, SourceContext],
+    ) -> AsyncIterator[str]:
+        """Synthesize context as incremental markdown chunks.
+
+        Lets callers render output before synthesis finishes. The default
+        implementation yields the full synthesize() result once.
+
+        Args:
+            task_id: The task identifier (e.g., "PROJ-123").
+            source_contexts: Dict mapping adapter names to their SourceContext.
+
+        Yields:
+            Markdown chunks that concatenate to the synthesized context.
+        """
+        yield await self.synthesize(task_id, source_contexts)
+
     async def close(self) -> None:  # noqa: B027
         """Clean up resources (LLM clients, etc.).
 
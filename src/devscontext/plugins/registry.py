@@ -32,8 +32,12 @@ Example Usage:
 
 from __future__ import annotations
 
+import asyncio
+import json
+import sys
 from typing import TYPE_CHECKING, Any
 
+from devscontext.constants import ADAPTER_CLOSE_TIMEOUT_SECONDS
 from devscontext.logging import get_logger
 from devscontext.plugins.base import Adapter, SynthesisPlugin  # noqa: TC001 - used at runtime
 
@@ -48,6 +52,19 @@ logger = get_logger(__name__)
 ADAPTER_ENTRY_POINT = "devscontext.adapters"
 SYNTHESIS_ENTRY_POINT = "devscontext.synthesis"
 
+# Built-in sources loaded from config, in load order:
+# (adapter name, log label, SourcesConfig field, required non-empty config fields)
+SOURCE_ADAPTERS: tuple[tuple[str, str, str, tuple[str, ...]], ...] = (
+    ("jira", "Jira", "jira", ("base_url", "email")),
+    ("fireflies", "Fireflies", "fireflies", ("api_key",)),
+    ("local_docs", "LocalDocs", "docs", ()),
+    ("slack", "Slack", "slack", ("bot_token",)),
+    ("gmail", "Gmail", "gmail", ("credentials_path",)),
+)
+
+# Upper bound on threads used to import entry point modules during discovery
+MAX_DISCOVERY_WORKERS = 8
+
 
 class PluginRegistry:
     """Central registry for discovering and managing plugins.
@@ -56,22 +73,32 @@ class PluginRegistry:
     handles discovery via entry points, and manages plugin instantiation.
 
     Attributes:
-        adapter_classes: Mapping of adapter names to classes.
-        synthesis_classes: Mapping of synthesis plugin names to classes.
+        adapter_classes: Mapping of adapter names to (class, config schema).
+        synthesis_classes: Mapping of synthesis plugin names to (class, config schema).
         _adapter_instances: Active adapter instances.
         _synthesis_instance: Active synthesis plugin instance.
+        _primary_adapters: Snapshot of active primary (name, adapter) pairs.
+        _secondary_adapters: Snapshot of active secondary (name, adapter) pairs.
     """
 
     def __init__(self) -> None:
         """Initialize an empty plugin registry."""
-        # Plugin class registrations
-        self._adapter_classes: dict[str, type[Adapter]] = {}
-        self._synthesis_classes: dict[str, type[SynthesisPlugin]] = {}
+        # Plugin class registrations, keyed by interned plugin name. The config
+        # schema is stored alongside the class so instantiation needs one lookup.
+        self._adapter_classes: dict[str, tuple[type[Adapter], type[BaseModel]]] = {}
+        self._synthesis_classes: dict[str, tuple[type[SynthesisPlugin], type[BaseModel]]] = {}
+
+        # Serialized config JSON schemas, keyed by schema class (plugins may share one)
+        self._json_schemas: dict[type[BaseModel], str] = {}
 
         # Active plugin instances
         self._adapter_instances: dict[str, Adapter] = {}
         self._synthesis_instance: SynthesisPlugin | None = None
 
+        # Primary/secondary partitions, rebuilt whenever adapter instances change
+        self._primary_adapters: tuple[tuple[str, Adapter], ...] = ()
+        self._secondary_adapters: tuple[tuple[str, Adapter], ...] = ()
+
     # =========================================================================
     # BUILT-IN REGISTRATION
     # =========================================================================
@@ -134,57 +161,25 @@ class PluginRegistry:
         """
         sources = config.sources
 
-        # Load Jira adapter if enabled
-        if sources.jira.enabled:
-            if sources.jira.base_url and sources.jira.email:
-                try:
-                    self.create_adapter("jira", sources.jira)
-                    logger.info("Loaded Jira adapter")
-                except Exception as e:
-                    logger.warning(f"Failed to load Jira adapter: {e}")
-            else:
-                logger.debug("Jira adapter skipped: missing base_url or email")
-
-        # Load Fireflies adapter if enabled
-        if sources.fireflies.enabled:
-            if sources.fireflies.api_key:
-                try:
-                    self.create_adapter("fireflies", sources.fireflies)
-                    logger.info("Loaded Fireflies adapter")
-                except Exception as e:
-                    logger.warning(f"Failed to load Fireflies adapter: {e}")
-            else:
-                logger.debug("Fireflies adapter skipped: missing api_key")
+        # Bind log methods once for the loop
+        info = logger.info
+        warn = logger.warning
+        debug = logger.debug
+
+        for name, label, field, required in SOURCE_ADAPTERS:
+            source_config = getattr(sources, field)
+            if not source_config.enabled:
+                continue
+
+            if not all(getattr(source_config, f) for f in required):
+                debug("%s adapter skipped: missing %s", label, " or ".join(required))
+                continue
 
-        # Load local docs adapter if enabled
-        if sources.docs.enabled:
             try:
-                self.create_adapter("local_docs", sources.docs)
-                logger.info("Loaded LocalDocs adapter")
+                self.create_adapter(name, source_config)
+                info("Loaded %s adapter", label)
             except Exception as e:
-                logger.warning(f"Failed to load LocalDocs adapter: {e}")
-
-        # Load Slack adapter if enabled
-        if sources.slack.enabled:
-            if sources.slack.bot_token:
-                try:
-                    self.create_adapter("slack", sources.slack)
-                    logger.info("Loaded Slack adapter")
-                except Exception as e:
-                    logger.warning(f"Failed to load Slack adapter: {e}")
-            else:
-                logger.debug("Slack adapter skipped: missing bot_token")
-
-        # Load Gmail adapter if enabled
-        if sources.gmail.enabled:
-            if sources.gmail.credentials_path:
-                try:
-                    self.create_adapter("gmail", sources.gmail)
-                    logger.info("Loaded Gmail adapter")
-                except Exception as e:
-                    logger.warning(f"Failed to load Gmail adapter: {e}")
-            else:
-                logger.debug("Gmail adapter skipped: missing credentials_path")
+                warn("Failed to load %s adapter: %s", label, e)
 
         # Load synthesis plugin
         synthesis_config = config.synthesis
@@ -193,13 +188,14 @@ class PluginRegistry:
         if plugin_name in self._synthesis_classes:
             try:
                 self.create_synthesis(plugin_name, synthesis_config)
-                logger.info(f"Loaded synthesis plugin: {plugin_name}")
+                logger.info("Loaded synthesis plugin: %s", plugin_name)
             except Exception as e:
-                logger.warning(f"Failed to load synthesis plugin '{plugin_name}': {e}")
+                logger.warning("Failed to load synthesis plugin '%s': %s", plugin_name, e)
         else:
             logger.warning(
-                f"Unknown synthesis plugin '{plugin_name}', "
-                f"available: {list(self._synthesis_classes.keys())}"
+                "Unknown synthesis plugin '%s', available: %s",
+                plugin_name,
+                list(self._synthesis_classes.keys()),
             )
 
     def get_primary_adapters(self) -> dict[str, Adapter]:
@@ -211,13 +207,7 @@ class PluginRegistry:
         Returns:
             Dict mapping adapter names to primary adapter instances.
         """
-        primary: dict[str, Adapter] = {}
-        for name, adapter in self._adapter_instances.items():
-            # Check if adapter config has primary=True
-            config = getattr(adapter, "_config", None)
-            if config is not None and getattr(config, "primary", False):
-                primary[name] = adapter
-        return primary
+        return dict(self._primary_adapters)
 
     def get_secondary_adapters(self) -> dict[str, Adapter]:
         """Get all active secondary adapters.
@@ -228,13 +218,24 @@ class PluginRegistry:
         Returns:
             Dict mapping adapter names to secondary adapter instances.
         """
-        secondary: dict[str, Adapter] = {}
+        return dict(self._secondary_adapters)
+
+    def _rebuild_adapter_partitions(self) -> None:
+        """Recompute the primary/secondary adapter snapshots.
+
+        An adapter is primary if its config has primary=True; adapters
+        without a config or without the flag are secondary.
+        """
+        primary: list[tuple[str, Adapter]] = []
+        secondary: list[tuple[str, Adapter]] = []
         for name, adapter in self._adapter_instances.items():
-            # Check if adapter config has primary=False or not set
             config = getattr(adapter, "_config", None)
-            if config is None or not getattr(config, "primary", False):
-                secondary[name] = adapter
-        return secondary
+            if config is not None and getattr(config, "primary", False):
+                primary.append((name, adapter))
+            else:
+                secondary.append((name, adapter))
+        self._primary_adapters = tuple(primary)
+        self._secondary_adapters = tuple(secondary)
 
     # =========================================================================
     # REGISTRATION
@@ -249,15 +250,16 @@ class PluginRegistry:
         Raises:
             ValueError: If adapter name conflicts with existing registration.
         """
-        name = adapter_class.name
-        if name in self._adapter_classes:
-            existing = self._adapter_classes[name]
+        name = sys.intern(adapter_class.name)
+        registration = self._adapter_classes.get(name)
+        if registration is not None:
+            existing = registration[0]
             if existing is not adapter_class:
                 raise ValueError(f"Adapter '{name}' already registered by {existing.__module__}")
             return  # Already registered same class
 
-        self._adapter_classes[name] = adapter_class
-        logger.debug(f"Registered adapter: {name} ({adapter_class.__module__})")
+        self._adapter_classes[name] = (adapter_class, adapter_class.config_schema)
+        logger.debug("Registered adapter: %s (%s)", name, adapter_class.__module__)
 
     def register_synthesis(self, plugin_class: type[SynthesisPlugin]) -> None:
         """Register a synthesis plugin class.
@@ -268,17 +270,18 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin name conflicts with existing registration.
         """
-        name = plugin_class.name
-        if name in self._synthesis_classes:
-            existing = self._synthesis_classes[name]
+        name = sys.intern(plugin_class.name)
+        registration = self._synthesis_classes.get(name)
+        if registration is not None:
+            existing = registration[0]
             if existing is not plugin_class:
                 raise ValueError(
                     f"Synthesis plugin '{name}' already registered by {existing.__module__}"
                 )
             return  # Already registered same class
 
-        self._synthesis_classes[name] = plugin_class
-        logger.debug(f"Registered synthesis plugin: {name} ({plugin_class.__module__})")
+        self._synthesis_classes[name] = (plugin_class, plugin_class.config_schema)
+        logger.debug("Registered synthesis plugin: %s (%s)", name, plugin_class.__module__)
 
     # =========================================================================
     # DISCOVERY
@@ -303,22 +306,37 @@ class PluginRegistry:
     ) -> None:
         """Discover plugins from a specific entry point group.
 
+        Entry points are loaded concurrently in a thread pool so that module
+        imports for several third-party plugins overlap. Registration happens
+        afterwards on the calling thread, in entry point order, so conflicts
+        are resolved deterministically.
+
         Args:
             group: Entry point group name.
             register_fn: Function to call for each discovered plugin.
         """
+        from concurrent.futures import ThreadPoolExecutor
         from importlib.metadata import entry_points
 
-        eps = entry_points(group=group)
+        eps = list(entry_points(group=group))
+        if not eps:
+            return
 
-        for ep in eps:
+        with ThreadPoolExecutor(max_workers=min(MAX_DISCOVERY_WORKERS, len(eps))) as executor:
+            futures = [executor.submit(ep.load) for ep in eps]
+
+        # Bind log methods once for the loop
+        info = logger.info
+        warn = logger.warning
+        for ep, future in zip(eps, futures, strict=True):
             try:
-                plugin_class = ep.load()
-                register_fn(plugin_class)
-                logger.info(f"Discovered plugin via entry point: {ep.name}")
+                register_fn(future.result())
+                info("Discovered plugin via entry point: %s", ep.name)
             except Exception as e:
-                logger.warning(
-                    f"Failed to load plugin from entry point {ep.name}: {e}",
+                warn(
+                    "Failed to load plugin from entry point %s: %s",
+                    ep.name,
+                    e,
                     extra={"entry_point": ep.name, "group": group},
                 )
 
@@ -346,17 +364,18 @@ class PluginRegistry:
             KeyError: If no adapter is registered with this name.
             TypeError: If config doesn't match the adapter's config_schema.
         """
-        if name in self._adapter_instances:
-            return self._adapter_instances[name]
+        existing = self._adapter_instances.get(name)
+        if existing is not None:
+            return existing
 
-        if name not in self._adapter_classes:
+        registration = self._adapter_classes.get(name)
+        if registration is None:
             raise KeyError(f"No adapter registered with name '{name}'")
 
-        adapter_class = self._adapter_classes[name]
+        adapter_class, expected_schema = registration
 
-        # Validate config type
-        expected_schema = adapter_class.config_schema
-        if not isinstance(config, expected_schema):
+        # Validate config type (exact-type identity check first, isinstance for subclasses)
+        if type(config) is not expected_schema and not isinstance(config, expected_schema):
             raise TypeError(
                 f"Adapter '{name}' expects config of type {expected_schema.__name__}, "
                 f"got {type(config).__name__}"
@@ -364,7 +383,8 @@ class PluginRegistry:
 
         instance = adapter_class(config)  # type: ignore[call-arg]
         self._adapter_instances[name] = instance
-        logger.debug(f"Created adapter instance: {name}")
+        self._rebuild_adapter_partitions()
+        logger.debug("Created adapter instance: %s", name)
 
         return instance
 
@@ -393,16 +413,18 @@ class PluginRegistry:
             if self._synthesis_instance.name == name:
                 return self._synthesis_instance
             # Close existing before creating new
-            logger.debug(f"Replacing synthesis plugin: {self._synthesis_instance.name} -> {name}")
+            logger.debug(
+                "Replacing synthesis plugin: %s -> %s", self._synthesis_instance.name, name
+            )
 
-        if name not in self._synthesis_classes:
+        registration = self._synthesis_classes.get(name)
+        if registration is None:
             raise KeyError(f"No synthesis plugin registered with name '{name}'")
 
-        plugin_class = self._synthesis_classes[name]
+        plugin_class, expected_schema = registration
 
-        # Validate config type
-        expected_schema = plugin_class.config_schema
-        if not isinstance(config, expected_schema):
+        # Validate config type (exact-type identity check first, isinstance for subclasses)
+        if type(config) is not expected_schema and not isinstance(config, expected_schema):
             raise TypeError(
                 f"Plugin '{name}' expects config of type {expected_schema.__name__}, "
                 f"got {type(config).__name__}"
@@ -410,7 +432,7 @@ class PluginRegistry:
 
         instance = plugin_class(config)  # type: ignore[call-arg]
         self._synthesis_instance = instance
-        logger.debug(f"Created synthesis plugin instance: {name}")
+        logger.debug("Created synthesis plugin instance: %s", name)
 
         return instance
 
@@ -477,9 +499,10 @@ class PluginRegistry:
         Raises:
             KeyError: If no adapter is registered with this name.
         """
-        if name not in self._adapter_classes:
+        registration = self._adapter_classes.get(name)
+        if registration is None:
             raise KeyError(f"No adapter registered with name '{name}'")
-        return self._adapter_classes[name].config_schema
+        return registration[1]
 
     def get_synthesis_config_schema(self, name: str) -> type[BaseModel]:
         """Get the configuration schema for a synthesis plugin.
@@ -493,9 +516,53 @@ class PluginRegistry:
         Raises:
             KeyError: If no plugin is registered with this name.
         """
-        if name not in self._synthesis_classes:
+        registration = self._synthesis_classes.get(name)
+        if registration is None:
             raise KeyError(f"No synthesis plugin registered with name '{name}'")
-        return self._synthesis_classes[name].config_schema
+        return registration[1]
+
+    def get_adapter_config_json_schema(self, name: str) -> str:
+        """Get the serialized JSON schema for an adapter's configuration.
+
+        Args:
+            name: The adapter name.
+
+        Returns:
+            The config JSON schema as a JSON string.
+
+        Raises:
+            KeyError: If no adapter is registered with this name.
+        """
+        return self._get_json_schema(self.get_adapter_config_schema(name))
+
+    def get_synthesis_config_json_schema(self, name: str) -> str:
+        """Get the serialized JSON schema for a synthesis plugin's configuration.
+
+        Args:
+            name: The plugin name.
+
+        Returns:
+            The config JSON schema as a JSON string.
+
+        Raises:
+            KeyError: If no plugin is registered with this name.
+        """
+        return self._get_json_schema(self.get_synthesis_config_schema(name))
+
+    def _get_json_schema(self, schema: type[BaseModel]) -> str:
+        """Serialize a config schema to JSON, caching the result per schema class.
+
+        Args:
+            schema: The Pydantic model class.
+
+        Returns:
+            The JSON schema as a JSON string.
+        """
+        cached = self._json_schemas.get(schema)
+        if cached is None:
+            cached = json.dumps(schema.model_json_schema())
+            self._json_schemas[schema] = cached
+        return cached
 
     # =========================================================================
     # LIFECYCLE
@@ -505,40 +572,70 @@ class PluginRegistry:
         """Close all plugin instances and clean up resources.
 
         Should be called during shutdown to properly release resources.
+        Adapters are closed concurrently since their shutdowns are independent,
+        and each close is bounded by ADAPTER_CLOSE_TIMEOUT_SECONDS so a hung
+        adapter cannot block shutdown.
         """
-        # Close adapters
-        for name, adapter in list(self._adapter_instances.items()):
-            try:
-                await adapter.close()
-                logger.debug(f"Closed adapter: {name}")
-            except Exception as e:
-                logger.warning(f"Error closing adapter {name}: {e}")
+        # Close adapters in parallel
+        await asyncio.gather(
+            *(
+                self._close_adapter(name, adapter)
+                for name, adapter in self._adapter_instances.items()
+            )
+        )
 
         self._adapter_instances.clear()
+        self._rebuild_adapter_partitions()
 
-        # Close synthesis plugin
+        # Close synthesis plugin after adapters
         if self._synthesis_instance is not None:
             try:
                 await self._synthesis_instance.close()
-                logger.debug(f"Closed synthesis plugin: {self._synthesis_instance.name}")
+                logger.debug("Closed synthesis plugin: %s", self._synthesis_instance.name)
             except Exception as e:
-                logger.warning(f"Error closing synthesis plugin: {e}")
+                logger.warning("Error closing synthesis plugin: %s", e)
 
             self._synthesis_instance = None
 
+    async def _close_adapter(self, name: str, adapter: Adapter) -> None:
+        """Close a single adapter, logging rather than raising on failure or timeout.
+
+        Args:
+            name: The adapter name.
+            adapter: The adapter instance to close.
+        """
+        try:
+            await asyncio.wait_for(adapter.close(), timeout=ADAPTER_CLOSE_TIMEOUT_SECONDS)
+            logger.debug("Closed adapter: %s", name)
+        except TimeoutError:
+            logger.warning(
+                "Timed out closing adapter %s after %.1fs", name, ADAPTER_CLOSE_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            logger.warning("Error closing adapter %s: %s", name, e)
+
     async def health_check_all(self) -> dict[str, bool]:
         """Run health checks on all active adapters.
 
+        Checks run concurrently since each one is an independent network
+        round-trip.
+
         Returns:
             Dict mapping adapter names to health status.
         """
-        results: dict[str, bool] = {}
+        names = list(self._adapter_instances)
+        outcomes = await asyncio.gather(
+            *(adapter.health_check() for adapter in self._adapter_instances.values()),
+            return_exceptions=True,
+        )
 
-        for name, adapter in self._adapter_instances.items():
-            try:
-                results[name] = await adapter.health_check()
-            except Exception as e:
-                logger.warning(f"Health check failed for {name}: {e}")
+        results: dict[str, bool] = {}
+        warn = logger.warning
+        for name, outcome in zip(names, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                warn("Health check failed for %s: %s", name, outcome)
                 results[name] = False
+            else:
+                results[name] = outcome
 
         return results
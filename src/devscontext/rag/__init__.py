@@ -24,6 +24,7 @@ Example usage:
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -89,6 +90,14 @@ def get_embedding_provider(config: RagConfig) -> EmbeddingProvider:
             f"Supported: {', '.join(providers.keys())}"
         )
 
+    if provider_cls is LocalEmbeddingProvider:
+        # Keep exported/quantized models next to the index they serve
+        return LocalEmbeddingProvider(
+            config.embedding_model,
+            precision=config.embedding_precision,
+            cache_dir=str(Path(config.index_path).parent / "models"),
+        )
+
     return provider_cls(config.embedding_model)
 
 
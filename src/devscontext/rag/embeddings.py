@@ -18,14 +18,33 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib.util
 import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
-
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Literal
+
+from devscontext.constants import (
+    EMBED_QUERY_CACHE_SIZE,
+    OLLAMA_EMBED_CONCURRENCY,
+    OPENAI_EMBED_BATCH_SIZE,
+    OPENAI_EMBED_CONCURRENCY,
+)
 from devscontext.logging import get_logger
 
 logger = get_logger(__name__)
 
+EmbeddingPrecision = Literal["fp32", "fp16", "int8", "onnx-int8"]
+
+# ONNX dynamic quantization target; avx2 runs on any modern x86 CPU
+ONNX_QUANTIZATION_CONFIG = "avx2"
+
+# Dummy encodes run after loading so the first real query isn't the slow one
+MODEL_WARMUP_PASSES = 2
+
 
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers.
@@ -42,6 +61,7 @@ class EmbeddingProvider(ABC):
         """
         self.model = model
         self._dimension: int | None = None
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
 
     @property
     def dimension(self) -> int:
@@ -69,10 +89,30 @@ class EmbeddingProvider(ABC):
         """
         ...
 
+    async def embed_array(self, texts: list[str]) -> Any:  # Returns np.ndarray
+        """Generate embeddings for a batch of texts as a float32 matrix.
+
+        Used when building the index, which stores embeddings as an ndarray.
+        Providers whose backend already produces an array override this to
+        skip the round-trip through Python floats.
+
+        Args:
+            texts: List of text strings to embed.
+
+        Returns:
+            2-D float32 numpy array with one row per input text.
+        """
+        import numpy as np
+
+        embeddings = await self.embed(texts)
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
+
     async def embed_query(self, query: str) -> list[float]:
         """Generate embedding for a single query.
 
         This is a convenience method that wraps embed() for single queries.
+        Results are kept in a per-provider LRU cache of EMBED_QUERY_CACHE_SIZE
+        entries, so repeated queries skip the model or network round-trip.
         Some providers may override this for query-specific optimizations.
 
         Args:
@@ -81,9 +121,34 @@ class EmbeddingProvider(ABC):
         Returns:
             Embedding vector for the query.
         """
+        key = self._cache_key(query)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
         embeddings = await self.embed([query])
+        self._put_cached(key, embeddings[0])
         return embeddings[0]
 
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        """Return the query cache key for a text."""
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def _get_cached(self, key: str) -> list[float] | None:
+        """Look up a cached embedding and mark it most recently used."""
+        embedding = self._query_cache.get(key)
+        if embedding is not None:
+            self._query_cache.move_to_end(key)
+        return embedding
+
+    def _put_cached(self, key: str, embedding: list[float]) -> None:
+        """Cache an embedding, evicting the least recently used if full."""
+        self._query_cache[key] = embedding
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > EMBED_QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+
 
 class LocalEmbeddingProvider(EmbeddingProvider):
     """Embedding provider using sentence-transformers.
@@ -92,37 +157,127 @@ class LocalEmbeddingProvider(EmbeddingProvider):
     The default model (all-MiniLM-L6-v2) is fast and produces 384-dimensional
     embeddings suitable for semantic similarity tasks.
 
+    The precision option trades a little accuracy for CPU/GPU throughput:
+    - fp32: default full-precision weights
+    - fp16: half-precision weights (CUDA only, ignored on CPU)
+    - int8: PyTorch dynamic quantization of the Linear layers
+    - onnx-int8: ONNX Runtime backend with a dynamically quantized model,
+      exported once into cache_dir and reused afterwards
+
     Requires: pip install sentence-transformers
+    (onnx-int8 additionally needs: pip install sentence-transformers[onnx])
     """
 
-    def __init__(self, model: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        model: str = "all-MiniLM-L6-v2",
+        precision: EmbeddingPrecision = "fp32",
+        cache_dir: str | None = None,
+    ) -> None:
         """Initialize with a sentence-transformers model.
 
         Args:
             model: Model name from HuggingFace (default: all-MiniLM-L6-v2).
+            precision: Inference precision (default: fp32).
+            cache_dir: Directory for the exported onnx-int8 model
+                (default: .devscontext/models).
         """
         super().__init__(model)
+        self.precision = precision
+        self._cache_dir = Path(cache_dir or ".devscontext/models")
         self._model_instance: Any = None
+        self._load_lock = threading.Lock()
 
     def _load_model(self) -> Any:  # Returns SentenceTransformer
-        """Lazy-load the sentence-transformers model."""
-        if self._model_instance is None:
+        """Lazy-load and warm up the sentence-transformers model.
+
+        Blocking; called from the executor so loading doesn't stall the
+        event loop. The lock keeps concurrent first calls from loading twice.
+        """
+        with self._load_lock:
+            if self._model_instance is None:
+                self._model_instance = self._create_model()
+                self._dimension = self._model_instance.get_sentence_embedding_dimension()
+
+                # The first encodes after load pay allocator/kernel warmup costs
+                for _ in range(MODEL_WARMUP_PASSES):
+                    self._model_instance.encode(["warmup"], show_progress_bar=False)
+
+        return self._model_instance
+
+    def _create_model(self) -> Any:  # Returns SentenceTransformer
+        """Instantiate the sentence-transformers model at the configured precision."""
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "sentence-transformers not installed. Install with: pip install devscontext[rag]"
+            ) from e
+
+        logger.info(
+            "Loading sentence-transformers model",
+            extra={"model": self.model, "precision": self.precision},
+        )
+        if self.precision == "onnx-int8":
+            return self._load_onnx_int8_model(SentenceTransformer)
+
+        model = SentenceTransformer(self.model)
+        if self.precision == "fp16":
+            return self._apply_fp16(model)
+        if self.precision == "int8":
+            return self._apply_dynamic_int8(model)
+        return model
+
+    def _apply_fp16(self, model: Any) -> Any:
+        """Convert a model to half precision when running on CUDA."""
+        if model.device.type != "cuda":
+            logger.warning(
+                "fp16 embedding precision requires CUDA, using fp32",
+                extra={"model": self.model},
+            )
+            return model
+        return model.half()
+
+    def _apply_dynamic_int8(self, model: Any) -> Any:
+        """Quantize a model's Linear layers to int8 with PyTorch."""
+        import torch
+
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    def _load_onnx_int8_model(self, sentence_transformer: Any) -> Any:
+        """Load the int8 ONNX model, exporting it into the cache on first use.
+
+        Args:
+            sentence_transformer: The SentenceTransformer class.
+
+        Returns:
+            A SentenceTransformer using the ONNX Runtime backend.
+        """
+        model_dir = self._cache_dir / self.model.replace("/", "__")
+        file_name = f"onnx/model_qint8_{ONNX_QUANTIZATION_CONFIG}.onnx"
+
+        if not (model_dir / file_name).exists():
             try:
-                from sentence_transformers import SentenceTransformer
+                from sentence_transformers import export_dynamic_quantized_onnx_model
             except ImportError as e:
                 raise ImportError(
-                    "sentence-transformers not installed. "
-                    "Install with: pip install devscontext[rag]"
+                    "onnx-int8 precision requires sentence-transformers>=3.2. "
+                    "Install with: pip install sentence-transformers[onnx]"
                 ) from e
 
             logger.info(
-                "Loading sentence-transformers model",
-                extra={"model": self.model},
+                "Exporting quantized ONNX model",
+                extra={"model": self.model, "path": str(model_dir)},
+            )
+            onnx_model = sentence_transformer(self.model, backend="onnx")
+            onnx_model.save(str(model_dir))
+            export_dynamic_quantized_onnx_model(
+                onnx_model, ONNX_QUANTIZATION_CONFIG, str(model_dir)
             )
-            self._model_instance = SentenceTransformer(self.model)
-            self._dimension = self._model_instance.get_sentence_embedding_dimension()
 
-        return self._model_instance
+        return sentence_transformer(
+            str(model_dir), backend="onnx", model_kwargs={"file_name": file_name}
+        )
 
     async def embed(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings using sentence-transformers.
@@ -136,17 +291,31 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         if not texts:
             return []
 
-        model = self._load_model()
+        embeddings: list[list[float]] = (await self.embed_array(texts)).tolist()
+        return embeddings
+
+    async def embed_array(self, texts: list[str]) -> Any:  # Returns np.ndarray
+        """Generate embeddings using sentence-transformers as a float32 matrix.
+
+        Args:
+            texts: List of text strings to embed.
+
+        Returns:
+            2-D float32 numpy array with one row per input text.
+        """
+        import numpy as np
+
+        if not texts:
+            return np.empty((0, self._dimension or 0), dtype=np.float32)
 
         # Run in thread pool to avoid blocking async event loop
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        model = await loop.run_in_executor(None, self._load_model)
         embeddings = await loop.run_in_executor(
             None,
             lambda: model.encode(texts, show_progress_bar=False, convert_to_numpy=True),
         )
-
-        # Convert numpy array to list of lists
-        return [emb.tolist() for emb in embeddings]
+        return np.asarray(embeddings, dtype=np.float32)
 
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
@@ -155,6 +324,9 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
     Uses OpenAI's text-embedding-3-small model by default, which produces
     1536-dimensional embeddings with excellent semantic quality.
 
+    Large inputs are split into OPENAI_EMBED_BATCH_SIZE chunks that are sent
+    concurrently, at most OPENAI_EMBED_CONCURRENCY at a time.
+
     Requires: pip install openai
     Environment: OPENAI_API_KEY must be set.
     """
@@ -167,6 +339,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         """
         super().__init__(model)
         self._client = None
+        self._semaphore = asyncio.Semaphore(OPENAI_EMBED_CONCURRENCY)
 
     def _get_client(self) -> Any:  # Returns AsyncOpenAI
         """Lazy-load the OpenAI client."""
@@ -189,6 +362,10 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
     async def embed(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings using OpenAI's API.
 
+        Duplicate texts within one call are sent to the API once. Bulk
+        calls do not touch the query cache, which is reserved for
+        embed_query.
+
         Args:
             texts: List of text strings to embed.
 
@@ -198,17 +375,29 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         if not texts:
             return []
 
+        unique = list(dict.fromkeys(texts))
         client = self._get_client()
 
-        # OpenAI API accepts batch requests
-        response = await client.embeddings.create(
-            model=self.model,
-            input=texts,
-        )
-
-        # Extract embeddings and set dimension
-        embeddings = [item.embedding for item in response.data]
-        if embeddings and self._dimension is None:
+        async def embed_batch(batch: list[str]) -> list[Any]:
+            async with self._semaphore:
+                response = await client.embeddings.create(model=self.model, input=batch)
+            data: list[Any] = response.data
+            return data
+
+        batches = [
+            unique[i : i + OPENAI_EMBED_BATCH_SIZE]
+            for i in range(0, len(unique), OPENAI_EMBED_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+
+        by_text: dict[str, list[float]] = {}
+        for batch, data in zip(batches, responses, strict=True):
+            for text, item in zip(batch, data, strict=True):
+                by_text[text] = item.embedding
+        embeddings = [by_text[text] for text in texts]
+
+        # Set dimension from the first embedding
+        if self._dimension is None:
             self._dimension = len(embeddings[0])
 
         return embeddings
@@ -224,6 +413,7 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
     Alternative: nomic-embed-text (768 dimensions)
 
     Requires: Ollama installed and running (https://ollama.ai)
+    Environment: OLLAMA_EMBED_CONCURRENCY caps in-flight requests (default: 16).
     """
 
     def __init__(
@@ -238,6 +428,8 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         super().__init__(model)
         self.base_url = os.environ.get("OLLAMA_BASE_URL", base_url)
         self._client: Any = None
+        concurrency = int(os.environ.get("OLLAMA_EMBED_CONCURRENCY", OLLAMA_EMBED_CONCURRENCY))
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
 
     def _get_client(self) -> Any:  # Returns httpx.AsyncClient
         """Lazy-load the HTTP client."""
@@ -247,9 +439,13 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
             except ImportError as e:
                 raise ImportError("httpx not installed (should be a core dependency)") from e
 
+            # HTTP/2 needs the optional h2 package and only applies to TLS
+            # endpoints (e.g. a remote Ollama behind a proxy).
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=60.0,  # Embedding can take time for large batches
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
             )
 
         return self._client
@@ -258,34 +454,35 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         """Generate embeddings using Ollama's API.
 
         Note: Ollama doesn't support batch embedding, so we make
-        individual requests for each text.
+        individual requests for each text, running up to
+        OLLAMA_EMBED_CONCURRENCY of them concurrently.
 
         Args:
             texts: List of text strings to embed.
 
         Returns:
-            List of embedding vectors.
+            List of embedding vectors, in input order.
         """
         if not texts:
             return []
 
         client = self._get_client()
-        embeddings = []
 
-        for text in texts:
-            response = await client.post(
-                "/api/embeddings",
-                json={"model": self.model, "prompt": text},
-            )
+        async def embed_one(text: str) -> list[float]:
+            async with self._semaphore:
+                response = await client.post(
+                    "/api/embeddings",
+                    json={"model": self.model, "prompt": text},
+                )
             response.raise_for_status()
+            embedding: list[float] = response.json().get("embedding", [])
+            return embedding
 
-            data = response.json()
-            embedding = data.get("embedding", [])
-            embeddings.append(embedding)
+        embeddings = list(await asyncio.gather(*(embed_one(text) for text in texts)))
 
-            # Set dimension from first response
-            if self._dimension is None and embedding:
-                self._dimension = len(embedding)
+        # Set dimension from first response
+        if self._dimension is None and embeddings[0]:
+            self._dimension = len(embeddings[0])
 
         return embeddings
 
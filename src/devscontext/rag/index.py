@@ -3,17 +3,35 @@
 This module provides a document index that stores section metadata and
 embeddings, enabling semantic similarity search using cosine similarity.
 
-The index is stored as a JSON file with the following structure:
+The index is stored as two files: a JSON metadata file and a float32
+``.npy`` sidecar (same path, ``.npy`` suffix) holding the embedding matrix
+with one row per section. The ``.npy`` file is memory-mapped on load, so
+large indices are paged in on demand. The JSON file has the following
+structure:
 {
+    "format_version": 2,
+    "dtype": "fp32",
+    "normalized": true,
     "model": "all-MiniLM-L6-v2",
     "dimension": 384,
     "indexed_at": "2024-03-20T12:00:00Z",
     "sections": [
         {"file_path": "...", "section_title": "...", "content": "...", "doc_type": "..."}
-    ],
-    "embeddings": [[0.1, 0.2, ...], ...]
+    ]
 }
 
+With ``disk_dtype="fp16"`` the embeddings are instead written as float16 to
+a compressed ``.npz`` sidecar, and the JSON carries ``"dtype": "fp16"`` so
+the loader knows which sidecar to read. This roughly halves the file size
+again; rows are upcast to float32 on load.
+
+With a FAISS backend (``backend="faiss-flat"`` or ``"faiss-hnsw"``) the
+FAISS index is also written to a ``.faiss`` sidecar so it does not have to
+be rebuilt on load.
+
+Indices written before format version 2 kept the embeddings inline as an
+``"embeddings"`` list of lists in the JSON file; these still load.
+
 Example:
     index = DocumentIndex(".devscontext/doc_index.json")
     index.load()
@@ -27,22 +45,50 @@ Example:
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from devscontext.logging import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # Optional; load parses the whole file instead of streaming
+    ijson = None
+
 logger = get_logger(__name__)
 
+# Version 1 stored embeddings inline in the JSON; version 2 uses a .npy sidecar.
+INDEX_FORMAT_VERSION = 2
+
+IndexDtype = Literal["float32", "int8"]
+DiskDtype = Literal["fp32", "fp16"]
+IndexBackend = Literal["numpy", "faiss-flat", "faiss-hnsw"]
 
-@dataclass
+# Neighbors per node in the HNSW graph (FAISS default)
+HNSW_NEIGHBORS = 32
+
+# Scalar top-level keys of the index JSON, read separately when streaming
+_HEADER_KEYS = frozenset(
+    {"format_version", "dtype", "normalized", "model", "dimension", "indexed_at"}
+)
+
+
+@dataclass(slots=True, frozen=True)
 class IndexedSection:
     """A document section stored in the index.
 
     This mirrors ParsedSection from local_docs but is independent to avoid
     circular imports and allow the index to work without the full adapter.
+    Slotted and frozen to keep per-section overhead low in large indices.
     """
 
     file_path: str
@@ -73,23 +119,51 @@ class IndexedSection:
 class DocumentIndex:
     """Index for storing and searching document embeddings.
 
-    Uses NumPy for efficient cosine similarity computation and stores
-    the index as a JSON file for simplicity and portability.
+    Uses NumPy for efficient cosine similarity computation. Section metadata
+    is stored as JSON and embeddings as a binary float32 ``.npy`` sidecar.
+
+    In memory the embeddings are held as a single contiguous float32 matrix,
+    or as an int8 matrix with a per-row float32 scale when ``dtype="int8"``.
+    The int8 form uses a quarter of the memory at a small cost in precision.
+    On disk, embeddings are float32 ``.npy`` by default or compressed float16
+    ``.npz`` with ``disk_dtype="fp16"``, independent of the in-memory type.
+
+    Search runs as a NumPy matrix-vector product by default. The optional
+    FAISS backends use FAISS's SIMD inner-product kernels ("faiss-flat",
+    exact) or an HNSW graph ("faiss-hnsw", approximate, sub-linear) instead,
+    which pays off for very large indices. Requires: pip install faiss-cpu
     """
 
-    def __init__(self, index_path: str = ".devscontext/doc_index.json") -> None:
+    def __init__(
+        self,
+        index_path: str = ".devscontext/doc_index.json",
+        dtype: IndexDtype = "float32",
+        disk_dtype: DiskDtype = "fp32",
+        backend: IndexBackend = "numpy",
+    ) -> None:
         """Initialize the document index.
 
         Args:
             index_path: Path to the JSON index file.
+            dtype: In-memory storage type for embeddings ("float32" or "int8").
+            disk_dtype: On-disk embedding format used by save() ("fp32" or "fp16").
+            backend: Search backend ("numpy", "faiss-flat" or "faiss-hnsw").
         """
         self._index_path = Path(index_path)
+        self._embeddings_path = self._index_path.with_suffix(".npy")
+        self._compressed_path = self._index_path.with_suffix(".npz")
+        self._faiss_path = self._index_path.with_suffix(".faiss")
+        self._dtype = dtype
+        self._disk_dtype = disk_dtype
+        self._backend = backend
         self._model: str | None = None
         self._dimension: int | None = None
         self._indexed_at: datetime | None = None
         self._sections: list[IndexedSection] = []
-        self._embeddings: list[list[float]] = []
-        self._embeddings_array: Any = None  # Cached numpy array
+        self._embeddings_array: Any = None  # Normalized float32 or int8 matrix
+        self._scales: Any = None  # Per-row dequantization scales for int8
+        self._scores: Any = None  # Reused per-query similarity buffer
+        self._faiss_index: Any = None  # Built lazily for FAISS backends
 
     @property
     def is_loaded(self) -> bool:
@@ -129,8 +203,10 @@ class DocumentIndex:
             return False
 
         try:
-            with open(self._index_path) as f:
-                data = json.load(f)
+            if ijson is not None:
+                data, self._sections, legacy_embeddings = self._stream_index_file()
+            else:
+                data, self._sections, legacy_embeddings = self._parse_index_file()
 
             self._model = data.get("model")
             self._dimension = data.get("dimension")
@@ -139,9 +215,28 @@ class DocumentIndex:
             if indexed_at_str:
                 self._indexed_at = datetime.fromisoformat(indexed_at_str)
 
-            self._sections = [IndexedSection.from_dict(s) for s in data.get("sections", [])]
-            self._embeddings = data.get("embeddings", [])
-            self._embeddings_array = None  # Clear cached array
+            if not self._sections:
+                self._set_embeddings(None)
+            elif data.get("format_version", 1) >= 2:
+                np = _import_numpy()
+                if data.get("dtype") == "fp16":
+                    with np.load(self._compressed_path) as archive:
+                        self._set_embeddings(archive["emb"])
+                else:
+                    # Memory-map the matrix: pages are read on demand and
+                    # shared between processes serving the same index.
+                    self._set_embeddings(
+                        np.load(self._embeddings_path, mmap_mode="r"),
+                        normalized=data.get("normalized", False),
+                    )
+            else:
+                self._set_embeddings(legacy_embeddings)
+
+            if self._backend != "numpy" and self._sections and self._faiss_path.exists():
+                faiss = _import_faiss()
+                faiss_index = faiss.read_index(str(self._faiss_path))
+                if faiss_index.ntotal == len(self._sections):
+                    self._faiss_index = faiss_index
 
             logger.info(
                 "Loaded document index",
@@ -157,24 +252,107 @@ class DocumentIndex:
             raise ValueError(f"Invalid index file format: {e}") from e
         except KeyError as e:
             raise ValueError(f"Missing required field in index: {e}") from e
+        except OSError as e:
+            raise ValueError(f"Failed to read index embeddings: {e}") from e
+
+    def _parse_index_file(self) -> tuple[dict[str, Any], list[IndexedSection], Any]:
+        """Parse the whole index JSON in one go.
+
+        Returns:
+            Tuple of (metadata dict, sections, legacy inline embeddings or None).
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON.
+            KeyError: If a required field is missing.
+        """
+        with open(self._index_path, "rb") as f:
+            data = _loads_json(f.read())
+
+        sections = [IndexedSection.from_dict(s) for s in data.get("sections", [])]
+        legacy_embeddings = None
+        if sections and data.get("format_version", 1) < 2:
+            legacy_embeddings = data["embeddings"]
+        return data, sections, legacy_embeddings
+
+    def _stream_index_file(self) -> tuple[dict[str, Any], list[IndexedSection], Any]:
+        """Stream the index JSON with ijson, one section or row at a time.
+
+        Avoids materializing the whole document, which matters most for
+        version 1 indices whose embeddings are inline lists of floats.
+
+        Returns:
+            Tuple of (metadata dict, sections, legacy inline embeddings or None).
+
+        Raises:
+            ValueError: If the file is not valid JSON.
+            KeyError: If a required field is missing.
+        """
+        try:
+            with open(self._index_path, "rb") as f:
+                data: dict[str, Any] = {}
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if prefix in _HEADER_KEYS and event in ("string", "number", "boolean", "null"):
+                        data[prefix] = value
+
+                f.seek(0)
+                sections = [IndexedSection.from_dict(s) for s in ijson.items(f, "sections.item")]
+
+                legacy_embeddings = None
+                if sections and data.get("format_version", 1) < 2:
+                    np = _import_numpy()
+                    f.seek(0)
+                    rows = [
+                        np.asarray(row, dtype=np.float32)
+                        for row in ijson.items(f, "embeddings.item", use_float=True)
+                    ]
+                    if not rows:
+                        raise KeyError("embeddings")
+                    legacy_embeddings = np.vstack(rows)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid index file format: {e}") from e
+
+        return data, sections, legacy_embeddings
 
     def save(self) -> None:
         """Save the index to disk.
 
-        Creates parent directories if needed.
+        Writes the embedding matrix to the ``.npy`` (or compressed ``.npz``)
+        sidecar and the section metadata to the JSON index file. Creates
+        parent directories if needed.
         """
         self._index_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Remove any sidecar from a previous save in the other format. Writing
+        # to a fresh file (rather than truncating in place) also keeps any
+        # process that has the old .npy memory-mapped reading valid data.
+        self._embeddings_path.unlink(missing_ok=True)
+        self._compressed_path.unlink(missing_ok=True)
+        self._faiss_path.unlink(missing_ok=True)
+
+        embeddings = self._get_float32_embeddings()
+        if embeddings is not None:
+            np = _import_numpy()
+            if self._disk_dtype == "fp16":
+                np.savez_compressed(self._compressed_path, emb=embeddings.astype(np.float16))
+            else:
+                np.save(self._embeddings_path, embeddings)
+
+            if self._backend != "numpy":
+                faiss = _import_faiss()
+                faiss.write_index(self._get_faiss_index(), str(self._faiss_path))
+
         data = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "dtype": self._disk_dtype,
+            "normalized": True,
             "model": self._model,
             "dimension": self._dimension,
             "indexed_at": (self._indexed_at.isoformat() if self._indexed_at else None),
             "sections": [s.to_dict() for s in self._sections],
-            "embeddings": self._embeddings,
         }
 
-        with open(self._index_path, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(self._index_path, "wb") as f:
+            f.write(_dumps_json(data))
 
         logger.info(
             "Saved document index",
@@ -187,7 +365,7 @@ class DocumentIndex:
     def add_sections(
         self,
         sections: list[IndexedSection],
-        embeddings: list[list[float]],
+        embeddings: Any,
         model: str,
     ) -> None:
         """Add sections with their embeddings to the index.
@@ -196,7 +374,8 @@ class DocumentIndex:
 
         Args:
             sections: List of document sections.
-            embeddings: Corresponding embedding vectors.
+            embeddings: Corresponding embedding vectors, as a 2-D numpy
+                array or a list of lists.
             model: Name of the model used for embeddings.
 
         Raises:
@@ -209,11 +388,12 @@ class DocumentIndex:
             )
 
         self._sections = sections
-        self._embeddings = embeddings
         self._model = model
-        self._dimension = len(embeddings[0]) if embeddings else None
         self._indexed_at = datetime.now(UTC)
-        self._embeddings_array = None  # Clear cached array
+        self._set_embeddings(embeddings if sections else None)
+        self._dimension = (
+            int(self._embeddings_array.shape[1]) if self._embeddings_array is not None else None
+        )
 
         logger.info(
             "Added sections to index",
@@ -240,51 +420,150 @@ class DocumentIndex:
         Returns:
             List of (section, similarity_score) tuples, sorted by score descending.
         """
-        if not self._sections or not self._embeddings:
+        embeddings = self._embeddings_array
+        if not self._sections or embeddings is None:
             return []
 
-        try:
-            import numpy as np
-        except ImportError as e:
-            raise ImportError(
-                "numpy not installed. Install with: pip install devscontext[rag]"
-            ) from e
-
-        # Cache the embeddings array for repeated queries
-        if self._embeddings_array is None:
-            self._embeddings_array = np.array(self._embeddings)
+        np = _import_numpy()
 
-        query_vec = np.array(query_embedding)
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
 
-        # Compute cosine similarity
-        # cosine_sim = (A . B) / (||A|| * ||B||)
+        # Stored rows are unit length, so cosine similarity is a single
+        # matrix-vector product against the normalized query.
         query_norm = np.linalg.norm(query_vec)
         if query_norm == 0:
             return []
 
-        doc_norms = np.linalg.norm(self._embeddings_array, axis=1)
-        # Avoid division by zero
-        doc_norms = np.where(doc_norms == 0, 1, doc_norms)
+        if self._backend != "numpy":
+            return self._search_faiss(query_vec / query_norm, top_k, threshold)
+
+        # Both operands are float32 and C-contiguous, so np.dot goes straight
+        # to BLAS sgemv and writes into the preallocated scores buffer.
+        query_unit = query_vec / query_norm
+        similarities = self._scores
+        if self._scales is not None:
+            int8_kernel = _get_int8_kernel()
+            if int8_kernel is not None:
+                int8_kernel(embeddings, self._scales, query_unit, similarities)
+            else:
+                np.dot(embeddings.astype(np.float32), query_unit, out=similarities)
+                similarities *= self._scales
+        else:
+            np.dot(embeddings, query_unit, out=similarities)
+
+        # Filter by threshold, then select top-k in linear time and sort
+        # only the selected scores (ties keep index order).
+        candidates = np.nonzero(similarities >= threshold)[0]
+        if candidates.size == 0 or top_k <= 0:
+            return []
+        scores = similarities[candidates]
+
+        k = min(top_k, scores.size)
+        top = np.sort(np.argpartition(-scores, k - 1)[:k])
+        order = top[np.argsort(-scores[top], kind="stable")]
 
-        similarities = np.dot(self._embeddings_array, query_vec) / (doc_norms * query_norm)
+        return [(self._sections[candidates[j]], float(scores[j])) for j in order]
 
-        # Filter by threshold and get top-k
-        results = []
-        for idx, score in enumerate(similarities):
-            if score >= threshold:
-                results.append((idx, float(score)))
+    def _search_faiss(
+        self, query_unit: Any, top_k: int, threshold: float
+    ) -> list[tuple[IndexedSection, float]]:
+        """Search with the FAISS backend.
+
+        Args:
+            query_unit: Unit-length float32 query vector.
+            top_k: Maximum number of results to return.
+            threshold: Minimum similarity score (0-1) to include.
+
+        Returns:
+            List of (section, similarity_score) tuples, sorted by score descending.
+        """
+        if top_k <= 0:
+            return []
+
+        scores, ids = self._get_faiss_index().search(query_unit[None, :], top_k)
 
-        # Sort by score descending
-        results.sort(key=lambda x: x[1], reverse=True)
+        # FAISS pads with id -1 when fewer than top_k vectors exist
+        return [
+            (self._sections[idx], float(score))
+            for idx, score in zip(ids[0], scores[0], strict=True)
+            if idx >= 0 and score >= threshold
+        ]
 
-        # Return top-k with section objects
-        return [(self._sections[idx], score) for idx, score in results[:top_k]]
+    def _get_faiss_index(self) -> Any:
+        """Return the FAISS index, building it from the embeddings if needed.
+
+        Returns:
+            A FAISS inner-product index over the normalized embeddings.
+        """
+        if self._faiss_index is None:
+            faiss = _import_faiss()
+            embeddings = self._get_float32_embeddings()
+            dimension = embeddings.shape[1]
+            if self._backend == "faiss-hnsw":
+                self._faiss_index = faiss.IndexHNSWFlat(
+                    dimension, HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT
+                )
+            else:
+                self._faiss_index = faiss.IndexFlatIP(dimension)
+            self._faiss_index.add(embeddings)
+        return self._faiss_index
+
+    def _set_embeddings(self, embeddings: Any, normalized: bool = False) -> None:
+        """Store an embedding matrix in the configured in-memory format.
+
+        Rows are normalized to unit length so that search only has to
+        normalize the query. For int8 storage each row is quantized
+        symmetrically with its own scale.
+
+        Args:
+            embeddings: 2-D array-like of embeddings, or None to clear.
+            normalized: True if the rows are already unit-length float32, in
+                which case a float32 index keeps the array as-is (so a
+                memory-mapped array stays memory-mapped).
+        """
+        self._scales = None
+        self._scores = None
+        self._faiss_index = None
+        if embeddings is None:
+            self._embeddings_array = None
+            return
+
+        np = _import_numpy()
+        self._scores = np.empty(len(embeddings), dtype=np.float32)
+
+        if normalized and self._dtype == "float32" and embeddings.dtype == np.float32:
+            self._embeddings_array = embeddings
+            return
+
+        unit_rows = _normalize_rows(np.ascontiguousarray(embeddings, dtype=np.float32))
+
+        if self._dtype == "int8":
+            scales = np.abs(unit_rows).max(axis=1) / 127
+            scales[scales == 0] = 1
+            self._embeddings_array = np.round(unit_rows / scales[:, None]).astype(np.int8)
+            self._scales = scales.astype(np.float32)
+        else:
+            self._embeddings_array = unit_rows
+
+    def _get_float32_embeddings(self) -> Any:
+        """Return the embedding matrix as float32, dequantizing if needed.
+
+        Returns:
+            A 2-D float32 numpy array, or None if the index is empty.
+        """
+        if self._embeddings_array is None or self._scales is None:
+            return self._embeddings_array
+        np = _import_numpy()
+        result: Any = self._embeddings_array.astype(np.float32) * self._scales[:, None]
+        return result
 
     def clear(self) -> None:
         """Clear all data from the index."""
         self._sections = []
-        self._embeddings = []
         self._embeddings_array = None
+        self._scales = None
+        self._scores = None
+        self._faiss_index = None
         self._indexed_at = None
         logger.info("Cleared document index")
 
@@ -294,9 +573,7 @@ class DocumentIndex:
         Returns:
             Dictionary with index statistics.
         """
-        doc_types: dict[str, int] = {}
-        for section in self._sections:
-            doc_types[section.doc_type] = doc_types.get(section.doc_type, 0) + 1
+        doc_types = Counter(section.doc_type for section in self._sections)
 
         return {
             "exists": self.exists(),
@@ -305,19 +582,134 @@ class DocumentIndex:
             "dimension": self._dimension,
             "section_count": len(self._sections),
             "indexed_at": (self._indexed_at.isoformat() if self._indexed_at else None),
-            "doc_types": doc_types,
+            "doc_types": dict(doc_types),
             "index_path": str(self._index_path),
         }
 
     def delete(self) -> bool:
-        """Delete the index file from disk.
+        """Delete the index file and its embeddings sidecar from disk.
 
         Returns:
             True if deleted, False if file didn't exist.
         """
         if self._index_path.exists():
+            self.clear()  # Drop any memory map of the sidecar before unlinking
             self._index_path.unlink()
-            self.clear()
+            self._embeddings_path.unlink(missing_ok=True)
+            self._compressed_path.unlink(missing_ok=True)
+            self._faiss_path.unlink(missing_ok=True)
             logger.info("Deleted index file", extra={"path": str(self._index_path)})
             return True
         return False
+
+
+def _dumps_json(data: dict[str, Any]) -> bytes:
+    """Serialize index metadata, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable index metadata.
+
+    Returns:
+        The indented JSON document as UTF-8 bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse index metadata, using orjson when it is installed.
+
+    Args:
+        raw: UTF-8 encoded JSON document.
+
+    Returns:
+        The parsed JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@cache
+def _get_int8_kernel() -> Any:
+    """Compile the fused int8 similarity kernel if numba is installed.
+
+    For int8 indices NumPy has to materialize a float32 copy of the whole
+    matrix on every query before the dot product. The numba kernel instead
+    dequantizes and accumulates row by row in parallel, with no temporaries.
+    Float32 indices keep using BLAS sgemv, which numba does not beat.
+
+    Returns:
+        The compiled kernel ``(q8, scales, query, out) -> None``, or None if
+        numba is not installed.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)  # type: ignore[untyped-decorator, unused-ignore]
+    def int8_similarities(q8: Any, scales: Any, query: Any, out: Any) -> None:
+        rows, dims = q8.shape
+        for i in numba.prange(rows):
+            acc = numba.float32(0.0)
+            for j in range(dims):
+                acc += q8[i, j] * query[j]
+            out[i] = acc * scales[i]
+
+    return int8_similarities
+
+
+def _import_numpy() -> Any:
+    """Import numpy, raising a helpful error if it is not installed.
+
+    Returns:
+        The numpy module.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("numpy not installed. Install with: pip install devscontext[rag]") from e
+    return np
+
+
+def _normalize_rows(embeddings: Any) -> Any:
+    """Scale each row of an embedding matrix to unit length.
+
+    Zero rows are left as-is so they score 0 against every query.
+
+    Args:
+        embeddings: 2-D numpy array of embeddings.
+
+    Returns:
+        A new array with L2-normalized rows.
+    """
+    np = _import_numpy()
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return embeddings / norms
+
+
+def _import_faiss() -> Any:
+    """Import faiss, raising a helpful error if it is not installed.
+
+    Returns:
+        The faiss module.
+
+    Raises:
+        ImportError: If faiss is not installed.
+    """
+    try:
+        import faiss
+    except ImportError as e:
+        raise ImportError(
+            "faiss not installed. Install with: pip install devscontext[faiss]"
+        ) from e
+    return faiss
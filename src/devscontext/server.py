@@ -16,16 +16,35 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import logging
+import sys
 import time
-from typing import Any
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from devscontext.config import load_devscontext_config
-from devscontext.core import DevsContextCore
+from devscontext.constants import (
+    CONFIG_CHECK_INTERVAL_SECONDS,
+    MCP_RESPONSE_CHUNK_CHARS,
+    TASK_CONTEXT_CACHE_MAX_SIZE,
+)
 from devscontext.logging import get_logger
+from devscontext.utils import split_markdown_sections
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+    from devscontext.core import DevsContextCore
+    from devscontext.models import CacheConfig, DevsContextConfig, TaskContext
+
+    ToolHandler = Callable[[DevsContextCore, dict[str, Any], int], Awaitable[list[TextContent]]]
 
 logger = get_logger(__name__)
 
@@ -33,120 +52,376 @@ logger = get_logger(__name__)
 server = Server("devscontext")
 
 # Global state
-_core: DevsContextCore | None = None
 _demo_mode: bool = False
 
+# Identifies the loaded configuration; part of every cached response key so
+# that editing the config file makes all older entries unreachable.
+_config_version: str = ""
+_config_path: Path | None = None
+_config_mtime: float | None = None
+_config_checked_at: float = 0.0
+
+# Stale-while-revalidate cache for get_task_context: key -> (stored_at, result),
+# kept in LRU order and bounded by TASK_CONTEXT_CACHE_MAX_SIZE
+_task_context_cache: OrderedDict[str, tuple[float, TaskContext]] = OrderedDict()
+_task_context_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+_refresh_tasks: dict[str, asyncio.Task[TaskContext]] = {}
+# Strong references to in-flight fetches, which outlive requests that time out
+_fetch_tasks: set[asyncio.Task[TaskContext]] = set()
+
+# The current core, and the core construction started in a worker thread
+# when the server starts
+_core: DevsContextCore | None = None
+_core_warmup: asyncio.Task[DevsContextCore] | None = None
+
+# Tool calls and background refreshes holding each core. A core replaced by a
+# config reload is retired and closed only once its last user releases it.
+_core_users: dict[DevsContextCore, int] = {}
+_retired_cores: set[DevsContextCore] = set()
+_core_reload_lock = asyncio.Lock()
+
+# Result of _build_core: (core, config version, config path, config mtime)
+_CoreBuild = tuple["DevsContextCore", str, "Path | None", "float | None"]
+
 
 def get_core() -> DevsContextCore:
     """Get or create the global DevsContextCore instance.
 
     Lazily initializes the core on first access using
     the configuration loaded from the config file (or demo mode).
+    Config reloads replace it via _reload_core_if_config_changed().
 
     Returns:
-        The singleton DevsContextCore instance.
+        The current DevsContextCore instance.
     """
-    global _core
-    if _core is None:
-        if _demo_mode:
-            _core = DevsContextCore(demo_mode=True)
-            logger.info("DevsContextCore initialized in demo mode")
-        else:
-            config = load_devscontext_config()
-            _core = DevsContextCore(config)
-            logger.info("DevsContextCore initialized")
-    return _core
+    core = _core
+    if core is None:
+        build = _build_core()
+        _install_core(build)
+        core = build[0]
+    return core
 
 
-@server.list_tools()  # type: ignore[no-untyped-call, untyped-decorator]
-async def list_tools() -> list[Tool]:
-    """List available MCP tools.
+def _build_core() -> _CoreBuild:
+    """Load the configuration and construct a DevsContextCore.
+
+    Reads no mutable module state and writes none, so it can run in a
+    worker thread while tool calls keep using the current core.
+
+    The core and config modules pull in every adapter, so they are
+    imported here rather than at module load to keep the stdio
+    handshake fast.
 
     Returns:
-        List of Tool definitions for get_task_context, search_context,
-        and get_standards.
+        Tuple of (core, config version, config path, config mtime).
     """
-    return [
-        Tool(
-            name="get_task_context",
-            description=(
-                "Use this when starting work on a Jira ticket. "
-                "Fetches and synthesizes everything you need: ticket requirements, "
-                "acceptance criteria, discussion comments, related meeting transcripts, "
-                "architecture docs, ADRs, and applicable coding standards. "
-                "Call this FIRST when the user says 'work on PROJ-123' or 'start TICKET-456'."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {
-                        "type": "string",
-                        "description": "Jira ticket ID (e.g., 'PROJ-123', 'TICKET-456')",
-                    },
-                    "refresh": {
-                        "type": "boolean",
-                        "description": "Force refresh, bypassing cache",
-                        "default": False,
-                    },
-                },
-                "required": ["task_id"],
-            },
+    from devscontext.config import find_config_file, load_devscontext_config
+    from devscontext.core import DevsContextCore
+
+    if _demo_mode:
+        return DevsContextCore(demo_mode=True), "demo", None, None
+
+    config_path = find_config_file()
+    config_mtime = _get_mtime(config_path)
+    config = load_devscontext_config(config_path)
+    return DevsContextCore(config), _hash_config(config), config_path, config_mtime
+
+
+def _install_core(build: _CoreBuild) -> DevsContextCore | None:
+    """Make a built core current, along with its config state.
+
+    Args:
+        build: Result of _build_core().
+
+    Returns:
+        The core it replaces, or None if there was none.
+    """
+    global _core, _config_version, _config_path, _config_mtime
+    previous = _core
+    _core, _config_version, _config_path, _config_mtime = build
+    logger.info("DevsContextCore initialized", extra={"config_version": _config_version})
+    return previous
+
+
+def _hash_config(config: DevsContextConfig) -> str:
+    """Compute a short, stable digest of a configuration.
+
+    Args:
+        config: The loaded configuration.
+
+    Returns:
+        16-character hex digest.
+    """
+    return hashlib.blake2b(config.model_dump_json().encode(), digest_size=8).hexdigest()
+
+
+def _get_mtime(path: Path | None) -> float | None:
+    """Get a file's modification time, or None if it is missing.
+
+    Args:
+        path: Path to stat.
+
+    Returns:
+        The mtime, or None if path is None or does not exist.
+    """
+    if path is None:
+        return None
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+async def _await_core_warmup() -> None:
+    """Wait for the background core construction started by run_server.
+
+    Every caller waits on the same task until it has finished, so no call
+    can reach get_core() on the event loop while the worker thread is still
+    building the core. The task is shielded so a cancelled tool call does
+    not cancel the build. Errors are not raised here; the following
+    get_core() call surfaces them.
+    """
+    task = _core_warmup
+    if task is None or task.done():
+        return
+
+    with contextlib.suppress(Exception):
+        await asyncio.shield(task)
+
+
+async def _reload_core_if_config_changed() -> None:
+    """Rebuild the core when the config file has changed on disk.
+
+    The file is checked at most once per CONFIG_CHECK_INTERVAL_SECONDS.
+    The replacement is built in a worker thread and swapped in under a
+    lock; the old core is closed once the calls and refreshes still using
+    it have finished. The new core gets a new config version, so responses
+    cached under the old configuration are never served again.
+
+    A config that fails to load is logged and the current core kept until
+    the file changes again.
+    """
+    global _config_checked_at, _config_mtime
+    if _demo_mode or _config_path is None:
+        return
+
+    now = time.monotonic()
+    if now - _config_checked_at < CONFIG_CHECK_INTERVAL_SECONDS:
+        return
+    _config_checked_at = now
+
+    async with _core_reload_lock:
+        mtime = _get_mtime(_config_path)
+        if mtime == _config_mtime:
+            return
+        try:
+            build = await asyncio.to_thread(_build_core)
+        except Exception as e:
+            _config_mtime = mtime
+            logger.warning(
+                "Configuration reload failed, keeping current core",
+                extra={"error": str(e)},
+            )
+            return
+        previous = _install_core(build)
+
+    logger.info("Configuration changed, core reloaded", extra={"config_version": _config_version})
+    if previous is not None:
+        await _retire_core(previous)
+
+
+def _acquire_core(core: DevsContextCore) -> None:
+    """Register a user of a core so a reload does not close it underneath.
+
+    Args:
+        core: The core about to be used.
+    """
+    _core_users[core] = _core_users.get(core, 0) + 1
+
+
+async def _release_core(core: DevsContextCore) -> None:
+    """Drop a user registered by _acquire_core, closing a drained retired core.
+
+    Args:
+        core: The core that is no longer used.
+    """
+    remaining = _core_users.pop(core) - 1
+    if remaining:
+        _core_users[core] = remaining
+    elif core in _retired_cores:
+        _retired_cores.discard(core)
+        await core.close()
+
+
+async def _retire_core(core: DevsContextCore) -> None:
+    """Close a replaced core now, or once its last user releases it.
+
+    Args:
+        core: The core that is no longer current.
+    """
+    if core in _core_users:
+        _retired_cores.add(core)
+    else:
+        await core.close()
+
+
+def _task_context_key(task_id: str) -> str:
+    """Build the SWR cache key for a task under the current config version.
+
+    Args:
+        task_id: The task identifier.
+
+    Returns:
+        Cache key string.
+    """
+    return f"{_config_version}:{task_id}"
+
+
+# Constant error responses, validated once and shared across calls
+_ERR_TASK_ID_REQUIRED = TextContent(type="text", text="Error: task_id is required")
+_ERR_QUERY_REQUIRED = TextContent(type="text", text="Error: query is required")
+
+
+def _text_response(*texts: str) -> list[TextContent]:
+    """Wrap response text in TextContent blocks.
+
+    Uses model_construct to skip pydantic validation: every field is
+    known to be valid here, and this runs on every tool call.
+
+    Args:
+        *texts: Text for each content block, in order.
+
+    Returns:
+        List with one TextContent per text.
+    """
+    return [TextContent.model_construct(type="text", text=text) for text in texts]
+
+
+# Response layouts, formatted with str.format_map
+_STALE_BANNER = (
+    "> **Warning:** fetching fresh context timed out; "
+    "this is the last cached version and may be out of date.\n\n"
+)
+_PENDING_TEMPLATE = (
+    "Context for {task_id} is still being built after {timeout:.0f}s. "
+    "It will be cached as soon as it is ready; call get_task_context again shortly."
+)
+_TIMEOUT_TEMPLATE = (
+    "Timed out fetching context for {task_id} after {timeout:.0f}s. "
+    "Raise cache.fetch_timeout_seconds if your sources are slow."
+)
+_SEARCH_TEMPLATE = (
+    '# Search Results for "{query}"\n\n'
+    "**Sources searched:** {sources}\n"
+    "**Results found:** {count}\n\n"
+    "---\n\n"
+    "{results}\n"
+)
+_STANDARDS_TEMPLATE = "# Coding Standards{area}\n\n{content}\n"
+
+# Tool definitions are immutable per process, so build them once at import.
+# They stay pydantic models rather than pre-serialized bytes: the SDK wraps
+# them in ListToolsResult and encodes the whole JSON-RPC envelope itself.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_task_context",
+        description=(
+            "Use this when starting work on a Jira ticket. "
+            "Fetches and synthesizes everything you need: ticket requirements, "
+            "acceptance criteria, discussion comments, related meeting transcripts, "
+            "architecture docs, ADRs, and applicable coding standards. "
+            "Call this FIRST when the user says 'work on PROJ-123' or 'start TICKET-456'."
         ),
-        Tool(
-            name="search_context",
-            description=(
-                "Use this for freeform questions about the codebase, architecture, "
-                "or past decisions. Searches across Jira tickets, meeting transcripts, "
-                "and documentation. Use when the user asks questions like "
-                "'how do we handle errors?', 'what was decided about webhooks?', "
-                "or 'why did we choose SQS?'. Input is a natural language question."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Natural language question or search terms",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {
+                    "type": "string",
+                    "description": "Jira ticket ID (e.g., 'PROJ-123', 'TICKET-456')",
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Force refresh, bypassing cache",
+                    "default": False,
                 },
-                "required": ["query"],
             },
+            "required": ["task_id"],
+        },
+    ),
+    Tool(
+        name="search_context",
+        description=(
+            "Use this for freeform questions about the codebase, architecture, "
+            "or past decisions. Searches across Jira tickets, meeting transcripts, "
+            "and documentation. Use when the user asks questions like "
+            "'how do we handle errors?', 'what was decided about webhooks?', "
+            "or 'why did we choose SQS?'. Input is a natural language question."
         ),
-        Tool(
-            name="get_standards",
-            description=(
-                "Use this when checking coding conventions before or during implementation. "
-                "Returns coding standards, style guides, and best practices from local docs. "
-                "Filter by area: 'testing', 'error-handling', 'typescript', 'api', etc. "
-                "Use when the user asks 'what are our testing conventions?' or "
-                "'how should I handle errors?' or before writing significant code."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "area": {
-                        "type": "string",
-                        "description": (
-                            "Filter by area: 'testing', 'typescript', 'error-handling', etc. "
-                            "Omit to get all standards."
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Natural language question or search terms",
                 },
             },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_standards",
+        description=(
+            "Use this when checking coding conventions before or during implementation. "
+            "Returns coding standards, style guides, and best practices from local docs. "
+            "Filter by area: 'testing', 'error-handling', 'typescript', 'api', etc. "
+            "Use when the user asks 'what are our testing conventions?' or "
+            "'how should I handle errors?' or before writing significant code."
         ),
-        Tool(
-            name="devscontext_status",
-            description=(
-                "Check DevsContext configuration, source connectivity, and health status. "
-                "Use this to verify your setup or debug connection issues."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "area": {
+                    "type": "string",
+                    "description": (
+                        "Filter by area: 'testing', 'typescript', 'error-handling', etc. "
+                        "Omit to get all standards."
+                    ),
+                },
             },
+        },
+    ),
+    Tool(
+        name="devscontext_status",
+        description=(
+            "Check DevsContext configuration, source connectivity, and health status. "
+            "Use this to verify your setup or debug connection issues."
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+]
+
+
+# Tool name -> {property: schema default (None if unset)}, applied to incoming
+# arguments once per call so handlers never need dict.get fallbacks
+_ARGUMENT_DEFAULTS: dict[str, dict[str, Any]] = {
+    tool.name: {prop: spec.get("default") for prop, spec in tool.inputSchema["properties"].items()}
+    for tool in _TOOLS
+}
+
+
+@server.list_tools()  # type: ignore[no-untyped-call, untyped-decorator]
+async def list_tools() -> list[Tool]:
+    """List available MCP tools.
+
+    Returns:
+        List of Tool definitions for get_task_context, search_context,
+        get_standards, and devscontext_status.
+    """
+    return _TOOLS
 
 
 @server.call_tool()  # type: ignore[untyped-decorator]
@@ -163,220 +438,444 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     Returns:
         List containing a single TextContent with the tool result.
     """
-    start_time = time.monotonic()
+    start_ns = time.perf_counter_ns()
+    # Interned names compare by identity against the _HANDLERS keys
+    name = sys.intern(name)
+    await _await_core_warmup()
+    await _reload_core_if_config_changed()
     core = get_core()
+    _acquire_core(core)
+    try:
+        return await _dispatch_tool(core, name, arguments, start_ns)
+    finally:
+        await _release_core(core)
 
-    logger.info(
-        "Tool call received",
-        extra={"tool": name, "arguments": arguments},
-    )
 
-    try:
-        if name == "get_task_context":
-            return await _handle_get_task_context(core, arguments, start_time)
+async def _dispatch_tool(
+    core: DevsContextCore,
+    name: str,
+    arguments: dict[str, Any],
+    start_ns: int,
+) -> list[TextContent]:
+    """Route a tool call to its handler.
 
-        elif name == "search_context":
-            return await _handle_search_context(core, arguments, start_time)
+    Args:
+        core: The DevsContextCore instance, held for the duration of the call.
+        name: The interned tool name.
+        arguments: The tool arguments as a dictionary.
+        start_ns: perf_counter_ns() when the request started, for duration logging.
 
-        elif name == "get_standards":
-            return await _handle_get_standards(core, arguments, start_time)
+    Returns:
+        The handler's response, or an error response.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        query = arguments.get("query")
+        logger.info(
+            "Tool call received",
+            extra={
+                "tool": name,
+                "arg_keys": list(arguments),
+                "task_id": arguments.get("task_id"),
+                "query_len": len(query) if isinstance(query, str) else None,
+            },
+        )
 
-        elif name == "devscontext_status":
-            return await _handle_devscontext_status(core, start_time)
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        logger.warning("Unknown tool called", extra={"tool": name})
+        return _text_response(f"Error: Unknown tool '{name}'")
 
-        else:
-            logger.warning("Unknown tool called", extra={"tool": name})
-            return [TextContent(type="text", text=f"Error: Unknown tool '{name}'")]
+    # Every schema property is present afterwards, so handlers index directly
+    arguments = {**_ARGUMENT_DEFAULTS[name], **arguments}
 
+    try:
+        return await handler(core, arguments, start_ns)
     except Exception as e:
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         logger.exception(
             "Tool call failed",
             extra={"tool": name, "error": str(e), "duration_ms": duration_ms},
         )
-        return [
-            TextContent(
-                type="text",
-                text=f"Error: An unexpected error occurred while processing '{name}': {e}",
-            )
-        ]
+        return _text_response(f"Error: An unexpected error occurred while processing '{name}': {e}")
 
 
 async def _handle_get_task_context(
     core: DevsContextCore,
     arguments: dict[str, Any],
-    start_time: float,
+    start_ns: int,
 ) -> list[TextContent]:
     """Handle the get_task_context tool call.
 
     Args:
         core: The DevsContextCore instance.
         arguments: Tool arguments.
-        start_time: When the request started for duration logging.
+        start_ns: perf_counter_ns() when the request started, for duration logging.
 
     Returns:
         List containing TextContent with the synthesized context.
     """
-    task_id = arguments.get("task_id", "")
-    refresh = arguments.get("refresh", False)
+    task_id = arguments["task_id"]
+    refresh = arguments["refresh"]
 
     if not task_id:
         logger.warning("get_task_context called without task_id")
-        return [TextContent(type="text", text="Error: task_id is required")]
+        return [_ERR_TASK_ID_REQUIRED]
 
     try:
-        result = await core.get_task_context(
-            task_id=task_id,
-            use_cache=not refresh,
-        )
+        cache_config = core.cache_config
+        cached = None if refresh else _get_cached_task_context(task_id, cache_config)
+        if cached is not None:
+            age, result = cached
+            if age > cache_config.ttl_seconds:
+                _schedule_task_context_refresh(core, task_id)
+        else:
+            fetch = _start_task_context_fetch(core, task_id, refresh=refresh)
+            timeout = cache_config.fetch_timeout_seconds
+            try:
+                # Shielded so the fetch keeps running, and still fills the
+                # cache, after this request stops waiting for it
+                result = await asyncio.wait_for(asyncio.shield(fetch), timeout=timeout)
+            except TimeoutError:
+                # Only a refresh can get here with a usable entry; the hard
+                # TTL still applies to what it falls back to
+                stale = _get_cached_task_context(task_id, cache_config)
+                logger.warning(
+                    "get_task_context timed out",
+                    extra={
+                        "task_id": task_id,
+                        "timeout_seconds": timeout,
+                        "serving_stale": stale is not None,
+                    },
+                )
+                if stale is not None:
+                    return _text_response(_STALE_BANNER + stale[1].synthesized)
+                if not cache_config.enabled:
+                    # Nowhere to keep the result, so don't leave it running
+                    fetch.cancel()
+                    return _text_response(
+                        _TIMEOUT_TEMPLATE.format(task_id=task_id, timeout=timeout)
+                    )
+                return _text_response(_PENDING_TEMPLATE.format(task_id=task_id, timeout=timeout))
+
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.info(
+                "get_task_context completed",
+                extra={
+                    "task_id": task_id,
+                    "source_count": len(result.sources_used),
+                    "cached": cached is not None or result.cached,
+                    "duration_ms": duration_ms,
+                },
+            )
 
-        duration_ms = int((time.monotonic() - start_time) * 1000)
-        logger.info(
-            "get_task_context completed",
-            extra={
-                "task_id": task_id,
-                "source_count": len(result.sources_used),
-                "cached": result.cached,
-                "duration_ms": duration_ms,
-            },
+        # Return the synthesized markdown, split at section headings when large
+        return _text_response(
+            *split_markdown_sections(result.synthesized, MCP_RESPONSE_CHUNK_CHARS)
         )
 
-        # Return the synthesized markdown directly
-        return [TextContent(type="text", text=result.synthesized)]
-
     except Exception as e:
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         logger.exception(
             "get_task_context failed",
             extra={"task_id": task_id, "error": str(e), "duration_ms": duration_ms},
         )
-        return [
-            TextContent(
-                type="text",
-                text=f"Error fetching context for {task_id}: {e}\n\n"
-                f"Please check that your Jira and Fireflies credentials are configured correctly.",
-            )
-        ]
+        return _text_response(
+            f"Error fetching context for {task_id}: {e}\n\n"
+            f"Please check that your Jira and Fireflies credentials are configured correctly."
+        )
+
+
+def _get_cached_task_context(
+    task_id: str,
+    cache_config: CacheConfig,
+) -> tuple[float, TaskContext] | None:
+    """Look up a task context in the stale-while-revalidate cache.
+
+    Entries older than cache_config.stale_ttl_seconds are dropped rather
+    than served.
+
+    Args:
+        task_id: The task identifier.
+        cache_config: Cache settings of the core serving the request.
+
+    Returns:
+        Tuple of (age in seconds, cached result), or None on a miss or
+        when caching is disabled.
+    """
+    if not cache_config.enabled:
+        return None
+
+    key = _task_context_key(task_id)
+    entry = _task_context_cache.get(key)
+    if entry is None:
+        return None
+
+    stored_at, result = entry
+    age = time.monotonic() - stored_at
+    if age > cache_config.stale_ttl_seconds:
+        del _task_context_cache[key]
+        return None
+    _task_context_cache.move_to_end(key)
+    return age, result
+
+
+def _store_task_context(key: str, result: TaskContext) -> None:
+    """Store a task context, evicting the least recently used entry when full.
+
+    Args:
+        key: Cache key from _task_context_key().
+        result: The context to cache.
+    """
+    _task_context_cache[key] = (time.monotonic(), result)
+    _task_context_cache.move_to_end(key)
+    if len(_task_context_cache) > TASK_CONTEXT_CACHE_MAX_SIZE:
+        evicted, _ = _task_context_cache.popitem(last=False)
+        logger.debug(
+            "Task context evicted from cache",
+            extra={"key": evicted, "size": len(_task_context_cache)},
+        )
+
+
+async def _fetch_task_context(
+    core: DevsContextCore,
+    task_id: str,
+    refresh: bool = False,
+    use_prebuilt: bool | None = None,
+) -> TaskContext:
+    """Fetch a task context from the core and store it in the SWR cache.
+
+    A per-task lock ensures concurrent requests for the same task share
+    one fetch instead of all hitting the sources at once. Nothing is
+    stored when caching is disabled.
+
+    Args:
+        core: The DevsContextCore instance.
+        task_id: The task identifier.
+        refresh: If True, bypass both the SWR cache and the core cache.
+        use_prebuilt: Passed to the core; defaults to not refresh.
+
+    Returns:
+        The fetched TaskContext.
+    """
+    cache_config = core.cache_config
+    if not cache_config.enabled:
+        return await core.get_task_context(
+            task_id=task_id, use_cache=not refresh, use_prebuilt=use_prebuilt
+        )
+
+    lock = _task_context_locks.get(task_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _task_context_locks[task_id] = lock
+
+    async with lock:
+        if not refresh:
+            cached = _get_cached_task_context(task_id, cache_config)
+            if cached is not None:
+                return cached[1]
+
+        key = _task_context_key(task_id)
+        result = await core.get_task_context(
+            task_id=task_id, use_cache=not refresh, use_prebuilt=use_prebuilt
+        )
+        _store_task_context(key, result)
+        return result
+
+
+async def _run_task_context_fetch(
+    core: DevsContextCore,
+    task_id: str,
+    refresh: bool,
+    use_prebuilt: bool | None,
+) -> TaskContext:
+    """Run _fetch_task_context, then release the core held for it.
+
+    Args:
+        core: The DevsContextCore instance, acquired by _start_task_context_fetch.
+        task_id: The task identifier.
+        refresh: Passed to _fetch_task_context.
+        use_prebuilt: Passed to _fetch_task_context.
+
+    Returns:
+        The fetched TaskContext.
+    """
+    try:
+        return await _fetch_task_context(core, task_id, refresh=refresh, use_prebuilt=use_prebuilt)
+    finally:
+        await _release_core(core)
+
+
+def _start_task_context_fetch(
+    core: DevsContextCore,
+    task_id: str,
+    refresh: bool = False,
+    use_prebuilt: bool | None = None,
+) -> asyncio.Task[TaskContext]:
+    """Start a task context fetch that can outlive the request awaiting it.
+
+    The fetch stores its result in the SWR cache when it finishes, so a
+    request that gives up waiting still warms the cache for the next one.
+    The core is kept open until the fetch is done.
+
+    Args:
+        core: The DevsContextCore instance.
+        task_id: The task identifier.
+        refresh: Passed to _fetch_task_context.
+        use_prebuilt: Passed to _fetch_task_context.
+
+    Returns:
+        The running fetch task.
+    """
+    _acquire_core(core)
+    task = asyncio.create_task(_run_task_context_fetch(core, task_id, refresh, use_prebuilt))
+    _fetch_tasks.add(task)
+    task.add_done_callback(lambda done: _finish_task_context_fetch(task_id, done))
+    return task
+
+
+def _finish_task_context_fetch(task_id: str, task: asyncio.Task[TaskContext]) -> None:
+    """Drop a finished fetch and log its failure, which may have no awaiter left.
+
+    Args:
+        task_id: The task identifier.
+        task: The finished fetch task.
+    """
+    _fetch_tasks.discard(task)
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.warning(
+            "Task context fetch failed",
+            extra={"task_id": task_id, "error": str(error)},
+        )
+
+
+def _schedule_task_context_refresh(core: DevsContextCore, task_id: str) -> None:
+    """Start a background refresh unless one is already running for the task.
+
+    The refresh bypasses the core's in-memory cache, which would only hand
+    back the same stale result, but still serves pre-built context.
+
+    Args:
+        core: The DevsContextCore instance.
+        task_id: The task identifier.
+    """
+    if task_id in _refresh_tasks:
+        return
+
+    task = _start_task_context_fetch(core, task_id, refresh=True, use_prebuilt=True)
+    _refresh_tasks[task_id] = task
+    task.add_done_callback(lambda _: _refresh_tasks.pop(task_id, None))
 
 
 async def _handle_search_context(
     core: DevsContextCore,
     arguments: dict[str, Any],
-    start_time: float,
+    start_ns: int,
 ) -> list[TextContent]:
     """Handle the search_context tool call.
 
     Args:
         core: The DevsContextCore instance.
         arguments: Tool arguments.
-        start_time: When the request started for duration logging.
+        start_ns: perf_counter_ns() when the request started, for duration logging.
 
     Returns:
         List containing TextContent with search results.
     """
-    query = arguments.get("query", "")
+    query = arguments["query"]
 
     if not query:
         logger.warning("search_context called without query")
-        return [TextContent(type="text", text="Error: query is required")]
+        return [_ERR_QUERY_REQUIRED]
 
     try:
         result = await core.search_context(query=query)
 
-        duration_ms = int((time.monotonic() - start_time) * 1000)
-        logger.info(
-            "search_context completed",
-            extra={
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.info(
+                "search_context completed",
+                extra={
+                    "query": query,
+                    "result_count": result["result_count"],
+                    "duration_ms": duration_ms,
+                },
+            )
+
+        response_text = _SEARCH_TEMPLATE.format_map(
+            {
                 "query": query,
-                "result_count": result["result_count"],
-                "duration_ms": duration_ms,
-            },
+                "sources": ", ".join(result["sources"]),
+                "count": result["result_count"],
+                "results": result["results"],
+            }
         )
-
-        sources = result.get("sources", [])
-        sources_str = ", ".join(sources) if isinstance(sources, list) else str(sources)
-
-        response_text = f"""# Search Results for "{query}"
-
-**Sources searched:** {sources_str}
-**Results found:** {result["result_count"]}
-
----
-
-{result["results"]}
-"""
-        return [TextContent(type="text", text=response_text)]
+        return _text_response(response_text)
 
     except Exception as e:
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         logger.exception(
             "search_context failed",
             extra={"query": query, "error": str(e), "duration_ms": duration_ms},
         )
-        return [
-            TextContent(
-                type="text",
-                text=f"Error searching for '{query}': {e}",
-            )
-        ]
+        return _text_response(f"Error searching for '{query}': {e}")
 
 
 async def _handle_get_standards(
     core: DevsContextCore,
     arguments: dict[str, Any],
-    start_time: float,
+    start_ns: int,
 ) -> list[TextContent]:
     """Handle the get_standards tool call.
 
     Args:
         core: The DevsContextCore instance.
         arguments: Tool arguments.
-        start_time: When the request started for duration logging.
+        start_ns: perf_counter_ns() when the request started, for duration logging.
 
     Returns:
         List containing TextContent with standards content.
     """
-    area = arguments.get("area")
+    area = arguments["area"]
 
     try:
         result = await core.get_standards(area=area)
 
-        duration_ms = int((time.monotonic() - start_time) * 1000)
-        logger.info(
-            "get_standards completed",
-            extra={"area": area, "duration_ms": duration_ms},
-        )
-
-        area_text = f" ({area})" if area else ""
-        response_text = f"""# Coding Standards{area_text}
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.info(
+                "get_standards completed",
+                extra={"area": area, "duration_ms": duration_ms},
+            )
 
-{result["content"]}
-"""
-        return [TextContent(type="text", text=response_text)]
+        response_text = _STANDARDS_TEMPLATE.format_map(
+            {"area": f" ({area})" if area else "", "content": result["content"]}
+        )
+        return _text_response(response_text)
 
     except Exception as e:
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         logger.exception(
             "get_standards failed",
             extra={"area": area, "error": str(e), "duration_ms": duration_ms},
         )
-        return [
-            TextContent(
-                type="text",
-                text=f"Error fetching standards: {e}",
-            )
-        ]
+        return _text_response(f"Error fetching standards: {e}")
 
 
 async def _handle_devscontext_status(
     core: DevsContextCore,
-    start_time: float,
+    arguments: dict[str, Any],
+    start_ns: int,
 ) -> list[TextContent]:
     """Handle the devscontext_status tool call.
 
     Args:
         core: The DevsContextCore instance.
-        start_time: When the request started for duration logging.
+        arguments: Tool arguments (unused; the tool takes none).
+        start_ns: perf_counter_ns() when the request started, for duration logging.
 
     Returns:
         List containing TextContent with status report.
@@ -384,40 +883,60 @@ async def _handle_devscontext_status(
     try:
         status = await core.get_status()
 
-        duration_ms = int((time.monotonic() - start_time) * 1000)
-        logger.info(
-            "devscontext_status completed",
-            extra={"duration_ms": duration_ms},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.info(
+                "devscontext_status completed",
+                extra={"duration_ms": duration_ms},
+            )
 
-        return [TextContent(type="text", text=status)]
+        return _text_response(status)
 
     except Exception as e:
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         logger.exception(
             "devscontext_status failed",
             extra={"error": str(e), "duration_ms": duration_ms},
         )
-        return [
-            TextContent(
-                type="text",
-                text=f"Error checking status: {e}",
-            )
-        ]
+        return _text_response(f"Error checking status: {e}")
+
+
+# Tool name -> handler, looked up once per call instead of an if/elif chain
+_HANDLERS: dict[str, ToolHandler] = {
+    "get_task_context": _handle_get_task_context,
+    "search_context": _handle_search_context,
+    "get_standards": _handle_get_standards,
+    "devscontext_status": _handle_devscontext_status,
+}
 
 
 async def run_server() -> None:
     """Run the MCP server over stdio transport.
 
     Sets up the stdio transport and runs the server until interrupted.
+    The core (config loading, plugin discovery, adapter construction) is
+    built in a worker thread so the stdio handshake does not wait for it.
+    In-flight fetches are cancelled and the core is closed on exit so
+    pooled connections are released.
     """
+    global _core_warmup
     logger.info("Starting MCP server")
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    _core_warmup = asyncio.create_task(asyncio.to_thread(get_core))
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        # Stop fetches left running by timed-out requests before their core closes
+        for task in _fetch_tasks:
+            task.cancel()
+        await asyncio.gather(*_fetch_tasks, return_exceptions=True)
+        # Release pooled HTTP connections held by adapters and synthesis
+        for core in (*_retired_cores, *([_core] if _core is not None else [])):
+            await core.close()
 
 
 def main(demo_mode: bool = False) -> None:
@@ -426,11 +945,22 @@ def main(demo_mode: bool = False) -> None:
     Args:
         demo_mode: If True, use sample data instead of real adapters.
 
-    Configures logging and runs the async server.
+    Configures logging and runs the async server, on uvloop when it is
+    installed.
     """
-    global _demo_mode
+    global _demo_mode, _core
     _demo_mode = demo_mode
-    asyncio.run(run_server())
+    _core = None
+
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_server())
+        return
+
+    # Optional: libuv-backed loop for faster stdio handling (pip install devscontext[uvloop])
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(run_server())
 
 
 if __name__ == "__main__":
@@ -4,7 +4,8 @@ This module provides persistent storage for pre-built context that has been
 processed by the background agent. The MCP server can then retrieve this
 context instantly instead of fetching on-demand.
 
-Uses aiosqlite for async SQLite access.
+Uses aiosqlite for writes and a plain sqlite3 connection, driven through
+asyncio.to_thread, for reads.
 
 Example:
     storage = PrebuiltContextStorage(".devscontext/cache.db")
@@ -24,7 +25,11 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import json
+import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -34,8 +39,141 @@ import aiosqlite
 from devscontext.logging import get_logger
 from devscontext.models import PrebuiltContext
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row without
+# firing delete triggers, which would leave the FTS index out of sync
+_INSERT_SQL = """
+    INSERT INTO prebuilt_context
+    (task_id, synthesized, sources_used, context_quality_score,
+     gaps, built_at, expires_at, source_data_hash, gaps_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(task_id) DO UPDATE SET
+        synthesized = excluded.synthesized,
+        sources_used = excluded.sources_used,
+        context_quality_score = excluded.context_quality_score,
+        gaps = excluded.gaps,
+        built_at = excluded.built_at,
+        expires_at = excluded.expires_at,
+        source_data_hash = excluded.source_data_hash,
+        gaps_count = excluded.gaps_count
+"""
+
+_SELECT_SQL = """
+    SELECT task_id, synthesized, sources_used, context_quality_score,
+           gaps, built_at, expires_at, source_data_hash
+    FROM prebuilt_context
+    WHERE task_id = ?
+"""
+
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS prebuilt_context (
+        task_id TEXT PRIMARY KEY,
+        synthesized TEXT NOT NULL,
+        sources_used TEXT NOT NULL,
+        context_quality_score REAL NOT NULL,
+        gaps TEXT NOT NULL,
+        built_at INTEGER NOT NULL,
+        expires_at INTEGER NOT NULL,
+        source_data_hash TEXT NOT NULL,
+        gaps_count INTEGER NOT NULL DEFAULT 0
+    )
+"""
+
+# Full-text index over synthesized markdown, kept in sync by triggers
+_CREATE_FTS_SQL: tuple[str, ...] = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS prebuilt_fts USING fts5(
+        synthesized,
+        content='prebuilt_context',
+        content_rowid='rowid',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS prebuilt_fts_insert AFTER INSERT ON prebuilt_context BEGIN
+        INSERT INTO prebuilt_fts(rowid, synthesized) VALUES (new.rowid, new.synthesized);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS prebuilt_fts_delete AFTER DELETE ON prebuilt_context BEGIN
+        INSERT INTO prebuilt_fts(prebuilt_fts, rowid, synthesized)
+        VALUES ('delete', old.rowid, old.synthesized);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS prebuilt_fts_update AFTER UPDATE ON prebuilt_context BEGIN
+        INSERT INTO prebuilt_fts(prebuilt_fts, rowid, synthesized)
+        VALUES ('delete', old.rowid, old.synthesized);
+        INSERT INTO prebuilt_fts(rowid, synthesized) VALUES (new.rowid, new.synthesized);
+    END
+    """,
+)
+
+# Range scans for expiry sweeps and stats; covering index so is_stale
+# never touches the synthesized blob
+_CREATE_INDEX_SQL: tuple[str, ...] = (
+    "CREATE INDEX IF NOT EXISTS idx_prebuilt_expires ON prebuilt_context(expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_prebuilt_staleness "
+    "ON prebuilt_context(task_id, source_data_hash, expires_at)",
+)
+
+# What initialize() has to create or migrate: table present, built_at type,
+# gaps_count present, full-text index present
+_SCHEMA_STATE_SQL = """
+    SELECT
+        EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'prebuilt_context'),
+        (SELECT type FROM pragma_table_info('prebuilt_context') WHERE name = 'built_at'),
+        EXISTS(SELECT 1 FROM pragma_table_info('prebuilt_context') WHERE name = 'gaps_count'),
+        EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'prebuilt_fts')
+"""
+
+_SEARCH_SQL = """
+    SELECT prebuilt_context.task_id
+    FROM prebuilt_fts
+    JOIN prebuilt_context ON prebuilt_context.rowid = prebuilt_fts.rowid
+    WHERE prebuilt_fts MATCH ?
+    ORDER BY rank
+    LIMIT ?
+"""
+
+# Copies rows from a pre-migration table, converting ISO-8601 TEXT timestamps
+# to integer microseconds since the epoch and computing gaps_count
+_MIGRATE_ROWS_SQL = """
+    INSERT INTO prebuilt_context
+    (task_id, synthesized, sources_used, context_quality_score,
+     gaps, built_at, expires_at, source_data_hash, gaps_count)
+    SELECT task_id, synthesized, sources_used, context_quality_score, gaps,
+           CAST(ROUND((julianday(built_at) - 2440587.5) * 86400000000) AS INTEGER),
+           CAST(ROUND((julianday(expires_at) - 2440587.5) * 86400000000) AS INTEGER),
+           source_data_hash, json_array_length(gaps)
+    FROM prebuilt_context_old
+"""
+
+# Connection settings: WAL lets reads proceed while the agent writes, and
+# synchronous=NORMAL drops the second fsync per commit (safe under WAL).
+# auto_vacuum only takes effect if set before the first table is created.
+_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# delete_expired reclaims free pages once a sweep removes more rows than this
+_VACUUM_DELETE_THRESHOLD = 50
+_VACUUM_PAGES = 100
+
+# Decoded contexts kept in memory by get(), most recently used last
+_MEMORY_CACHE_SIZE = 128
+
 
 class PrebuiltContextStorage:
     """SQLite storage for pre-built context.
@@ -49,9 +187,10 @@ class PrebuiltContextStorage:
         - sources_used: TEXT (JSON array)
         - context_quality_score: REAL (0-1)
         - gaps: TEXT (JSON array)
-        - built_at: TEXT (ISO timestamp)
-        - expires_at: TEXT (ISO timestamp)
+        - built_at: INTEGER (microseconds since the epoch, UTC)
+        - expires_at: INTEGER (microseconds since the epoch, UTC)
         - source_data_hash: TEXT (for staleness detection)
+        - gaps_count: INTEGER (len(gaps), so listings skip decoding gaps)
     """
 
     def __init__(self, db_path: str = ".devscontext/cache.db") -> None:
@@ -62,71 +201,125 @@ class PrebuiltContextStorage:
         """
         self._db_path = Path(db_path)
         self._conn: aiosqlite.Connection | None = None
+        # Plain sqlite3 connection for reads, run via asyncio.to_thread to skip
+        # aiosqlite's single-thread request queue on the get() hot path
+        self._read_conn: sqlite3.Connection | None = None
+        # Serializes use of the read connection across worker threads
+        self._read_lock = threading.Lock()
+        # get() results, valid while the database's data_version is unchanged;
+        # only touched by worker threads holding _read_lock
+        self._mem_cache: OrderedDict[str, PrebuiltContext] = OrderedDict()
+        self._mem_cache_version: int | None = None
 
     async def initialize(self) -> None:
         """Create database and table if needed.
 
-        Creates the parent directory if it doesn't exist.
+        Creates the parent directory if it doesn't exist. All schema work
+        (table, migration, full-text index, indexes) runs as one script in
+        a single transaction.
         """
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = await aiosqlite.connect(self._db_path)
+        await self._conn.executescript(";\n".join(_PRAGMAS) + ";")
 
-        await self._conn.execute("""
-            CREATE TABLE IF NOT EXISTS prebuilt_context (
-                task_id TEXT PRIMARY KEY,
-                synthesized TEXT NOT NULL,
-                sources_used TEXT NOT NULL,
-                context_quality_score REAL NOT NULL,
-                gaps TEXT NOT NULL,
-                built_at TEXT NOT NULL,
-                expires_at TEXT NOT NULL,
-                source_data_hash TEXT NOT NULL
-            )
-        """)
-        await self._conn.commit()
+        statements = await self._schema_statements()
+        await self._conn.executescript("BEGIN;\n" + ";\n".join(statements) + ";\nCOMMIT;")
+
+        self._read_conn = sqlite3.connect(self._db_path, check_same_thread=False)
 
         logger.info(
             "Storage initialized",
             extra={"db_path": str(self._db_path)},
         )
 
+    async def _schema_statements(self) -> list[str]:
+        """Build the DDL needed to bring the database to the current schema.
+
+        Older databases stored timestamps as ISO-8601 TEXT and had no
+        gaps_count column. The declared column types matter (TEXT affinity
+        would turn integers back into strings), so those tables are rebuilt
+        by copying rows into a freshly created table rather than updated in
+        place. The full-text index is populated from existing rows when it
+        is new or the table was rebuilt.
+
+        Returns:
+            SQL statements to run in order.
+        """
+        assert self._conn is not None
+        cursor = await self._conn.execute(_SCHEMA_STATE_SQL)
+        row = await cursor.fetchone()
+        assert row is not None
+        table_exists, built_at_type, has_gaps_count, fts_exists = row
+
+        statements: list[str] = []
+        migrate = bool(table_exists) and not (built_at_type == "INTEGER" and has_gaps_count)
+        if migrate:
+            statements.append("ALTER TABLE prebuilt_context RENAME TO prebuilt_context_old")
+            statements.append(_CREATE_TABLE_SQL)
+            statements.append(_MIGRATE_ROWS_SQL)
+            statements.append("DROP TABLE prebuilt_context_old")
+            logger.info("Migrating storage schema", extra={"db_path": str(self._db_path)})
+        else:
+            statements.append(_CREATE_TABLE_SQL)
+
+        statements.extend(_CREATE_FTS_SQL)
+        if migrate or not fts_exists:
+            statements.append("INSERT INTO prebuilt_fts(prebuilt_fts) VALUES ('rebuild')")
+        statements.extend(_CREATE_INDEX_SQL)
+        return statements
+
     async def store(self, context: PrebuiltContext) -> None:
         """Store pre-built context, replacing if exists.
 
         Args:
             context: PrebuiltContext to store.
         """
+        await self.store_many([context])
+
+    async def store_many(self, contexts: list[PrebuiltContext]) -> None:
+        """Store several pre-built contexts in a single transaction.
+
+        Existing entries with the same task_id are replaced. All rows are
+        committed together, so a bulk prebuild pays for one commit rather
+        than one per ticket.
+
+        Args:
+            contexts: PrebuiltContexts to store.
+        """
         if self._conn is None:
             raise RuntimeError("Storage not initialized. Call initialize() first.")
 
-        await self._conn.execute(
-            """
-            INSERT OR REPLACE INTO prebuilt_context
-            (task_id, synthesized, sources_used, context_quality_score,
-             gaps, built_at, expires_at, source_data_hash)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                context.task_id,
-                context.synthesized,
-                json.dumps(context.sources_used),
-                context.context_quality_score,
-                json.dumps(context.gaps),
-                context.built_at.isoformat(),
-                context.expires_at.isoformat(),
-                context.source_data_hash,
-            ),
+        if not contexts:
+            return
+
+        await self._conn.executemany(
+            _INSERT_SQL,
+            [
+                (
+                    context.task_id,
+                    context.synthesized,
+                    _dumps_list(context.sources_used),
+                    context.context_quality_score,
+                    _dumps_list(context.gaps),
+                    _to_micros(context.built_at),
+                    _to_micros(context.expires_at),
+                    context.source_data_hash,
+                    len(context.gaps),
+                )
+                for context in contexts
+            ],
         )
         await self._conn.commit()
 
-        logger.info(
-            "Stored pre-built context",
-            extra={
-                "task_id": context.task_id,
-                "quality_score": context.context_quality_score,
-                "gaps_count": len(context.gaps),
-            },
-        )
+        for context in contexts:
+            logger.info(
+                "Stored pre-built context",
+                extra={
+                    "task_id": context.task_id,
+                    "quality_score": context.context_quality_score,
+                    "gaps_count": len(context.gaps),
+                },
+            )
 
     async def get(self, task_id: str) -> PrebuiltContext | None:
         """Get pre-built context if exists.
@@ -134,40 +327,89 @@ class PrebuiltContextStorage:
         Note: This returns the context even if expired. Use is_expired()
         to check if it should be refreshed.
 
+        Repeat lookups are served from an in-memory LRU. It is dropped
+        whenever SQLite's data_version changes, i.e. after any commit by
+        this process or another one (such as the background agent).
+
         Args:
             task_id: Task identifier to retrieve.
 
         Returns:
             PrebuiltContext if found, None otherwise.
         """
-        if self._conn is None:
-            raise RuntimeError("Storage not initialized. Call initialize() first.")
+        conn = self._require_read_conn()
+        return await asyncio.to_thread(self._get_sync, conn, task_id)
 
-        cursor = await self._conn.execute(
-            """
-            SELECT task_id, synthesized, sources_used, context_quality_score,
-                   gaps, built_at, expires_at, source_data_hash
-            FROM prebuilt_context
-            WHERE task_id = ?
-            """,
-            (task_id,),
-        )
-        row = await cursor.fetchone()
+    def _get_sync(self, conn: sqlite3.Connection, task_id: str) -> PrebuiltContext | None:
+        """Body of get(), run in a worker thread.
 
-        if row is None:
-            return None
+        The version check, memory cache and row read happen under one hold
+        of the read lock, so they see a consistent database state.
 
+        Args:
+            conn: The sqlite3 read connection.
+            task_id: Task identifier to retrieve.
+
+        Returns:
+            PrebuiltContext if found, None otherwise.
+        """
+        with self._read_lock:
+            # Cheap pragma; answered from the pager without touching any table
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._mem_cache_version:
+                self._mem_cache.clear()
+                self._mem_cache_version = version
+            else:
+                cached = self._mem_cache.get(task_id)
+                if cached is not None:
+                    self._mem_cache.move_to_end(task_id)
+                    return cached
+
+            row = conn.execute(_SELECT_SQL, (task_id,)).fetchone()
+            if row is None:
+                return None
+
+            context = self._row_to_context(row)
+            self._mem_cache[task_id] = context
+            if len(self._mem_cache) > _MEMORY_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+            return context
+
+    @staticmethod
+    def _row_to_context(row: tuple[Any, ...]) -> PrebuiltContext:
+        """Build a PrebuiltContext from a _SELECT_SQL row."""
         return PrebuiltContext(
             task_id=row[0],
             synthesized=row[1],
-            sources_used=json.loads(row[2]),
+            sources_used=_loads_list(row[2]),
             context_quality_score=row[3],
-            gaps=json.loads(row[4]),
-            built_at=datetime.fromisoformat(row[5]),
-            expires_at=datetime.fromisoformat(row[6]),
+            gaps=_loads_list(row[4]),
+            built_at=_from_micros(row[5]),
+            expires_at=_from_micros(row[6]),
             source_data_hash=row[7],
         )
 
+    async def search(self, query: str, limit: int = 10) -> list[str]:
+        """Full-text search over synthesized context.
+
+        Each whitespace-separated term is matched as a quoted token, so
+        user input cannot inject FTS5 query syntax. Results are ranked by
+        BM25 relevance.
+
+        Args:
+            query: Search terms.
+            limit: Maximum number of task IDs to return.
+
+        Returns:
+            Matching task IDs, best match first.
+        """
+        terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+        if not terms:
+            return []
+
+        rows = await self._fetchall(_SEARCH_SQL, (" ".join(terms), limit))
+        return [row[0] for row in rows]
+
     async def is_stale(self, task_id: str, current_hash: str) -> bool:
         """Check if stored context is stale.
 
@@ -180,14 +422,10 @@ class PrebuiltContextStorage:
         Returns:
             True if stale or not found, False if fresh.
         """
-        if self._conn is None:
-            raise RuntimeError("Storage not initialized. Call initialize() first.")
-
-        cursor = await self._conn.execute(
+        row = await self._fetchone(
             "SELECT source_data_hash FROM prebuilt_context WHERE task_id = ?",
             (task_id,),
         )
-        row = await cursor.fetchone()
 
         if row is None:
             return True  # Not found = stale
@@ -227,7 +465,7 @@ class PrebuiltContextStorage:
         if self._conn is None:
             raise RuntimeError("Storage not initialized. Call initialize() first.")
 
-        now = datetime.now(UTC).isoformat()
+        now = _to_micros(datetime.now(UTC))
         cursor = await self._conn.execute(
             "DELETE FROM prebuilt_context WHERE expires_at < ?",
             (now,),
@@ -238,33 +476,44 @@ class PrebuiltContextStorage:
         if count > 0:
             logger.info("Deleted expired contexts", extra={"count": count})
 
+        if count > _VACUUM_DELETE_THRESHOLD:
+            # executescript steps the pragma to completion; execute() would
+            # free only one page
+            await self._conn.executescript(f"PRAGMA incremental_vacuum({_VACUUM_PAGES});")
+
         return count
 
+    async def optimize(self) -> None:
+        """Let SQLite refresh query planner statistics where they are stale.
+
+        Cheap when nothing changed; intended to be called before closing.
+        """
+        if self._conn is None:
+            raise RuntimeError("Storage not initialized. Call initialize() first.")
+
+        await self._conn.execute("PRAGMA optimize")
+
     async def list_all(self) -> list[dict[str, Any]]:
         """List all stored contexts (summary only).
 
         Returns:
             List of dicts with task_id, quality_score, built_at, expires_at.
         """
-        if self._conn is None:
-            raise RuntimeError("Storage not initialized. Call initialize() first.")
-
-        cursor = await self._conn.execute(
+        rows = await self._fetchall(
             """
-            SELECT task_id, context_quality_score, built_at, expires_at, gaps
+            SELECT task_id, context_quality_score, built_at, expires_at, gaps_count
             FROM prebuilt_context
             ORDER BY built_at DESC
             """
         )
-        rows = await cursor.fetchall()
 
         return [
             {
                 "task_id": row[0],
                 "quality_score": row[1],
-                "built_at": row[2],
-                "expires_at": row[3],
-                "gaps_count": len(json.loads(row[4])),
+                "built_at": _from_micros(row[2]).isoformat(),
+                "expires_at": _from_micros(row[3]).isoformat(),
+                "gaps_count": row[4],
             }
             for row in rows
         ]
@@ -275,35 +524,20 @@ class PrebuiltContextStorage:
         Returns:
             Dict with total, active, expired counts and average quality.
         """
-        if self._conn is None:
-            raise RuntimeError("Storage not initialized. Call initialize() first.")
-
-        now = datetime.now(UTC).isoformat()
+        now = _to_micros(datetime.now(UTC))
 
-        # Total count
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM prebuilt_context")
-        total_row = await cursor.fetchone()
-        total: int = total_row[0] if total_row else 0
-
-        # Active (not expired) count
-        cursor = await self._conn.execute(
-            "SELECT COUNT(*) FROM prebuilt_context WHERE expires_at >= ?",
+        row = await self._fetchone(
+            """
+            SELECT COUNT(*),
+                   COALESCE(SUM(expires_at >= ?), 0),
+                   COALESCE(AVG(context_quality_score), 0.0),
+                   MAX(built_at)
+            FROM prebuilt_context
+            """,
             (now,),
         )
-        active_row = await cursor.fetchone()
-        active: int = active_row[0] if active_row else 0
-
-        # Average quality score
-        cursor = await self._conn.execute("SELECT AVG(context_quality_score) FROM prebuilt_context")
-        avg_quality_row = await cursor.fetchone()
-        avg_quality: float = (
-            avg_quality_row[0] if avg_quality_row and avg_quality_row[0] is not None else 0.0
-        )
-
-        # Last build time
-        cursor = await self._conn.execute("SELECT MAX(built_at) FROM prebuilt_context")
-        last_build_row = await cursor.fetchone()
-        last_build: str | None = last_build_row[0] if last_build_row and last_build_row[0] else None
+        total, active, avg_quality, last_build_us = row if row else (0, 0, 0.0, None)
+        last_build = _from_micros(last_build_us).isoformat() if last_build_us is not None else None
 
         return {
             "total": total,
@@ -313,9 +547,121 @@ class PrebuiltContextStorage:
             "last_build": last_build,
         }
 
+    async def _fetchone(self, sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+        """Run a read query on the sqlite3 read connection in a worker thread.
+
+        Args:
+            sql: SQL query.
+            params: Query parameters.
+
+        Returns:
+            The first row, or None if there are no rows.
+        """
+        conn = self._require_read_conn()
+
+        def fetch() -> tuple[Any, ...] | None:
+            with self._read_lock:
+                row: tuple[Any, ...] | None = conn.execute(sql, params).fetchone()
+                return row
+
+        return await asyncio.to_thread(fetch)
+
+    async def _fetchall(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a read query on the sqlite3 read connection in a worker thread.
+
+        Args:
+            sql: SQL query.
+            params: Query parameters.
+
+        Returns:
+            All result rows.
+        """
+        conn = self._require_read_conn()
+
+        def fetch() -> list[tuple[Any, ...]]:
+            with self._read_lock:
+                rows: list[tuple[Any, ...]] = conn.execute(sql, params).fetchall()
+                return rows
+
+        return await asyncio.to_thread(fetch)
+
+    def _require_read_conn(self) -> sqlite3.Connection:
+        """Get the read connection, raising if storage is not initialized.
+
+        Returns:
+            The sqlite3 read connection.
+
+        Raises:
+            RuntimeError: If initialize() has not been called.
+        """
+        if self._read_conn is None:
+            raise RuntimeError("Storage not initialized. Call initialize() first.")
+        return self._read_conn
+
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connections."""
+        # Waits for any in-flight read in a worker thread to finish
+        with self._read_lock:
+            self._mem_cache.clear()
+            self._mem_cache_version = None
+            if self._read_conn is not None:
+                self._read_conn.close()
+                self._read_conn = None
         if self._conn is not None:
             await self._conn.close()
             self._conn = None
             logger.debug("Storage connection closed")
+
+
+def _to_micros(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch.
+
+    Args:
+        dt: Timezone-aware datetime.
+
+    Returns:
+        Microseconds since 1970-01-01T00:00:00Z.
+    """
+    return round(dt.timestamp() * 1_000_000)
+
+
+def _from_micros(micros: int) -> datetime:
+    """Convert integer microseconds since the epoch to a UTC datetime.
+
+    Args:
+        micros: Microseconds since 1970-01-01T00:00:00Z.
+
+    Returns:
+        Timezone-aware UTC datetime.
+    """
+    return datetime.fromtimestamp(micros / 1_000_000, UTC)
+
+
+def _dumps_list(values: list[str]) -> str:
+    """Serialize a list column, using orjson when it is installed.
+
+    Args:
+        values: List of strings to store.
+
+    Returns:
+        JSON array text.
+    """
+    if orjson is not None:
+        return orjson.dumps(values).decode()
+    return json.dumps(values)
+
+
+def _loads_list(raw: str) -> list[str]:
+    """Parse a list column, using orjson when it is installed.
+
+    Args:
+        raw: JSON array text.
+
+    Returns:
+        The decoded list.
+    """
+    if orjson is not None:
+        values: list[str] = orjson.loads(raw)
+        return values
+    values = json.loads(raw)
+    return values
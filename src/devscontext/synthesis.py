@@ -22,25 +22,43 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import json
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import UTC, datetime
+from string import Formatter
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import httpx
 
-from devscontext.constants import DEFAULT_HTTP_TIMEOUT_SECONDS
+from devscontext.constants import (
+    DEFAULT_HTTP_TIMEOUT_SECONDS,
+    LLM_BATCH_CONCURRENCY,
+    LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_SDK_TIMEOUT_SECONDS,
+    SYNTHESIS_PROMPT_CACHE_SIZE,
+)
 from devscontext.logging import get_logger
-from devscontext.models import SynthesisConfig
+from devscontext.models import (
+    DocsContext,
+    GitHubContext,
+    GmailContext,
+    JiraContext,
+    MeetingContext,
+    SlackContext,
+    SynthesisConfig,
+)
 from devscontext.plugins.base import SourceContext, SynthesisPlugin
+from devscontext.utils import clip_text
 
 if TYPE_CHECKING:
-    from devscontext.models import (
-        DocsContext,
-        GitHubContext,
-        GmailContext,
-        JiraContext,
-        MeetingContext,
-        SlackContext,
-    )
+    from collections.abc import AsyncIterator, Callable
+
+    from devscontext.models import DocSection
 
 logger = get_logger(__name__)
 
@@ -48,6 +66,8 @@ logger = get_logger(__name__)
 # SYNTHESIS PROMPT
 # =============================================================================
 
+# The task line comes last so that the instructions and the leading doc
+# sections of the raw data form a prefix shared across tasks.
 SYNTHESIS_PROMPT = """
 You are a senior engineer preparing context for a colleague about to start
 working on a task with an AI coding assistant.
@@ -58,7 +78,7 @@ that gives the AI agent everything it needs to write correct, well-integrated co
 Rules:
 - Target 2000-3000 tokens. Be concise but don't omit important details.
 - Use these sections (skip any section with no relevant data):
-  ## Task: {task_id} — {title}
+  ## Task: <task ID> — <title>
   ### Requirements
   ### Key Decisions
   ### Team Discussions
@@ -131,9 +151,142 @@ Raw data:
 ---
 {raw_data}
 ---
+
+Task: {task_id} — {title}
 """
 
 
+@functools.lru_cache(maxsize=8)
+def _compile_prompt(template: str) -> tuple[tuple[str, str | None], ...] | None:
+    """Split a str.format prompt template into literal and field segments.
+
+    Parsing happens once per distinct template instead of on every synthesis
+    call. Templates using format specs, conversions or attribute/index
+    lookups are not compiled.
+
+    Args:
+        template: Prompt template with {name} placeholders.
+
+    Returns:
+        Tuple of (literal, field_name) pairs, or None if the template
+        needs full str.format handling.
+    """
+    segments: list[tuple[str, str | None]] = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
+
+
+def _render_prompt(template: str, **values: str) -> str:
+    """Render a prompt template, equivalent to template.format(**values).
+
+    Args:
+        template: Prompt template with {name} placeholders.
+        **values: Values for the placeholders.
+
+    Returns:
+        The rendered prompt.
+
+    Raises:
+        KeyError: If the template references a value that was not given.
+    """
+    segments = _compile_prompt(template)
+    if segments is None:
+        return template.format(**values)
+
+    parts: list[str] = []
+    for literal, field in segments:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field])
+    return "".join(parts)
+
+
+# SourceContext.data type -> slot name, for picking typed contexts out of
+# an adapter-keyed dict with one lookup per source instead of an isinstance chain
+_CONTEXT_SLOTS: dict[type, str] = {
+    JiraContext: "jira",
+    MeetingContext: "meetings",
+    DocsContext: "docs",
+    SlackContext: "slack",
+    GmailContext: "gmail",
+    GitHubContext: "github",
+}
+
+
+def _collect_typed_contexts(source_contexts: dict[str, SourceContext]) -> dict[str, Any]:
+    """Map non-empty source contexts to their slot names.
+
+    If two sources carry the same context type, the later one wins.
+
+    Args:
+        source_contexts: Dict mapping adapter names to their SourceContext.
+
+    Returns:
+        Dict from slot name (see _CONTEXT_SLOTS) to the context data.
+    """
+    typed: dict[str, Any] = {}
+    for ctx in source_contexts.values():
+        if ctx.is_empty():
+            continue
+        slot = _CONTEXT_SLOTS.get(type(ctx.data))
+        if slot is not None:
+            typed[slot] = ctx.data
+    return typed
+
+
+# Log message for LLM failures that trigger the raw fallback, by error type
+_FALLBACK_REASONS: tuple[tuple[type[Exception], str], ...] = (
+    (ImportError, "LLM provider not available, using fallback"),
+    (ValueError, "LLM configuration error, using fallback"),
+)
+
+
+def _fallback_reason(error: Exception) -> str:
+    """Return the log message for an LLM error that triggers the fallback."""
+    for error_type, reason in _FALLBACK_REASONS:
+        if isinstance(error, error_type):
+            return reason
+    return "LLM synthesis failed, using fallback"
+
+
+def _iso_date(dt: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD.
+
+    Slicing isoformat() avoids strftime's format-string parsing, which
+    adds up across the date of every comment, message and meeting.
+
+    Args:
+        dt: Datetime to format.
+
+    Returns:
+        The date part in ISO 8601 form.
+    """
+    return dt.isoformat()[:10]
+
+
+def _partition_docs(sections: list[DocSection]) -> dict[str, list[DocSection]]:
+    """Group doc sections for the raw data formatters in a single pass.
+
+    ADRs and "other" docs share the "other" bucket, in their original order.
+
+    Args:
+        sections: Doc sections of any type.
+
+    Returns:
+        Dict with "architecture", "standards" and "other" section lists.
+    """
+    architecture: list[DocSection] = []
+    standards: list[DocSection] = []
+    other: list[DocSection] = []
+    buckets = {"architecture": architecture, "standards": standards, "adr": other, "other": other}
+    for section in sections:
+        buckets[section.doc_type].append(section)
+    return {"architecture": architecture, "standards": standards, "other": other}
+
+
 # =============================================================================
 # LLM PROVIDER INTERFACE
 # =============================================================================
@@ -158,14 +311,97 @@ class LLMProvider(ABC):
         """
         ...
 
+    async def generate_batch(self, prompts: list[str], max_tokens: int) -> list[str]:
+        """Generate responses for several independent prompts.
+
+        Requests run concurrently, at most LLM_BATCH_CONCURRENCY at a time,
+        so the batch takes about as long as its slowest prompt.
+
+        Args:
+            prompts: Prompts to send to the LLM.
+            max_tokens: Maximum tokens in each response.
+
+        Returns:
+            Generated texts, in the same order as prompts.
+
+        Raises:
+            Exception: If any generation fails.
+        """
+        semaphore = asyncio.Semaphore(LLM_BATCH_CONCURRENCY)
+
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate(prompt, max_tokens)
+
+        return list(await asyncio.gather(*(generate_one(prompt) for prompt in prompts)))
+
+    async def generate_stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """Generate a response from the LLM as incremental text chunks.
+
+        Lets callers start consuming output before generation finishes.
+        The default implementation yields the full generate() result once.
+
+        Args:
+            prompt: The prompt to send to the LLM.
+            max_tokens: Maximum tokens in the response.
+
+        Yields:
+            Text chunks in generation order.
+
+        Raises:
+            Exception: If generation fails.
+        """
+        yield await self.generate(prompt, max_tokens)
+
+    async def close(self) -> None:  # noqa: B027
+        """Release any client this provider created for itself.
+
+        Injected HTTP clients are owned by the caller and left open.
+        """
+
+
+def create_http_client(base_url: str = "") -> httpx.AsyncClient:
+    """Create a keep-alive HTTP client for LLM provider requests.
+
+    Synthesis calls are long and infrequent, so idle connections are kept
+    for LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS to skip TCP and TLS setup on the
+    next request. The Anthropic and OpenAI SDKs set their own per-request
+    timeout over this client's; redirects are followed as the SDKs' own
+    clients do.
+
+    Args:
+        base_url: Optional base URL for relative request paths.
+
+    Returns:
+        A new httpx.AsyncClient. The caller is responsible for closing it.
+    """
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=DEFAULT_HTTP_TIMEOUT_SECONDS * 2,  # LLM generation can be slow
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider."""
 
-    def __init__(self, api_key: str, model: str) -> None:
-        """Initialize the Anthropic provider."""
+    def __init__(
+        self, api_key: str, model: str, http_client: httpx.AsyncClient | None = None
+    ) -> None:
+        """Initialize the Anthropic provider.
+
+        Args:
+            api_key: Anthropic API key.
+            model: Model name.
+            http_client: Optional shared HTTP client for the SDK to use.
+        """
         self._api_key = api_key
         self._model = model
+        self._http_client = http_client
         self._client: Any = None
 
     def _get_client(self) -> Any:
@@ -178,7 +414,11 @@ class AnthropicProvider(LLMProvider):
                     "anthropic package not installed. "
                     "Install with: pip install devscontext[anthropic]"
                 ) from e
-            self._client = AsyncAnthropic(api_key=self._api_key)
+            self._client = AsyncAnthropic(
+                api_key=self._api_key,
+                http_client=self._http_client,
+                timeout=LLM_SDK_TIMEOUT_SECONDS,
+            )
         return self._client
 
     async def generate(self, prompt: str, max_tokens: int) -> str:
@@ -191,14 +431,40 @@ class AnthropicProvider(LLMProvider):
         )
         return str(response.content[0].text)
 
+    async def generate_stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """Stream text chunks from Claude."""
+        client = self._get_client()
+        async with client.messages.stream(
+            model=self._model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+    async def close(self) -> None:
+        """Close the SDK client unless it wraps an injected HTTP client."""
+        if self._client is not None and self._http_client is None:
+            await self._client.close()
+        self._client = None
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT provider."""
 
-    def __init__(self, api_key: str, model: str) -> None:
-        """Initialize the OpenAI provider."""
+    def __init__(
+        self, api_key: str, model: str, http_client: httpx.AsyncClient | None = None
+    ) -> None:
+        """Initialize the OpenAI provider.
+
+        Args:
+            api_key: OpenAI API key.
+            model: Model name.
+            http_client: Optional shared HTTP client for the SDK to use.
+        """
         self._api_key = api_key
         self._model = model
+        self._http_client = http_client
         self._client: Any = None
 
     def _get_client(self) -> Any:
@@ -210,7 +476,11 @@ class OpenAIProvider(LLMProvider):
                 raise ImportError(
                     "openai package not installed. Install with: pip install devscontext[openai]"
                 ) from e
-            self._client = AsyncOpenAI(api_key=self._api_key)
+            self._client = AsyncOpenAI(
+                api_key=self._api_key,
+                http_client=self._http_client,
+                timeout=LLM_SDK_TIMEOUT_SECONDS,
+            )
         return self._client
 
     async def generate(self, prompt: str, max_tokens: int) -> str:
@@ -223,30 +493,61 @@ class OpenAIProvider(LLMProvider):
         )
         return response.choices[0].message.content or ""
 
+    async def generate_stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """Stream text chunks from GPT."""
+        client = self._get_client()
+        stream = await client.chat.completions.create(
+            model=self._model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def close(self) -> None:
+        """Close the SDK client unless it wraps an injected HTTP client."""
+        if self._client is not None and self._http_client is None:
+            await self._client.close()
+        self._client = None
+
 
 class OllamaProvider(LLMProvider):
     """Ollama local provider."""
 
-    def __init__(self, model: str, base_url: str = "http://localhost:11434") -> None:
-        """Initialize the Ollama provider."""
+    def __init__(
+        self,
+        model: str,
+        base_url: str = "http://localhost:11434",
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the Ollama provider.
+
+        Args:
+            model: Model name.
+            base_url: Ollama server URL.
+            http_client: Optional shared HTTP client. Requests use absolute
+                URLs, so the client needs no base_url.
+        """
         self._model = model
-        self._base_url = base_url
+        self._base_url = base_url.rstrip("/")
+        self._http_client = http_client
         self._client: httpx.AsyncClient | None = None
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get the injected HTTP client, or create one owned by this provider."""
+        if self._http_client is not None:
+            return self._http_client
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self._base_url,
-                timeout=DEFAULT_HTTP_TIMEOUT_SECONDS * 2,  # Ollama can be slower
-            )
+            self._client = create_http_client()
         return self._client
 
     async def generate(self, prompt: str, max_tokens: int) -> str:
         """Generate using Ollama."""
         client = self._get_client()
         response = await client.post(
-            "/api/generate",
+            f"{self._base_url}/api/generate",
             json={
                 "model": self._model,
                 "prompt": prompt,
@@ -258,12 +559,45 @@ class OllamaProvider(LLMProvider):
         data = response.json()
         return str(data.get("response", ""))
 
-
-def create_provider(config: SynthesisConfig) -> LLMProvider:
+    async def generate_stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """Stream text chunks from Ollama's newline-delimited JSON response."""
+        client = self._get_client()
+        async with client.stream(
+            "POST",
+            f"{self._base_url}/api/generate",
+            json={
+                "model": self._model,
+                "prompt": prompt,
+                "stream": True,
+                "options": {"num_predict": max_tokens},
+            },
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("response"):
+                    yield str(data["response"])
+                if data.get("done"):
+                    break
+
+    async def close(self) -> None:
+        """Close the HTTP client if this provider created it."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_provider(
+    config: SynthesisConfig, http_client: httpx.AsyncClient | None = None
+) -> LLMProvider:
     """Factory function to create the appropriate LLM provider.
 
     Args:
         config: Synthesis configuration with provider and model settings.
+        http_client: Optional shared HTTP client, so every provider created
+            by one plugin reuses the same connection pool.
 
     Returns:
         An LLMProvider instance.
@@ -274,15 +608,17 @@ def create_provider(config: SynthesisConfig) -> LLMProvider:
     if config.provider == "anthropic":
         if not config.api_key:
             raise ValueError("Anthropic API key required for synthesis")
-        return AnthropicProvider(api_key=config.api_key, model=config.model)
+        return AnthropicProvider(
+            api_key=config.api_key, model=config.model, http_client=http_client
+        )
 
     elif config.provider == "openai":
         if not config.api_key:
             raise ValueError("OpenAI API key required for synthesis")
-        return OpenAIProvider(api_key=config.api_key, model=config.model)
+        return OpenAIProvider(api_key=config.api_key, model=config.model, http_client=http_client)
 
     elif config.provider == "ollama":
-        return OllamaProvider(model=config.model)
+        return OllamaProvider(model=config.model, http_client=http_client)
 
     else:
         raise ValueError(f"Unsupported synthesis provider: {config.provider}")
@@ -319,38 +655,110 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         """
         self._config = config
         self._provider: LLMProvider | None = None
-        self._custom_prompt: str | None = None
+        self._small_provider: LLMProvider | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._prompt_template: str | None = None
+        self._prompt_cache: OrderedDict[str, str] = OrderedDict()
 
     def _get_provider(self) -> LLMProvider:
-        """Get or create the LLM provider (lazy initialization)."""
+        """Get or create the LLM provider (lazy initialization).
+
+        The provider is handed a long-lived HTTP client so consecutive
+        synthesis calls reuse pooled keep-alive connections.
+        """
         if self._provider is None:
-            self._provider = create_provider(self._config)
+            if self._http_client is None:
+                self._http_client = create_http_client()
+            self._provider = create_provider(self._config, http_client=self._http_client)
         return self._provider
 
+    def _get_small_provider(self) -> LLMProvider:
+        """Get or create the provider for the configured small model."""
+        if self._small_provider is None:
+            if self._http_client is None:
+                self._http_client = create_http_client()
+            small_config = self._config.model_copy(
+                update={
+                    "provider": self._small_provider_name(),
+                    "model": self._config.small_model,
+                    "api_key": self._config.get_small_api_key(),
+                }
+            )
+            self._small_provider = create_provider(small_config, http_client=self._http_client)
+        return self._small_provider
+
+    def _small_provider_name(self) -> str:
+        """Name of the provider that serves small_model."""
+        return self._config.small_provider or self._config.provider
+
+    def _use_small_model(self, prompt: str) -> bool:
+        """Check whether a prompt is small enough for the small model.
+
+        Tokens are estimated at roughly four characters each.
+        """
+        return (
+            self._config.small_model is not None
+            and len(prompt) // 4 < self._config.small_model_threshold_tokens
+        )
+
+    def _prompt_cache_key(self, prompt: str, small: bool = False) -> str:
+        """Return the result cache key for a rendered prompt."""
+        digest = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        if small:
+            return f"{self._small_provider_name()}:{self._config.small_model}:{digest}"
+        return f"{self._config.provider}:{self._config.model}:{digest}"
+
+    def _get_cached(self, key: str) -> str | None:
+        """Look up a cached synthesis result and mark it most recently used."""
+        result = self._prompt_cache.get(key)
+        if result is not None:
+            self._prompt_cache.move_to_end(key)
+        return result
+
+    def _put_cached(self, key: str, result: str) -> None:
+        """Cache a synthesis result, evicting the least recently used if full."""
+        self._prompt_cache[key] = result
+        self._prompt_cache.move_to_end(key)
+        if len(self._prompt_cache) > SYNTHESIS_PROMPT_CACHE_SIZE:
+            self._prompt_cache.popitem(last=False)
+
+    async def close(self) -> None:
+        """Close the LLM providers and the shared HTTP client."""
+        if self._provider is not None:
+            await self._provider.close()
+            self._provider = None
+        if self._small_provider is not None:
+            await self._small_provider.close()
+            self._small_provider = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     def _get_prompt_template(self) -> str:
         """Get the prompt template (custom or default).
 
         If config.prompt_template is set, loads from that file.
-        Otherwise uses the default SYNTHESIS_PROMPT.
+        Otherwise uses the default SYNTHESIS_PROMPT. The outcome, including
+        falling back for a missing file, is resolved once per plugin.
 
         Returns:
             The prompt template string.
         """
-        if self._custom_prompt is not None:
-            return self._custom_prompt
+        if self._prompt_template is not None:
+            return self._prompt_template
 
+        self._prompt_template = SYNTHESIS_PROMPT
         if self._config.prompt_template:
             from pathlib import Path
 
             template_path = Path(self._config.prompt_template)
             if template_path.exists():
-                self._custom_prompt = template_path.read_text()
+                self._prompt_template = template_path.read_text()
                 logger.info(f"Loaded custom prompt template from: {template_path}")
-                return self._custom_prompt
             else:
                 logger.warning(f"Custom prompt template not found: {template_path}, using default")
 
-        return SYNTHESIS_PROMPT
+        return self._prompt_template
 
     def _format_jira_context(self, ctx: JiraContext) -> str:
         """Format Jira context as raw data for the prompt."""
@@ -380,7 +788,7 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         if ctx.comments:
             parts.append(f"\n### Comments ({len(ctx.comments)})")
             for comment in ctx.comments[:10]:
-                date_str = comment.created.strftime("%Y-%m-%d")
+                date_str = _iso_date(comment.created)
                 parts.append(f"\n**{comment.author}** ({date_str}):\n{comment.body}")
 
         # Linked issues
@@ -401,7 +809,7 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         parts = ["## MEETING TRANSCRIPTS"]
 
         for meeting in ctx.meetings:
-            date_str = meeting.meeting_date.strftime("%Y-%m-%d")
+            date_str = _iso_date(meeting.meeting_date)
             parts.append(f"\n### {meeting.meeting_title} ({date_str})")
 
             if meeting.participants:
@@ -421,16 +829,19 @@ class LLMSynthesisPlugin(SynthesisPlugin):
 
         return "\n".join(parts)
 
-    def _format_architecture_docs(self, ctx: DocsContext) -> str:
-        """Format architecture documentation as raw data for the prompt."""
-        arch_sections = [s for s in ctx.sections if s.doc_type == "architecture"]
-        if not arch_sections:
+    def _format_architecture_docs(self, sections: list[DocSection]) -> str:
+        """Format architecture documentation as raw data for the prompt.
+
+        Args:
+            sections: Architecture doc sections (see _partition_docs).
+        """
+        if not sections:
             return ""
 
         parts = ["## ARCHITECTURE DOCS"]
         parts.append("*Focus on file paths, data flow, integration points, and infrastructure.*\n")
 
-        for section in arch_sections:
+        for section in sections:
             title = section.section_title or section.file_path
             parts.append(f"\n### {title}")
             parts.append(f"**Source:** {section.file_path}")
@@ -438,16 +849,19 @@ class LLMSynthesisPlugin(SynthesisPlugin):
 
         return "\n".join(parts)
 
-    def _format_coding_standards(self, ctx: DocsContext) -> str:
-        """Format coding standards as raw data for the prompt."""
-        standards_sections = [s for s in ctx.sections if s.doc_type == "standards"]
-        if not standards_sections:
+    def _format_coding_standards(self, sections: list[DocSection]) -> str:
+        """Format coding standards as raw data for the prompt.
+
+        Args:
+            sections: Standards doc sections (see _partition_docs).
+        """
+        if not sections:
             return ""
 
         parts = ["## CODING STANDARDS"]
         parts.append("*Specific rules and patterns to follow in this codebase.*\n")
 
-        for section in standards_sections:
+        for section in sections:
             title = section.section_title or section.file_path
             parts.append(f"\n### {title}")
             parts.append(f"**Source:** {section.file_path}")
@@ -455,15 +869,18 @@ class LLMSynthesisPlugin(SynthesisPlugin):
 
         return "\n".join(parts)
 
-    def _format_other_docs(self, ctx: DocsContext) -> str:
-        """Format ADRs and other documentation as raw data for the prompt."""
-        other_sections = [s for s in ctx.sections if s.doc_type in ("adr", "other")]
-        if not other_sections:
+    def _format_other_docs(self, sections: list[DocSection]) -> str:
+        """Format ADRs and other documentation as raw data for the prompt.
+
+        Args:
+            sections: ADR and other doc sections (see _partition_docs).
+        """
+        if not sections:
             return ""
 
         parts = ["## OTHER DOCUMENTATION"]
 
-        for section in other_sections:
+        for section in sections:
             doc_type_label = "ADR" if section.doc_type == "adr" else "Doc"
             title = section.section_title or section.file_path
             parts.append(f"\n### [{doc_type_label}] {title}")
@@ -481,7 +898,7 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         parts.append("*Informal team communications and discussions.*\n")
 
         for thread in ctx.threads:
-            date_str = thread.parent_message.timestamp.strftime("%Y-%m-%d")
+            date_str = _iso_date(thread.parent_message.timestamp)
             parts.append(f"\n### Thread in #{thread.parent_message.channel_name} ({date_str})")
             parts.append(f"**Participants:** {', '.join(thread.participant_names)}")
 
@@ -501,7 +918,7 @@ class LLMSynthesisPlugin(SynthesisPlugin):
                     parts.append(f"- {a}")
 
         for msg in ctx.standalone_messages[:5]:
-            date_str = msg.timestamp.strftime("%Y-%m-%d")
+            date_str = _iso_date(msg.timestamp)
             parts.append(f"\n**#{msg.channel_name}** ({date_str})")
             parts.append(f"**{msg.user_name}:** {msg.text}")
 
@@ -518,16 +935,13 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         for thread in ctx.threads:
             parts.append(f"\n### Email Thread: {thread.subject}")
             parts.append(f"**Participants:** {', '.join(thread.participants[:5])}")
-            parts.append(f"**Latest:** {thread.latest_date.strftime('%Y-%m-%d')}")
+            parts.append(f"**Latest:** {_iso_date(thread.latest_date)}")
 
             for msg in thread.messages[:3]:
                 sender = msg.sender_name or msg.sender
-                date_str = msg.date.strftime("%Y-%m-%d")
+                date_str = _iso_date(msg.date)
                 parts.append(f"\n**{sender}** ({date_str}):")
-                body = msg.body_text or msg.snippet
-                if len(body) > 500:
-                    body = body[:500] + "..."
-                parts.append(body)
+                parts.append(clip_text(msg.body_text or msg.snippet, 500))
 
         return "\n".join(parts)
 
@@ -536,8 +950,6 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         if not ctx.related_prs and not ctx.recent_prs and not ctx.related_issues:
             return ""
 
-        from datetime import UTC, datetime
-
         parts = ["## GITHUB CONTEXT"]
         parts.append("*Recent PRs and changes in the same service area.*\n")
 
@@ -554,17 +966,15 @@ class LLMSynthesisPlugin(SynthesisPlugin):
                         files_str += f" (+{len(pr.changed_files) - 5} more)"
                     parts.append(f"Changed: {files_str}")
                 for comment in pr.review_comments[:3]:
-                    body = comment.body[:200]
-                    if len(comment.body) > 200:
-                        body += "..."
-                    parts.append(f"Review (@{comment.author}): {body}")
+                    parts.append(f"Review (@{comment.author}): {clip_text(comment.body, 200)}")
 
         # Recent PRs in same area
         if ctx.recent_prs:
             parts.append("\n### Recent PRs in Service Area")
+            now = datetime.now(UTC)
             for pr in ctx.recent_prs[:5]:
                 merge_date = pr.merged_at or pr.created_at
-                days_ago = (datetime.now(UTC) - merge_date).days
+                days_ago = (now - merge_date).days
                 parts.append(f"- PR #{pr.number}: {pr.title} ({days_ago}d ago)")
 
         # Related issues
@@ -600,6 +1010,35 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         """
         sections: list[str] = []
 
+        # Sections run from most to least stable across tasks, so consecutive
+        # prompts share a long prefix that providers can serve from their
+        # prompt caches. Repo docs first, the task's own ticket and chatter last.
+
+        # Documentation - split by type for better synthesis
+        if docs_context and docs_context.sections:
+            by_type = _partition_docs(docs_context.sections)
+
+            # Coding standards (patterns, rules, conventions)
+            standards = self._format_coding_standards(by_type["standards"])
+            if standards:
+                sections.append(standards)
+
+            # Architecture docs (file paths, data flow, infrastructure)
+            arch_docs = self._format_architecture_docs(by_type["architecture"])
+            if arch_docs:
+                sections.append(arch_docs)
+
+            # ADRs and other docs
+            other_docs = self._format_other_docs(by_type["other"])
+            if other_docs:
+                sections.append(other_docs)
+
+        # GitHub context (PRs, issues, recent changes)
+        if github_context and (
+            github_context.related_prs or github_context.recent_prs or github_context.related_issues
+        ):
+            sections.append(self._format_github_context(github_context))
+
         # Jira ticket data
         if jira_context and jira_context.ticket:
             sections.append(self._format_jira_context(jira_context))
@@ -616,29 +1055,6 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         if gmail_context and gmail_context.threads:
             sections.append(self._format_gmail_context(gmail_context))
 
-        # GitHub context (PRs, issues, recent changes)
-        if github_context and (
-            github_context.related_prs or github_context.recent_prs or github_context.related_issues
-        ):
-            sections.append(self._format_github_context(github_context))
-
-        # Documentation - split by type for better synthesis
-        if docs_context and docs_context.sections:
-            # Architecture docs (file paths, data flow, infrastructure)
-            arch_docs = self._format_architecture_docs(docs_context)
-            if arch_docs:
-                sections.append(arch_docs)
-
-            # Coding standards (patterns, rules, conventions)
-            standards = self._format_coding_standards(docs_context)
-            if standards:
-                sections.append(standards)
-
-            # ADRs and other docs
-            other_docs = self._format_other_docs(docs_context)
-            if other_docs:
-                sections.append(other_docs)
-
         if not sections:
             return "No context data available."
 
@@ -703,52 +1119,122 @@ class LLMSynthesisPlugin(SynthesisPlugin):
         Returns:
             Synthesized markdown context, or fallback raw format on error.
         """
-        # Extract typed contexts from source_contexts
-        from devscontext.models import (
-            DocsContext,
-            GitHubContext,
-            GmailContext,
-            JiraContext,
-            MeetingContext,
-            SlackContext,
+        typed = _collect_typed_contexts(source_contexts)
+        prompt = self._build_prompt(task_id, typed)
+        if prompt is None:
+            return f"## Task: {task_id}\n\nNo context found for this task."
+
+        # Identical prompts (unchanged source data) reuse the previous result
+        small = self._use_small_model(prompt)
+        cache_key = self._prompt_cache_key(prompt, small)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.debug("Synthesis cache hit", extra={"task_id": task_id})
+            return cached
+
+        # Try LLM synthesis, routing small prompts to the cheaper model
+        provider_name = self._small_provider_name() if small else self._config.provider
+        try:
+            provider = self._get_small_provider() if small else self._get_provider()
+            result = await provider.generate(
+                prompt=prompt,
+                max_tokens=self._config.max_output_tokens,
+            )
+        except Exception as e:
+            logger.warning(
+                _fallback_reason(e),
+                extra={"error": str(e), "provider": provider_name},
+            )
+            return self._typed_fallback(task_id, typed)
+
+        logger.info(
+            "Synthesis completed",
+            extra={"task_id": task_id, "provider": provider_name, "small_model": small},
         )
+        self._put_cached(cache_key, result)
+        return result
 
-        jira_context: JiraContext | None = None
-        meeting_context: MeetingContext | None = None
-        docs_context: DocsContext | None = None
-        slack_context: SlackContext | None = None
-        gmail_context: GmailContext | None = None
-        github_context: GitHubContext | None = None
+    async def synthesize_stream(
+        self,
+        task_id: str,
+        source_contexts: dict[str, SourceContext],
+    ) -> AsyncIterator[str]:
+        """Synthesize context, yielding LLM output as it is generated.
 
-        for _name, ctx in source_contexts.items():
-            if ctx.is_empty():
-                continue
+        Builds the same prompt as synthesize() but streams the provider's
+        response so callers can render before generation finishes. Cached
+        results, the no-context message and the fallback are yielded whole.
+        A stream that fails after producing output ends early rather than
+        appending the fallback to partial text.
+
+        Args:
+            task_id: The task identifier.
+            source_contexts: Dict mapping adapter names to their SourceContext.
+
+        Yields:
+            Markdown chunks that concatenate to the synthesized context.
+        """
+        typed = _collect_typed_contexts(source_contexts)
+        prompt = self._build_prompt(task_id, typed)
+        if prompt is None:
+            yield f"## Task: {task_id}\n\nNo context found for this task."
+            return
+
+        small = self._use_small_model(prompt)
+        cache_key = self._prompt_cache_key(prompt, small)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.debug("Synthesis cache hit", extra={"task_id": task_id})
+            yield cached
+            return
+
+        provider_name = self._small_provider_name() if small else self._config.provider
+        chunks: list[str] = []
+        try:
+            provider = self._get_small_provider() if small else self._get_provider()
+            async for chunk in provider.generate_stream(
+                prompt=prompt,
+                max_tokens=self._config.max_output_tokens,
+            ):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            logger.warning(
+                _fallback_reason(e),
+                extra={"error": str(e), "provider": provider_name},
+            )
+            if not chunks:
+                yield self._typed_fallback(task_id, typed)
+            return
+
+        logger.info(
+            "Synthesis completed",
+            extra={"task_id": task_id, "provider": provider_name, "small_model": small},
+        )
+        self._put_cached(cache_key, "".join(chunks))
+
+    def _build_prompt(self, task_id: str, typed: dict[str, Any]) -> str | None:
+        """Render the synthesis prompt for the typed source contexts.
 
-            if isinstance(ctx.data, JiraContext):
-                jira_context = ctx.data
-            elif isinstance(ctx.data, MeetingContext):
-                meeting_context = ctx.data
-            elif isinstance(ctx.data, DocsContext):
-                docs_context = ctx.data
-            elif isinstance(ctx.data, SlackContext):
-                slack_context = ctx.data
-            elif isinstance(ctx.data, GmailContext):
-                gmail_context = ctx.data
-            elif isinstance(ctx.data, GitHubContext):
-                github_context = ctx.data
-
-        # Build raw data
+        Args:
+            task_id: The task identifier.
+            typed: Typed contexts keyed by slot (see _collect_typed_contexts).
+
+        Returns:
+            The rendered prompt, or None if there is no context data.
+        """
+        jira_context: JiraContext | None = typed.get("jira")
         raw_data = self._build_raw_data(
             jira_context,
-            meeting_context,
-            docs_context,
-            slack_context,
-            gmail_context,
-            github_context,
+            typed.get("meetings"),
+            typed.get("docs"),
+            typed.get("slack"),
+            typed.get("gmail"),
+            typed.get("github"),
         )
 
         if raw_data == "No context data available.":
-            return f"## Task: {task_id}\n\nNo context found for this task."
+            return None
 
         # Get title from Jira if available
         title = ""
@@ -756,70 +1242,24 @@ class LLMSynthesisPlugin(SynthesisPlugin):
             title = jira_context.ticket.title
 
         # Build the prompt using custom or default template
-        prompt_template = self._get_prompt_template()
-        prompt = prompt_template.format(
+        return _render_prompt(
+            self._get_prompt_template(),
             task_id=task_id,
             title=title,
             raw_data=raw_data,
         )
 
-        # Try LLM synthesis
-        try:
-            provider = self._get_provider()
-            result = await provider.generate(
-                prompt=prompt,
-                max_tokens=self._config.max_output_tokens,
-            )
-            logger.info(
-                "Synthesis completed",
-                extra={"task_id": task_id, "provider": self._config.provider},
-            )
-            return result
-
-        except ImportError as e:
-            logger.warning(
-                "LLM provider not available, using fallback",
-                extra={"error": str(e), "provider": self._config.provider},
-            )
-            return self._format_fallback(
-                task_id,
-                jira_context,
-                meeting_context,
-                docs_context,
-                slack_context,
-                gmail_context,
-                github_context,
-            )
-
-        except ValueError as e:
-            logger.warning(
-                "LLM configuration error, using fallback",
-                extra={"error": str(e), "provider": self._config.provider},
-            )
-            return self._format_fallback(
-                task_id,
-                jira_context,
-                meeting_context,
-                docs_context,
-                slack_context,
-                gmail_context,
-                github_context,
-            )
-
-        except Exception as e:
-            logger.warning(
-                "LLM synthesis failed, using fallback",
-                extra={"error": str(e), "provider": self._config.provider},
-            )
-            return self._format_fallback(
-                task_id,
-                jira_context,
-                meeting_context,
-                docs_context,
-                slack_context,
-                gmail_context,
-                github_context,
-            )
+    def _typed_fallback(self, task_id: str, typed: dict[str, Any]) -> str:
+        """Format the raw fallback output for the typed source contexts."""
+        return self._format_fallback(
+            task_id,
+            typed.get("jira"),
+            typed.get("meetings"),
+            typed.get("docs"),
+            typed.get("slack"),
+            typed.get("gmail"),
+            typed.get("github"),
+        )
 
 
 # =============================================================================
@@ -855,7 +1295,7 @@ class TemplateSynthesisPlugin(SynthesisPlugin):
         """Get or create the Jinja2 template (lazy initialization)."""
         if self._template is None:
             try:
-                from jinja2 import Environment, FileSystemLoader
+                from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
             except ImportError as e:
                 raise ImportError(
                     "jinja2 package not installed. Install with: pip install jinja2"
@@ -871,9 +1311,15 @@ class TemplateSynthesisPlugin(SynthesisPlugin):
             if not template_file.exists():
                 raise ValueError(f"Template file not found: {template_path}")
 
+            # The compiled template is held for the plugin's lifetime, so skip
+            # reload checks; the bytecode cache (a per-user temp directory
+            # jinja2 creates with owner-only permissions) spares restarts from
+            # recompiling the template source
             env = Environment(
                 loader=FileSystemLoader(str(template_file.parent)),
                 autoescape=False,
+                auto_reload=False,
+                bytecode_cache=FileSystemBytecodeCache(pattern="devscontext_%s.cache"),
             )
             self._template = env.get_template(template_file.name)
 
@@ -903,38 +1349,7 @@ class TemplateSynthesisPlugin(SynthesisPlugin):
         Returns:
             Rendered template output.
         """
-        from devscontext.models import (
-            DocsContext,
-            GitHubContext,
-            GmailContext,
-            JiraContext,
-            MeetingContext,
-            SlackContext,
-        )
-
-        # Extract typed contexts
-        jira_context: JiraContext | None = None
-        meeting_context: MeetingContext | None = None
-        docs_context: DocsContext | None = None
-        slack_context: SlackContext | None = None
-        gmail_context: GmailContext | None = None
-        github_context: GitHubContext | None = None
-
-        for _name, ctx in source_contexts.items():
-            if ctx.is_empty():
-                continue
-            if isinstance(ctx.data, JiraContext):
-                jira_context = ctx.data
-            elif isinstance(ctx.data, MeetingContext):
-                meeting_context = ctx.data
-            elif isinstance(ctx.data, DocsContext):
-                docs_context = ctx.data
-            elif isinstance(ctx.data, SlackContext):
-                slack_context = ctx.data
-            elif isinstance(ctx.data, GmailContext):
-                gmail_context = ctx.data
-            elif isinstance(ctx.data, GitHubContext):
-                github_context = ctx.data
+        typed = _collect_typed_contexts(source_contexts)
 
         try:
             template = self._get_template()
@@ -942,12 +1357,12 @@ class TemplateSynthesisPlugin(SynthesisPlugin):
                 template.render(
                     task_id=task_id,
                     contexts=source_contexts,
-                    jira=jira_context,
-                    meetings=meeting_context,
-                    docs=docs_context,
-                    github=github_context,
-                    slack=slack_context,
-                    gmail=gmail_context,
+                    jira=typed.get("jira"),
+                    meetings=typed.get("meetings"),
+                    docs=typed.get("docs"),
+                    github=typed.get("github"),
+                    slack=typed.get("slack"),
+                    gmail=typed.get("gmail"),
                 )
             )
         except Exception as e:
@@ -997,21 +1412,13 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
         Returns:
             Raw markdown formatted context.
         """
-        from devscontext.models import (
-            DocsContext,
-            GitHubContext,
-            GmailContext,
-            JiraContext,
-            MeetingContext,
-            SlackContext,
-        )
-
         parts = [f"## Task: {task_id}", ""]
 
         if not source_contexts:
             parts.append("No context data available.")
             return "\n".join(parts)
 
+        formatters = self._FORMATTERS
         for name, ctx in source_contexts.items():
             if ctx.is_empty():
                 continue
@@ -1021,18 +1428,9 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
             parts.append("")
 
             # Format based on data type
-            if isinstance(ctx.data, JiraContext):
-                parts.append(self._format_jira(ctx.data))
-            elif isinstance(ctx.data, MeetingContext):
-                parts.append(self._format_meetings(ctx.data))
-            elif isinstance(ctx.data, DocsContext):
-                parts.append(self._format_docs(ctx.data))
-            elif isinstance(ctx.data, SlackContext):
-                parts.append(self._format_slack(ctx.data))
-            elif isinstance(ctx.data, GmailContext):
-                parts.append(self._format_gmail(ctx.data))
-            elif isinstance(ctx.data, GitHubContext):
-                parts.append(self._format_github(ctx.data))
+            formatter = formatters.get(type(ctx.data))
+            if formatter is not None:
+                parts.append(formatter(self, ctx.data))
             elif ctx.raw_text:
                 parts.append(ctx.raw_text)
             else:
@@ -1063,7 +1461,7 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
         if ctx.comments:
             lines.append(f"\n**Comments ({len(ctx.comments)}):**")
             for c in ctx.comments[:5]:
-                lines.append(f"- {c.author}: {c.body[:200]}...")
+                lines.append(f"- {c.author}: {clip_text(c.body, 200)}")
 
         if ctx.linked_issues:
             lines.append(f"\n**Linked Issues ({len(ctx.linked_issues)}):**")
@@ -1079,11 +1477,11 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
 
         lines = []
         for m in ctx.meetings:
-            date_str = m.meeting_date.strftime("%Y-%m-%d")
+            date_str = _iso_date(m.meeting_date)
             lines.append(f"**{m.meeting_title}** ({date_str})")
             if m.participants:
                 lines.append(f"Participants: {', '.join(m.participants)}")
-            lines.append(f"\n{m.excerpt[:500]}...")
+            lines.append(f"\n{clip_text(m.excerpt, 500)}")
             if m.decisions:
                 lines.append("\nDecisions:")
                 for d in m.decisions:
@@ -1106,7 +1504,7 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
             title = s.section_title or s.file_path
             lines.append(f"**{title}** [{s.doc_type}]")
             lines.append(f"*Source: {s.file_path}*")
-            lines.append(f"\n{s.content[:500]}...")
+            lines.append(f"\n{clip_text(s.content, 500)}")
             lines.append("")
 
         return "\n".join(lines)
@@ -1118,12 +1516,11 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
 
         lines = []
         for thread in ctx.threads:
-            date_str = thread.parent_message.timestamp.strftime("%Y-%m-%d")
+            date_str = _iso_date(thread.parent_message.timestamp)
             lines.append(f"**#{thread.parent_message.channel_name}** ({date_str})")
             lines.append(f"Participants: {', '.join(thread.participant_names)}")
             user = thread.parent_message.user_name
-            text = thread.parent_message.text[:200]
-            lines.append(f"\n{user}: {text}...")
+            lines.append(f"\n{user}: {clip_text(thread.parent_message.text, 200)}")
             if thread.decisions:
                 lines.append("\nDecisions:")
                 for d in thread.decisions[:3]:
@@ -1135,8 +1532,8 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
             lines.append("")
 
         for msg in ctx.standalone_messages[:5]:
-            date_str = msg.timestamp.strftime("%Y-%m-%d")
-            lines.append(f"**#{msg.channel_name}** ({date_str}): {msg.text[:200]}...")
+            date_str = _iso_date(msg.timestamp)
+            lines.append(f"**#{msg.channel_name}** ({date_str}): {clip_text(msg.text, 200)}")
 
         return "\n".join(lines)
 
@@ -1149,10 +1546,10 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
         for thread in ctx.threads:
             lines.append(f"**{thread.subject}**")
             lines.append(f"Participants: {', '.join(thread.participants[:5])}")
-            lines.append(f"Latest: {thread.latest_date.strftime('%Y-%m-%d')}")
+            lines.append(f"Latest: {_iso_date(thread.latest_date)}")
             for msg in thread.messages[:2]:
                 sender = msg.sender_name or msg.sender
-                lines.append(f"\n{sender}: {msg.snippet[:200]}...")
+                lines.append(f"\n{sender}: {clip_text(msg.snippet, 200)}")
             lines.append("")
 
         return "\n".join(lines)
@@ -1185,6 +1582,16 @@ class PassthroughSynthesisPlugin(SynthesisPlugin):
 
         return "\n".join(lines)
 
+    # SourceContext.data type -> formatter, one dict lookup per source
+    _FORMATTERS: ClassVar[dict[type, Callable[[Any, Any], str]]] = {
+        JiraContext: _format_jira,
+        MeetingContext: _format_meetings,
+        DocsContext: _format_docs,
+        SlackContext: _format_slack,
+        GmailContext: _format_gmail,
+        GitHubContext: _format_github,
+    }
+
 
 # Keep old name as alias for backward compatibility
 SynthesisEngine = LLMSynthesisPlugin
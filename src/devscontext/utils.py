@@ -255,6 +255,66 @@ def truncate_text(text: str, max_chars: int) -> str:
     return truncated + suffix
 
 
+def clip_text(text: str, max_chars: int, suffix: str = "...") -> str:
+    """
+    Cut text to max_chars with a hard cut, appending suffix only if it was cut.
+
+    A cheap alternative to truncate_text for short previews where finding a
+    sentence or word boundary is not worth the scan.
+
+    Args:
+        text: Input text to clip.
+        max_chars: Maximum characters kept from text (suffix not counted).
+        suffix: Marker appended when text was cut.
+
+    Returns:
+        The original text if within limit, else its prefix plus suffix.
+    """
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + suffix
+
+
+def split_markdown_sections(text: str, max_chars: int) -> list[str]:
+    """
+    Split markdown into chunks of at most max_chars, cutting only before "## " headings.
+
+    Consecutive sections are packed into the same chunk while they fit.
+    A single section longer than max_chars is kept whole rather than cut.
+    Joining the chunks with "" reproduces the input exactly.
+
+    Args:
+        text: Markdown text to split.
+        max_chars: Target maximum characters per chunk.
+
+    Returns:
+        List of chunks; a single-item list if the text already fits.
+    """
+    if len(text) <= max_chars:
+        return [text]
+
+    # Cut points are the newline before each level-2 heading
+    sections: list[str] = []
+    start = 0
+    while (cut := text.find("\n## ", start + 1)) != -1:
+        sections.append(text[start : cut + 1])
+        start = cut + 1
+    sections.append(text[start:])
+
+    chunks: list[str] = []
+    current: list[str] = []
+    current_len = 0
+    for section in sections:
+        if current and current_len + len(section) > max_chars:
+            chunks.append("".join(current))
+            current, current_len = [], 0
+        current.append(section)
+        current_len += len(section)
+    chunks.append("".join(current))
+
+    return chunks
+
+
 def format_duration(ms: int) -> str:
     """
     Format milliseconds to human-readable duration.
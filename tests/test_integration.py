@@ -42,19 +42,26 @@ def real_config() -> DevsContextConfig:
     fireflies_key = os.getenv("FIREFLIES_API_KEY")
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
 
+    # Adapter/synthesis configs are frozen, so derive updated copies
     if jira_token and jira_url and jira_email:
-        config.sources.jira.api_token = jira_token
-        config.sources.jira.base_url = jira_url
-        config.sources.jira.email = jira_email
-        config.sources.jira.enabled = True
+        config.sources.jira = config.sources.jira.model_copy(
+            update={
+                "api_token": jira_token,
+                "base_url": jira_url,
+                "email": jira_email,
+                "enabled": True,
+            }
+        )
 
     if fireflies_key:
-        config.sources.fireflies.api_key = fireflies_key
-        config.sources.fireflies.enabled = True
+        config.sources.fireflies = config.sources.fireflies.model_copy(
+            update={"api_key": fireflies_key, "enabled": True}
+        )
 
     if anthropic_key:
-        config.synthesis.api_key = anthropic_key
-        config.synthesis.provider = "anthropic"
+        config.synthesis = config.synthesis.model_copy(
+            update={"api_key": anthropic_key, "provider": "anthropic"}
+        )
 
     return config
 
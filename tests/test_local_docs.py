@@ -585,3 +585,76 @@ class TestSearchDocs:
         # Results should exist if fixture has matching content
         # Just verify the method completes without error
         assert isinstance(results.sections, list)
+
+
+class TestIndexDocuments:
+    """Tests for building the RAG index."""
+
+    async def test_embeds_in_length_order_and_keeps_section_order(
+        self, fixtures_path: Path, tmp_path: Path, monkeypatch
+    ):
+        """Batches are length-sorted but embeddings stay aligned with sections."""
+        np = pytest.importorskip("numpy")
+        from devscontext.models import RagConfig
+        from devscontext.rag.embeddings import EmbeddingProvider
+        from devscontext.rag.index import DocumentIndex
+
+        batches: list[list[str]] = []
+
+        class FakeProvider(EmbeddingProvider):
+            async def embed(self, texts: list[str]) -> list[list[float]]:
+                batches.append(texts)
+                return [[float(len(text)), 1.0] for text in texts]
+
+        monkeypatch.setattr("devscontext.rag.is_rag_available", lambda: True)
+        monkeypatch.setattr(
+            "devscontext.rag.get_embedding_provider", lambda config: FakeProvider("fake")
+        )
+        index_path = tmp_path / "doc_index.json"
+        config = DocsConfig(
+            paths=[str(fixtures_path)],
+            enabled=True,
+            rag=RagConfig(enabled=True, index_path=str(index_path)),
+        )
+
+        result = await LocalDocsAdapter(config).index_documents()
+
+        embedded = [text for batch in batches for text in batch]
+        assert [len(t) for t in embedded] == sorted(len(t) for t in embedded)
+
+        index = DocumentIndex(str(index_path))
+        index.load()
+        assert result["sections_indexed"] == index.section_count
+        for section, row in zip(index._sections, index._embeddings_array, strict=True):
+            text = "\n".join(p for p in (section.section_title, section.content) if p)
+            expected = np.array([len(text), 1.0]) / np.hypot(len(text), 1.0)
+            assert np.allclose(row, expected)
+
+    def test_refresh_reloads_only_when_index_changes(self, tmp_path: Path, monkeypatch):
+        """The cached index is reloaded only after the index file changes."""
+        pytest.importorskip("numpy")
+        import os
+
+        from devscontext.models import RagConfig
+        from devscontext.rag.index import DocumentIndex, IndexedSection
+
+        index_path = tmp_path / "doc_index.json"
+        index = DocumentIndex(str(index_path))
+        index.add_sections([IndexedSection("a.md", "A", "alpha", "other")], [[1.0, 0.0]], "m")
+        index.save()
+
+        config = DocsConfig(enabled=True, rag=RagConfig(enabled=True, index_path=str(index_path)))
+        adapter = LocalDocsAdapter(config)
+        adapter._rag_index = DocumentIndex(str(index_path))
+        loads: list[bool] = []
+        original_load = adapter._rag_index.load
+        monkeypatch.setattr(adapter._rag_index, "load", lambda: loads.append(original_load()))
+
+        adapter._refresh_rag_index()
+        adapter._refresh_rag_index()
+        assert len(loads) == 1
+
+        stat = index_path.stat()
+        os.utime(index_path, (stat.st_atime, stat.st_mtime + 10))
+        adapter._refresh_rag_index()
+        assert len(loads) == 2
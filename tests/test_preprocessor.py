@@ -1,5 +1,6 @@
 """Tests for the pre-processing pipeline."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -26,6 +27,7 @@ from devscontext.models import (
     SynthesisConfig,
 )
 from devscontext.storage import PrebuiltContextStorage
+from devscontext.synthesis import LLMProvider
 
 
 @pytest.fixture
@@ -366,6 +368,36 @@ class TestPreprocessingPipelineIntegration:
             with pytest.raises(ValueError, match="Could not fetch Jira ticket"):
                 await pipeline.process("NONEXISTENT-999")
 
+    @pytest.mark.asyncio
+    async def test_multi_pass_runs_extractions_concurrently(
+        self,
+        config: DevsContextConfig,
+        sample_jira_context: JiraContext,
+        sample_meeting_context: MeetingContext,
+        sample_docs_context: DocsContext,
+    ) -> None:
+        """Test that the per-source extraction prompts are in flight together."""
+        in_flight = 0
+        peak = 0
+
+        class CountingProvider(LLMProvider):
+            async def generate(self, prompt: str, max_tokens: int) -> str:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return "[]"
+
+        pipeline = PreprocessingPipeline(config, AsyncMock(spec=PrebuiltContextStorage))
+        pipeline._provider = CountingProvider()
+
+        await pipeline._multi_pass_synthesis(
+            "TEST-123", sample_jira_context, sample_meeting_context, sample_docs_context
+        )
+
+        assert peak == 3
+
 
 class TestGapDetection:
     """Tests for gap detection functionality."""
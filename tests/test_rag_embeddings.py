@@ -0,0 +1,169 @@
+"""Tests for RAG embedding providers."""
+
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from devscontext.rag.embeddings import (
+    LocalEmbeddingProvider,
+    OllamaEmbeddingProvider,
+    OpenAIEmbeddingProvider,
+)
+
+
+class FakeSentenceTransformer:
+    """Minimal stand-in for a SentenceTransformer model."""
+
+    def __init__(self) -> None:
+        self.encoded: list[list[str]] = []
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return 2
+
+    def encode(self, texts: list[str], **kwargs):
+        import numpy as np
+
+        self.encoded.append(list(texts))
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+
+class TestOllamaEmbeddingProvider:
+    """Tests for OllamaEmbeddingProvider."""
+
+    async def test_embed_preserves_input_order(self, httpx_mock: HTTPXMock) -> None:
+        """Test that concurrent requests return embeddings in input order."""
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            prompt = json.loads(request.content)["prompt"]
+            return httpx.Response(200, json={"embedding": [float(len(prompt)), 1.0]})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        provider = OllamaEmbeddingProvider(base_url="http://ollama.test")
+
+        embeddings = await provider.embed(["a", "bbb", "cc"])
+        await provider.close()
+
+        assert embeddings == [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+        assert provider.dimension == 2
+
+    async def test_concurrency_from_environment(self, monkeypatch) -> None:
+        """Test that OLLAMA_EMBED_CONCURRENCY bounds in-flight requests."""
+        monkeypatch.setenv("OLLAMA_EMBED_CONCURRENCY", "3")
+
+        provider = OllamaEmbeddingProvider()
+
+        assert provider._semaphore._value == 3
+
+
+class FakeOpenAIEmbeddings:
+    """Stand-in for the OpenAI embeddings resource; embeds text as [len]."""
+
+    def __init__(self, calls: list[list[str]]) -> None:
+        self.calls = calls
+
+    async def create(self, **kwargs) -> SimpleNamespace:
+        texts = kwargs["input"]
+        self.calls.append(texts)
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(text))]) for text in texts]
+        )
+
+
+class TestOpenAIEmbeddingProvider:
+    """Tests for OpenAIEmbeddingProvider."""
+
+    async def test_embed_splits_into_batches(self, monkeypatch) -> None:
+        """Test that large inputs are split into ordered batches."""
+        monkeypatch.setattr("devscontext.rag.embeddings.OPENAI_EMBED_BATCH_SIZE", 2)
+        calls: list[list[str]] = []
+
+        provider = OpenAIEmbeddingProvider()
+        provider._client = SimpleNamespace(embeddings=FakeOpenAIEmbeddings(calls))
+
+        embeddings = await provider.embed(["a", "bb", "ccc", "dddd", "eeeee"])
+
+        assert calls == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+    async def test_embed_deduplicates_without_query_cache(self) -> None:
+        """Test that bulk embeds send duplicates once and leave the query cache alone."""
+        calls: list[list[str]] = []
+
+        provider = OpenAIEmbeddingProvider()
+        provider._client = SimpleNamespace(embeddings=FakeOpenAIEmbeddings(calls))
+
+        embeddings = await provider.embed(["a", "bb", "a"])
+        await provider.embed(["bb"])
+
+        assert calls == [["a", "bb"], ["bb"]]
+        assert embeddings == [[1.0], [2.0], [1.0]]
+        assert len(provider._query_cache) == 0
+
+
+class TestEmbedQueryCache:
+    """Tests for the embed_query LRU cache."""
+
+    async def test_repeated_query_is_served_from_cache(self, httpx_mock: HTTPXMock) -> None:
+        """Test that a repeated query makes only one request."""
+        httpx_mock.add_response(json={"embedding": [0.5, 0.5]})
+        provider = OllamaEmbeddingProvider(base_url="http://ollama.test")
+
+        first = await provider.embed_query("webhook retries")
+        second = await provider.embed_query("webhook retries")
+        await provider.close()
+
+        assert first == second == [0.5, 0.5]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch) -> None:
+        """Test that the cache is bounded and evicts the oldest entry."""
+        monkeypatch.setattr("devscontext.rag.embeddings.EMBED_QUERY_CACHE_SIZE", 2)
+        provider = OllamaEmbeddingProvider()
+
+        provider._put_cached("a", [1.0])
+        provider._put_cached("b", [2.0])
+        provider._get_cached("a")
+        provider._put_cached("c", [3.0])
+
+        assert provider._get_cached("a") == [1.0]
+        assert provider._get_cached("b") is None
+        assert provider._get_cached("c") == [3.0]
+
+
+class TestLocalEmbeddingProvider:
+    """Tests for LocalEmbeddingProvider."""
+
+    async def test_model_loaded_once_and_warmed_up(self, monkeypatch) -> None:
+        """Test that the model is loaded once and warmed up before use."""
+        pytest.importorskip("numpy")
+        fake = FakeSentenceTransformer()
+        created: list[FakeSentenceTransformer] = []
+
+        def create_model() -> FakeSentenceTransformer:
+            created.append(fake)
+            return fake
+
+        provider = LocalEmbeddingProvider()
+        monkeypatch.setattr(provider, "_create_model", create_model)
+
+        embeddings = await provider.embed(["abc"])
+        await provider.embed(["de"])
+
+        assert len(created) == 1
+        assert fake.encoded[:2] == [["warmup"], ["warmup"]]
+        assert embeddings == [[3.0, 1.0]]
+        assert provider.dimension == 2
+
+    async def test_embed_array_returns_float32_matrix(self, monkeypatch) -> None:
+        """Test that embed_array returns the encoder's array without boxing."""
+        np = pytest.importorskip("numpy")
+        provider = LocalEmbeddingProvider()
+        monkeypatch.setattr(provider, "_create_model", FakeSentenceTransformer)
+
+        embeddings = await provider.embed_array(["abc", "de"])
+
+        assert embeddings.dtype == np.float32
+        assert embeddings.tolist() == [[3.0, 1.0], [2.0, 1.0]]
@@ -0,0 +1,301 @@
+"""Tests for the RAG document index."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from devscontext.rag.index import DocumentIndex, IndexedSection  # noqa: E402
+
+
+def _section(title: str, doc_type: str = "architecture") -> IndexedSection:
+    return IndexedSection(
+        file_path=f"docs/{title.lower()}.md",
+        section_title=title,
+        content=f"Content about {title}",
+        doc_type=doc_type,
+    )
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> Path:
+    """Create a temporary index path."""
+    return tmp_path / "doc_index.json"
+
+
+@pytest.fixture
+def built_index(index_path: Path) -> DocumentIndex:
+    """Create an index with three orthogonal sections."""
+    index = DocumentIndex(str(index_path))
+    index.add_sections(
+        [_section("Alpha"), _section("Beta", "standards"), _section("Gamma", "adr")],
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        "test-model",
+    )
+    return index
+
+
+class TestDocumentIndexPersistence:
+    """Tests for saving and loading the index."""
+
+    def test_save_writes_npy_sidecar(self, built_index: DocumentIndex, index_path: Path) -> None:
+        """Test that embeddings are saved to a .npy file, not the JSON."""
+        built_index.save()
+
+        data = json.loads(index_path.read_text())
+        assert data["format_version"] == 2
+        assert "embeddings" not in data
+
+        embeddings = np.load(index_path.with_suffix(".npy"))
+        assert embeddings.dtype == np.float32
+        assert embeddings.shape == (3, 3)
+
+    def test_round_trip(self, built_index: DocumentIndex, index_path: Path) -> None:
+        """Test that a saved index loads and searches identically."""
+        built_index.save()
+
+        loaded = DocumentIndex(str(index_path))
+        assert loaded.load() is True
+        assert loaded.section_count == 3
+        assert loaded.model == "test-model"
+
+        results = loaded.search([0.0, 1.0, 0.0], top_k=1)
+        assert results[0][0].section_title == "Beta"
+        assert results[0][1] == pytest.approx(1.0)
+
+    def test_load_memory_maps_normalized_fp32(
+        self, built_index: DocumentIndex, index_path: Path
+    ) -> None:
+        """Test that a float32 index is memory-mapped rather than copied."""
+        built_index.save()
+
+        loaded = DocumentIndex(str(index_path))
+        loaded.load()
+
+        assert isinstance(loaded._embeddings_array, np.memmap)
+        assert loaded.search([0.0, 0.0, 1.0], top_k=1)[0][0].section_title == "Gamma"
+
+    def test_round_trip_without_orjson(
+        self, built_index: DocumentIndex, index_path: Path, monkeypatch
+    ) -> None:
+        """Test that metadata falls back to stdlib json when orjson is missing."""
+        monkeypatch.setattr("devscontext.rag.index.orjson", None)
+        built_index.save()
+
+        loaded = DocumentIndex(str(index_path))
+        assert loaded.load() is True
+        assert loaded.section_count == 3
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_load_legacy_json_embeddings(
+        self, index_path: Path, streaming: bool, monkeypatch
+    ) -> None:
+        """Test that version 1 indices with inline embeddings still load."""
+        if streaming:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr("devscontext.rag.index.ijson", None)
+        index_path.write_text(
+            json.dumps(
+                {
+                    "model": "legacy-model",
+                    "dimension": 2,
+                    "sections": [_section("Alpha").to_dict(), _section("Beta").to_dict()],
+                    "embeddings": [[1.0, 0.0], [0.0, 1.0]],
+                }
+            )
+        )
+
+        index = DocumentIndex(str(index_path))
+        assert index.load() is True
+        assert index.model == "legacy-model"
+
+        results = index.search([1.0, 0.0], top_k=1)
+        assert results[0][0].section_title == "Alpha"
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_load_invalid_json_raises(self, index_path: Path, streaming: bool, monkeypatch) -> None:
+        """Test that a corrupted index file raises ValueError."""
+        if streaming:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr("devscontext.rag.index.ijson", None)
+        index_path.write_text('{"model": "m", "sections": [')
+
+        with pytest.raises(ValueError):
+            DocumentIndex(str(index_path)).load()
+
+    def test_delete_removes_sidecar(self, built_index: DocumentIndex, index_path: Path) -> None:
+        """Test that delete removes both the JSON and .npy files."""
+        built_index.save()
+
+        assert built_index.delete() is True
+        assert not index_path.exists()
+        assert not index_path.with_suffix(".npy").exists()
+
+    def test_fp16_compressed_round_trip(self, index_path: Path) -> None:
+        """Test that fp16 indices are saved compressed and load as float32."""
+        index = DocumentIndex(str(index_path), disk_dtype="fp16")
+        index.add_sections([_section("Alpha"), _section("Beta")], [[1.0, 0.0], [0.0, 1.0]], "m")
+        index.save()
+
+        assert json.loads(index_path.read_text())["dtype"] == "fp16"
+        assert index_path.with_suffix(".npz").exists()
+        assert not index_path.with_suffix(".npy").exists()
+
+        loaded = DocumentIndex(str(index_path))
+        loaded.load()
+        assert loaded._embeddings_array.dtype == np.float32
+        assert loaded.search([0.0, 1.0], top_k=1)[0][0].section_title == "Beta"
+
+
+class TestDocumentIndexSearch:
+    """Tests for similarity search."""
+
+    def test_search_orders_by_score(self, built_index: DocumentIndex) -> None:
+        """Test that results are sorted by similarity descending."""
+        results = built_index.search([0.1, 0.9, 0.5], top_k=3)
+
+        assert [s.section_title for s, _ in results] == ["Beta", "Gamma", "Alpha"]
+
+    def test_search_applies_threshold(self, built_index: DocumentIndex) -> None:
+        """Test that results below the threshold are dropped."""
+        results = built_index.search([1.0, 0.1, 0.0], top_k=3, threshold=0.5)
+
+        assert len(results) == 1
+        assert results[0][0].section_title == "Alpha"
+
+    def test_search_limits_to_top_k(self, index_path: Path) -> None:
+        """Test that only the top_k best matches are returned, best first."""
+        index = DocumentIndex(str(index_path))
+        sections = [_section(f"S{i}") for i in range(20)]
+        index.add_sections(sections, [[1.0, i / 10] for i in range(20)], "m")
+
+        results = index.search([1.0, 0.0], top_k=3)
+
+        assert [s.section_title for s, _ in results] == ["S0", "S1", "S2"]
+        assert results[0][1] >= results[1][1] >= results[2][1]
+
+    def test_search_scores_are_cosine_for_unnormalized_rows(self, index_path: Path) -> None:
+        """Test that stored rows are normalized so scores stay in cosine range."""
+        index = DocumentIndex(str(index_path))
+        index.add_sections([_section("Alpha"), _section("Beta")], [[3.0, 4.0], [0.0, 0.0]], "m")
+
+        results = index.search([6.0, 8.0], top_k=2)
+
+        assert results[0][1] == pytest.approx(1.0)
+        assert results[1][1] == pytest.approx(0.0)
+
+    def test_search_zero_query_returns_empty(self, built_index: DocumentIndex) -> None:
+        """Test that a zero vector query returns no results."""
+        assert built_index.search([0.0, 0.0, 0.0]) == []
+
+    def test_search_empty_index_returns_empty(self, index_path: Path) -> None:
+        """Test that searching an empty index returns no results."""
+        assert DocumentIndex(str(index_path)).search([1.0, 0.0]) == []
+
+    def test_get_stats_counts_doc_types(self, built_index: DocumentIndex) -> None:
+        """Test that stats include per-doc-type counts."""
+        stats = built_index.get_stats()
+
+        assert stats["section_count"] == 3
+        assert stats["doc_types"] == {"architecture": 1, "standards": 1, "adr": 1}
+
+
+class TestDocumentIndexInt8:
+    """Tests for int8-quantized embedding storage."""
+
+    def test_int8_storage_and_search(self, index_path: Path) -> None:
+        """Test that int8 storage keeps scores close to float32."""
+        index = DocumentIndex(str(index_path), dtype="int8")
+        index.add_sections(
+            [_section("Alpha"), _section("Beta")], [[0.6, 0.8, 0.0], [0.0, 0.3, 0.9]], "m"
+        )
+
+        results = index.search([0.6, 0.8, 0.0], top_k=2)
+
+        assert index._embeddings_array.dtype == np.int8
+        assert results[0][0].section_title == "Alpha"
+        assert results[0][1] == pytest.approx(1.0, abs=0.01)
+
+    def test_int8_numba_kernel_matches_numpy(self, index_path: Path, monkeypatch) -> None:
+        """Test that the numba int8 kernel scores like the NumPy fallback."""
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        index = DocumentIndex(str(index_path), dtype="int8")
+        index.add_sections([_section(f"S{i}") for i in range(50)], rng.normal(size=(50, 16)), "m")
+        query = rng.normal(size=16).tolist()
+
+        with_kernel = index.search(query, top_k=50, threshold=-1.0)
+        monkeypatch.setattr("devscontext.rag.index._get_int8_kernel", lambda: None)
+        without_kernel = index.search(query, top_k=50, threshold=-1.0)
+
+        assert [s for s, _ in with_kernel] == [s for s, _ in without_kernel]
+        assert [score for _, score in with_kernel] == pytest.approx(
+            [score for _, score in without_kernel], abs=1e-5
+        )
+
+    def test_int8_saves_float32(self, index_path: Path) -> None:
+        """Test that an int8 index is persisted as float32 and reloads."""
+        index = DocumentIndex(str(index_path), dtype="int8")
+        index.add_sections([_section("Alpha")], [[1.0, 2.0]], "m")
+        index.save()
+
+        assert np.load(index_path.with_suffix(".npy")).dtype == np.float32
+
+        loaded = DocumentIndex(str(index_path), dtype="int8")
+        loaded.load()
+        assert loaded.search([1.0, 2.0])[0][1] == pytest.approx(1.0, abs=0.01)
+
+
+class TestDocumentIndexFaiss:
+    """Tests for the optional FAISS search backends."""
+
+    @pytest.mark.parametrize("backend", ["faiss-flat", "faiss-hnsw"])
+    def test_faiss_matches_numpy(self, index_path: Path, backend: str) -> None:
+        """Test that FAISS backends rank results like the NumPy backend."""
+        pytest.importorskip("faiss")
+        index = DocumentIndex(str(index_path), backend=backend)
+        index.add_sections(
+            [_section("Alpha"), _section("Beta"), _section("Gamma")],
+            [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+            "m",
+        )
+
+        results = index.search([0.1, 0.9, 0.5], top_k=5, threshold=0.05)
+
+        assert [s.section_title for s, _ in results] == ["Beta", "Gamma", "Alpha"]
+
+    def test_faiss_index_saved_and_reloaded(self, index_path: Path) -> None:
+        """Test that the FAISS index is written to and read from a sidecar."""
+        pytest.importorskip("faiss")
+        index = DocumentIndex(str(index_path), backend="faiss-flat")
+        index.add_sections([_section("Alpha"), _section("Beta")], [[1.0, 0.0], [0.0, 1.0]], "m")
+        index.save()
+
+        assert index_path.with_suffix(".faiss").exists()
+
+        loaded = DocumentIndex(str(index_path), backend="faiss-flat")
+        loaded.load()
+        assert loaded._faiss_index is not None
+        assert loaded.search([0.0, 1.0], top_k=1)[0][0].section_title == "Beta"
+
+
+class TestIndexedSection:
+    """Tests for IndexedSection."""
+
+    def test_is_slotted_and_frozen(self) -> None:
+        """Test that sections carry no per-instance dict and are immutable."""
+        section = _section("Alpha")
+
+        assert not hasattr(section, "__dict__")
+        with pytest.raises(AttributeError):
+            section.content = "changed"
+
+    def test_dict_round_trip(self) -> None:
+        """Test that to_dict and from_dict are inverses."""
+        section = _section("Alpha")
+
+        assert IndexedSection.from_dict(section.to_dict()) == section
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+
 import pytest
 
 from devscontext.models import (
@@ -146,6 +149,24 @@ class TestPluginRegistryLoadFromConfig:
         assert registry.get_synthesis() is not None
         assert registry.get_synthesis().name == "llm"
 
+    def test_create_adapter_rejects_wrong_config_type(self) -> None:
+        """Test that create_adapter validates the config against the schema."""
+        registry = PluginRegistry()
+        registry.register_builtin_plugins()
+
+        with pytest.raises(TypeError, match="expects config of type JiraConfig"):
+            registry.create_adapter("jira", DocsConfig())
+
+    def test_create_adapter_accepts_config_subclass(self) -> None:
+        """Test that a subclass of the config schema passes validation."""
+        registry = PluginRegistry()
+        registry.register_builtin_plugins()
+
+        class ExtendedDocsConfig(DocsConfig):
+            pass
+
+        assert registry.create_adapter("local_docs", ExtendedDocsConfig()) is not None
+
 
 class TestPluginRegistryPrimarySecondary:
     """Tests for primary/secondary adapter classification."""
@@ -275,3 +296,132 @@ class TestPluginRegistryLifecycle:
 
         # Local docs should be healthy (paths can exist or not)
         assert "local_docs" in results
+
+    @pytest.mark.asyncio
+    async def test_health_check_all_runs_concurrently(self) -> None:
+        """Test that health checks overlap and a failing check reports False."""
+        registry = PluginRegistry()
+        started = asyncio.Event()
+
+        class SlowAdapter:
+            async def health_check(self) -> bool:
+                started.set()
+                await asyncio.sleep(0.01)
+                return True
+
+        class FailingAdapter:
+            async def health_check(self) -> bool:
+                # Only reachable concurrently with SlowAdapter.health_check()
+                await started.wait()
+                raise RuntimeError("boom")
+
+        registry._adapter_instances = {"slow": SlowAdapter(), "failing": FailingAdapter()}
+
+        results = await asyncio.wait_for(registry.health_check_all(), timeout=1.0)
+
+        assert results == {"slow": True, "failing": False}
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_adapters_concurrently(self) -> None:
+        """Test that adapters close in parallel and one failure doesn't block others."""
+        registry = PluginRegistry()
+        closed: list[str] = []
+        started = asyncio.Event()
+
+        class SlowAdapter:
+            async def close(self) -> None:
+                started.set()
+                await asyncio.sleep(0.01)
+                closed.append("slow")
+
+        class FailingAdapter:
+            async def close(self) -> None:
+                # Only reachable concurrently with SlowAdapter.close()
+                await started.wait()
+                raise RuntimeError("boom")
+
+        registry._adapter_instances = {"slow": SlowAdapter(), "failing": FailingAdapter()}
+
+        await asyncio.wait_for(registry.close_all(), timeout=1.0)
+
+        assert closed == ["slow"]
+        assert registry.get_active_adapters() == {}
+
+    @pytest.mark.asyncio
+    async def test_close_all_times_out_hung_adapter(self, monkeypatch) -> None:
+        """Test that a hung adapter close is abandoned after the timeout."""
+        monkeypatch.setattr("devscontext.plugins.registry.ADAPTER_CLOSE_TIMEOUT_SECONDS", 0.01)
+        registry = PluginRegistry()
+
+        class HungAdapter:
+            async def close(self) -> None:
+                await asyncio.Event().wait()
+
+        registry._adapter_instances = {"hung": HungAdapter()}
+
+        await asyncio.wait_for(registry.close_all(), timeout=1.0)
+
+        assert registry.get_active_adapters() == {}
+
+
+class TestPluginRegistryDiscovery:
+    """Tests for entry point discovery."""
+
+    def test_discover_registers_loaded_plugins_and_skips_failures(self, monkeypatch) -> None:
+        """Test that broken entry points are logged and the rest still register."""
+        from devscontext.adapters.local_docs import LocalDocsAdapter
+
+        class FakeEntryPoint:
+            def __init__(self, name: str, target: object) -> None:
+                self.name = name
+                self._target = target
+
+            def load(self) -> object:
+                if isinstance(self._target, Exception):
+                    raise self._target
+                return self._target
+
+        def fake_entry_points(group: str) -> list[FakeEntryPoint]:
+            if group == "devscontext.adapters":
+                return [
+                    FakeEntryPoint("broken", ImportError("missing dependency")),
+                    FakeEntryPoint("local_docs", LocalDocsAdapter),
+                ]
+            return []
+
+        monkeypatch.setattr("importlib.metadata.entry_points", fake_entry_points)
+
+        registry = PluginRegistry()
+        registry.discover_plugins()
+
+        assert registry.list_adapters() == ["local_docs"]
+        assert registry.list_synthesis_plugins() == []
+
+
+class TestPluginRegistryIntrospection:
+    """Tests for config schema introspection."""
+
+    def test_get_config_schema(self) -> None:
+        """Test that registered config schemas are returned by name."""
+        registry = PluginRegistry()
+        registry.register_builtin_plugins()
+
+        assert registry.get_adapter_config_schema("jira") is JiraConfig
+        assert registry.get_synthesis_config_schema("llm") is SynthesisConfig
+
+        with pytest.raises(KeyError):
+            registry.get_adapter_config_schema("unknown")
+
+    def test_get_config_json_schema_is_cached(self) -> None:
+        """Test that config JSON schemas are serialized once and reused."""
+        registry = PluginRegistry()
+        registry.register_builtin_plugins()
+
+        schema = registry.get_adapter_config_json_schema("jira")
+
+        assert json.loads(schema)["title"] == "JiraConfig"
+        assert registry.get_adapter_config_json_schema("jira") is schema
+        # Synthesis plugins sharing a config schema share the cached string
+        assert registry.get_synthesis_config_json_schema(
+            "llm"
+        ) is registry.get_synthesis_config_json_schema("passthrough")
@@ -1,15 +1,29 @@
-"""Tests for the DevsContextCore orchestration."""
+"""Tests for the DevsContextCore orchestration and the MCP server."""
+
+import asyncio
+import os
+import time
+import weakref
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 
+from devscontext import server
 from devscontext.core import DevsContextCore
 from devscontext.models import (
+    CacheConfig,
     DevsContextConfig,
     DocsConfig,
+    PrebuiltContext,
     SourcesConfig,
     TaskContext,
 )
 
+SOFT_TTL = CacheConfig().ttl_seconds
+HARD_TTL = CacheConfig().stale_ttl_seconds
+
 
 @pytest.fixture
 def config() -> DevsContextConfig:
@@ -106,6 +120,30 @@ class TestDevsContextCore:
         result = await core.get_task_context("BYPASS-CACHE", use_cache=False)
         assert result.cached is False
 
+    async def test_use_prebuilt_without_memory_cache(self, core: DevsContextCore) -> None:
+        """Test that use_prebuilt=True still serves pre-built context with use_cache=False."""
+        now = datetime.now(UTC)
+        prebuilt = PrebuiltContext(
+            task_id="PRE-1",
+            synthesized="prebuilt PRE-1",
+            context_quality_score=1.0,
+            built_at=now,
+            expires_at=now + timedelta(hours=1),
+            source_data_hash="hash",
+        )
+
+        async def get_prebuilt(task_id: str) -> PrebuiltContext:
+            return prebuilt
+
+        core._get_prebuilt_context = get_prebuilt  # type: ignore[method-assign]
+
+        result = await core.get_task_context("PRE-1", use_cache=False, use_prebuilt=True)
+        assert result.prebuilt is True
+        assert result.synthesized == "prebuilt PRE-1"
+
+        result = await core.get_task_context("PRE-1", use_cache=False)
+        assert result.prebuilt is False
+
     async def test_get_status_returns_formatted_string(self, core: DevsContextCore) -> None:
         """Test that get_status returns a formatted status string."""
         result = await core.get_status()
@@ -145,3 +183,402 @@ class TestDevsContextCore:
 
         assert "DevsContext v" in result
         assert "Demo Mode" in result
+
+    async def test_search_context_sources_is_list(self, core: DevsContextCore) -> None:
+        """Test that search_context always returns sources as a list of strings."""
+        result = await core.search_context("webhooks")
+
+        assert result["sources"] == ["none"]
+        assert result["result_count"] == 0
+
+    async def test_search_context_demo_mode_sources_is_list(self) -> None:
+        """Test that demo search results use the same sources schema."""
+        core = DevsContextCore(demo_mode=True)
+
+        result = await core.search_context("webhooks")
+
+        assert result["sources"] == ["jira", "fireflies", "docs"]
+
+
+def make_task_context(task_id: str, synthesized: str) -> TaskContext:
+    """Build a minimal TaskContext."""
+    return TaskContext(
+        task_id=task_id,
+        synthesized=synthesized,
+        fetch_duration_ms=0,
+        synthesized_at=datetime.now(UTC),
+    )
+
+
+class FakeCore:
+    """Stand-in for DevsContextCore that records task context fetches."""
+
+    def __init__(self, cache_config: CacheConfig | None = None) -> None:
+        self.cache_config = cache_config or CacheConfig()
+        self.fetches: list[str] = []
+        self.fetch_kwargs: list[dict[str, bool | None]] = []
+        self.closed = False
+
+    async def get_task_context(
+        self, task_id: str, use_cache: bool = True, use_prebuilt: bool | None = None
+    ) -> TaskContext:
+        self.fetches.append(task_id)
+        self.fetch_kwargs.append({"use_cache": use_cache, "use_prebuilt": use_prebuilt})
+        return make_task_context(task_id, f"fresh {task_id} #{len(self.fetches)}")
+
+    async def get_status(self) -> str:
+        return "status ok"
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class SlowCore(FakeCore):
+    """FakeCore whose task context fetches wait until released, with a tiny deadline."""
+
+    def __init__(self, cache_config: CacheConfig | None = None) -> None:
+        super().__init__(cache_config or CacheConfig(fetch_timeout_seconds=0.01))
+        self.release = asyncio.Event()
+
+    async def get_task_context(
+        self, task_id: str, use_cache: bool = True, use_prebuilt: bool | None = None
+    ) -> TaskContext:
+        await self.release.wait()
+        return await super().get_task_context(task_id, use_cache, use_prebuilt)
+
+
+@pytest.fixture(autouse=True)
+async def server_state(monkeypatch: pytest.MonkeyPatch):
+    """Give each test a fresh server: no core, empty caches, fixed config version."""
+    fetch_tasks: set[asyncio.Task[TaskContext]] = set()
+    monkeypatch.setattr(server, "_fetch_tasks", fetch_tasks)
+    monkeypatch.setattr(server, "_task_context_cache", OrderedDict())
+    monkeypatch.setattr(server, "_task_context_locks", weakref.WeakValueDictionary())
+    monkeypatch.setattr(server, "_refresh_tasks", {})
+    monkeypatch.setattr(server, "_config_version", "v1")
+    monkeypatch.setattr(server, "_config_path", None)
+    monkeypatch.setattr(server, "_config_mtime", None)
+    monkeypatch.setattr(server, "_config_checked_at", 0.0)
+    monkeypatch.setattr(server, "_core", None)
+    monkeypatch.setattr(server, "_core_warmup", None)
+    monkeypatch.setattr(server, "_core_users", {})
+    monkeypatch.setattr(server, "_retired_cores", set())
+    monkeypatch.setattr(server, "_core_reload_lock", asyncio.Lock())
+    monkeypatch.setattr(server, "_demo_mode", False)
+    monkeypatch.setattr(server, "CONFIG_CHECK_INTERVAL_SECONDS", 0.0)
+    yield server
+    for task in fetch_tasks:
+        task.cancel()
+    await asyncio.gather(*fetch_tasks, return_exceptions=True)
+
+
+def store_aged(task_id: str, synthesized: str, age: float) -> None:
+    """Put a task context in the server cache as if stored age seconds ago."""
+    key = server._task_context_key(task_id)
+    server._task_context_cache[key] = (
+        time.monotonic() - age,
+        make_task_context(task_id, synthesized),
+    )
+
+
+async def get_task_context_text(core: FakeCore, task_id: str, refresh: bool = False) -> str:
+    """Call the get_task_context handler and return its joined text."""
+    response = await server._handle_get_task_context(
+        core, {"task_id": task_id, "refresh": refresh}, time.perf_counter_ns()
+    )
+    return "".join(block.text for block in response)
+
+
+class TestTaskContextCache:
+    """Tests for the server's stale-while-revalidate task context cache."""
+
+    async def test_fresh_hit_is_served_without_fetch(self) -> None:
+        """Test that an entry within the soft TTL is served as-is."""
+        core = FakeCore()
+        store_aged("T-1", "cached T-1", age=0)
+
+        assert await get_task_context_text(core, "T-1") == "cached T-1"
+        assert core.fetches == []
+        assert server._refresh_tasks == {}
+
+    async def test_soft_expired_hit_schedules_one_refresh(self) -> None:
+        """Test that a stale entry is served while a single refresh runs."""
+        core = FakeCore()
+        store_aged("T-1", "cached T-1", age=SOFT_TTL + 1)
+
+        first = await get_task_context_text(core, "T-1")
+        second = await get_task_context_text(core, "T-1")
+
+        assert first == second == "cached T-1"
+        assert len(server._refresh_tasks) == 1
+        await asyncio.gather(*server._refresh_tasks.values())
+
+        assert core.fetches == ["T-1"]
+        assert core.fetch_kwargs == [{"use_cache": False, "use_prebuilt": True}]
+        assert await get_task_context_text(core, "T-1") == "fresh T-1 #1"
+
+    async def test_ttls_come_from_cache_config(self) -> None:
+        """Test that the soft and hard TTLs follow the core's CacheConfig."""
+        core = FakeCore(CacheConfig(ttl_minutes=1, stale_ttl_minutes=2))
+
+        store_aged("T-1", "cached T-1", age=61)
+        assert await get_task_context_text(core, "T-1") == "cached T-1"
+        assert list(server._refresh_tasks) == ["T-1"]
+        await asyncio.gather(*server._refresh_tasks.values())
+
+        store_aged("T-2", "cached T-2", age=121)
+        assert await get_task_context_text(core, "T-2") == "fresh T-2 #2"
+
+    async def test_disabled_cache_always_fetches(self) -> None:
+        """Test that cache.enabled=False skips the SWR cache entirely."""
+        core = FakeCore(CacheConfig(enabled=False))
+        store_aged("T-1", "cached T-1", age=0)
+
+        assert await get_task_context_text(core, "T-1") == "fresh T-1 #1"
+        assert await get_task_context_text(core, "T-1") == "fresh T-1 #2"
+        assert list(server._task_context_cache) == [server._task_context_key("T-1")]
+        assert server._task_context_cache[server._task_context_key("T-1")][1].synthesized == (
+            "cached T-1"
+        )
+
+    async def test_hard_expired_entry_is_dropped_and_refetched(self) -> None:
+        """Test that an entry past the hard TTL is never served."""
+        core = FakeCore()
+        store_aged("T-1", "cached T-1", age=HARD_TTL + 1)
+
+        assert await get_task_context_text(core, "T-1") == "fresh T-1 #1"
+        assert core.fetches == ["T-1"]
+
+    async def test_concurrent_refreshes_are_deduplicated(self) -> None:
+        """Test that repeated scheduling and concurrent misses share one fetch."""
+        core = FakeCore()
+
+        server._schedule_task_context_refresh(core, "T-1")
+        server._schedule_task_context_refresh(core, "T-1")
+        assert len(server._refresh_tasks) == 1
+        await asyncio.gather(*server._refresh_tasks.values())
+        assert core.fetches == ["T-1"]
+
+        await asyncio.gather(get_task_context_text(core, "T-2"), get_task_context_text(core, "T-2"))
+        assert core.fetches == ["T-1", "T-2"]
+
+    async def test_refresh_timeout_serves_cached_with_banner(self) -> None:
+        """Test that a timed-out refresh falls back to a live cached entry."""
+        core = SlowCore()
+        store_aged("T-1", "cached T-1", age=SOFT_TTL + 1)
+
+        text = await get_task_context_text(core, "T-1", refresh=True)
+
+        assert text == server._STALE_BANNER + "cached T-1"
+
+    async def test_refresh_timeout_ignores_hard_expired_entry(self) -> None:
+        """Test that a timed-out refresh never falls back past the hard TTL."""
+        core = SlowCore()
+        store_aged("T-1", "cached T-1", age=HARD_TTL + 1)
+
+        text = await get_task_context_text(core, "T-1", refresh=True)
+
+        assert text == server._PENDING_TEMPLATE.format(task_id="T-1", timeout=0.01)
+        assert server._task_context_cache == {}
+
+    async def test_timed_out_fetch_finishes_and_fills_cache(self) -> None:
+        """Test that a cold fetch outlives the request that timed out on it."""
+        core = SlowCore()
+
+        text = await get_task_context_text(core, "T-1")
+        assert "still being built" in text
+        assert "credentials" not in text
+        assert len(server._fetch_tasks) == 1
+        assert server._core_users == {core: 1}
+
+        core.release.set()
+        await asyncio.gather(*server._fetch_tasks)
+
+        assert server._core_users == {}
+        assert await get_task_context_text(core, "T-1") == "fresh T-1 #1"
+        assert core.fetches == ["T-1"]
+
+    async def test_timeout_without_cache_cancels_fetch(self) -> None:
+        """Test that a timed-out fetch is not kept when its result can't be cached."""
+        core = SlowCore(CacheConfig(enabled=False, fetch_timeout_seconds=0.01))
+
+        text = await get_task_context_text(core, "T-1")
+        (fetch,) = server._fetch_tasks
+        await asyncio.gather(fetch, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert text == server._TIMEOUT_TEMPLATE.format(task_id="T-1", timeout=0.01)
+        assert fetch.cancelled()
+        assert server._fetch_tasks == set()
+        assert server._core_users == {}
+
+    async def test_fetch_error_returns_error_response(self) -> None:
+        """Test that a failing fetch is reported instead of raised."""
+
+        class FailingCore(FakeCore):
+            async def get_task_context(
+                self, task_id: str, use_cache: bool = True, use_prebuilt: bool | None = None
+            ) -> TaskContext:
+                raise RuntimeError("jira down")
+
+        text = await get_task_context_text(FailingCore(), "T-1")
+
+        assert text.startswith("Error fetching context for T-1: jira down")
+
+    def test_store_evicts_least_recently_used(self, monkeypatch) -> None:
+        """Test that the cache is bounded and a hit refreshes recency."""
+        monkeypatch.setattr(server, "TASK_CONTEXT_CACHE_MAX_SIZE", 2)
+        cache_config = CacheConfig()
+        for task_id in ("T-1", "T-2"):
+            server._store_task_context(
+                server._task_context_key(task_id), make_task_context(task_id, task_id)
+            )
+
+        assert server._get_cached_task_context("T-1", cache_config) is not None
+        server._store_task_context(server._task_context_key("T-3"), make_task_context("T-3", "T-3"))
+
+        assert server._get_cached_task_context("T-2", cache_config) is None
+        assert server._get_cached_task_context("T-1", cache_config) is not None
+        assert server._get_cached_task_context("T-3", cache_config) is not None
+        assert len(server._task_context_cache) == 2
+
+
+class TestCoreWarmup:
+    """Tests for building the core in a worker thread at startup."""
+
+    async def test_concurrent_first_calls_share_one_core(self, monkeypatch) -> None:
+        """Test that calls arriving during warmup wait for it instead of building a core."""
+        built: list[FakeCore] = []
+
+        def build_core(demo_mode: bool = False) -> FakeCore:
+            time.sleep(0.05)
+            built.append(FakeCore())
+            return built[-1]
+
+        monkeypatch.setattr("devscontext.core.DevsContextCore", build_core)
+        monkeypatch.setattr(server, "_demo_mode", True)
+        monkeypatch.setattr(
+            server, "_core_warmup", asyncio.create_task(asyncio.to_thread(server.get_core))
+        )
+
+        responses = await asyncio.gather(
+            server.call_tool("devscontext_status", {}),
+            server.call_tool("devscontext_status", {}),
+        )
+
+        assert len(built) == 1
+        assert [r[0].text for r in responses] == ["status ok", "status ok"]
+
+
+def rewrite_config(path: Path, text: str) -> None:
+    """Rewrite a config file and move its mtime forward."""
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestConfigReload:
+    """Tests for rebuilding the core when the config file changes."""
+
+    @pytest.fixture
+    def config_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point the server at a temporary config file and build FakeCores from it."""
+        path = tmp_path / ".devscontext.yaml"
+        path.write_text("cache:\n  ttl_minutes: 15\n")
+        monkeypatch.setattr("devscontext.config.find_config_file", lambda: path)
+        monkeypatch.setattr("devscontext.core.DevsContextCore", lambda config: FakeCore())
+        server.get_core()
+        return path
+
+    async def test_config_change_uses_new_cache_keys(self, config_file) -> None:
+        """Test that entries cached under the old config are not served after a change."""
+        old_core = server.get_core()
+        old_key = server._task_context_key("T-1")
+        server._store_task_context(old_key, make_task_context("T-1", "old config"))
+
+        rewrite_config(config_file, "cache:\n  ttl_minutes: 30\n")
+        response = await server.call_tool("get_task_context", {"task_id": "T-1"})
+
+        new_core = server.get_core()
+        assert new_core is not old_core
+        assert server._task_context_key("T-1") != old_key
+        assert response[0].text == "fresh T-1 #1"
+        assert new_core.fetches == ["T-1"]
+        assert old_core.closed
+
+    async def test_old_core_stays_open_while_in_use(self, config_file) -> None:
+        """Test that a reload defers closing the old core until its calls finish."""
+        old_core = server.get_core()
+        entered, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_status() -> str:
+            entered.set()
+            await release.wait()
+            return "status ok"
+
+        old_core.get_status = slow_status
+        in_flight = asyncio.create_task(server.call_tool("devscontext_status", {}))
+        await entered.wait()
+
+        rewrite_config(config_file, "cache:\n  ttl_minutes: 30\n")
+        await server.call_tool("get_task_context", {"task_id": "T-1"})
+
+        assert server.get_core() is not old_core
+        assert not old_core.closed
+
+        release.set()
+        assert (await in_flight)[0].text == "status ok"
+        assert old_core.closed
+
+    async def test_invalid_config_keeps_current_core(self, config_file) -> None:
+        """Test that a config that fails to load does not replace the core."""
+        core = server.get_core()
+        rewrite_config(config_file, "cache: [unclosed\n")
+
+        await server.call_tool("get_task_context", {"task_id": "T-1"})
+
+        assert server.get_core() is core
+        assert not core.closed
+
+
+class TestCallTool:
+    """Tests for MCP tool call routing."""
+
+    @pytest.mark.parametrize(
+        ("tool", "arguments", "expected"),
+        [
+            ("get_task_context", {"task_id": "T-1"}, {"task_id": "T-1", "refresh": False}),
+            ("get_standards", {}, {"area": None}),
+            ("search_context", {"query": "retries"}, {"query": "retries"}),
+        ],
+    )
+    async def test_schema_defaults_fill_omitted_arguments(
+        self, monkeypatch, tool: str, arguments: dict, expected: dict
+    ) -> None:
+        """Test that optional arguments left out by the client reach handlers as defaults."""
+        received: list[dict] = []
+
+        async def record(core, args, start_ns):
+            received.append(args)
+            return server._text_response("ok")
+
+        monkeypatch.setattr(server, "_core", FakeCore())
+        monkeypatch.setitem(server._HANDLERS, tool, record)
+
+        await server.call_tool(tool, arguments)
+
+        assert received == [expected]
+
+    async def test_non_string_query_reaches_handler_error_path(self, monkeypatch) -> None:
+        """Test that a malformed query is reported by the handler, not raised by logging."""
+
+        class FailingSearchCore(FakeCore):
+            async def search_context(self, query):
+                raise TypeError("query must be a string")
+
+        monkeypatch.setattr(server, "_core", FailingSearchCore())
+        monkeypatch.setattr(server.logger, "isEnabledFor", lambda level: True)
+
+        response = await server.call_tool("search_context", {"query": 42})
+
+        assert response[0].text.startswith("Error searching for '42'")
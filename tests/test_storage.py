@@ -1,5 +1,7 @@
 """Tests for the pre-built context storage."""
 
+import asyncio
+import sqlite3
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -54,6 +56,42 @@ class TestPrebuiltContextStorage:
         # Should be able to close without error
         await storage.close()
 
+    async def test_initialize_is_idempotent(
+        self, temp_db_path: str, sample_context: PrebuiltContext
+    ) -> None:
+        """Test that re-initializing an existing database keeps its rows."""
+        storage = PrebuiltContextStorage(temp_db_path)
+        await storage.initialize()
+        await storage.store(sample_context)
+        await storage.close()
+
+        storage = PrebuiltContextStorage(temp_db_path)
+        await storage.initialize()
+        retrieved = await storage.get(sample_context.task_id)
+        found = await storage.search("sample")
+        await storage.close()
+
+        assert retrieved is not None
+        assert found == [sample_context.task_id]
+
+    async def test_initialize_enables_wal(self, storage: PrebuiltContextStorage) -> None:
+        """Test that the connection uses write-ahead logging."""
+        assert storage._conn is not None
+        cursor = await storage._conn.execute("PRAGMA journal_mode")
+
+        assert (await cursor.fetchone()) == ("wal",)
+
+    async def test_expiry_queries_use_index(self, storage: PrebuiltContextStorage) -> None:
+        """Test that expires_at filters search an index instead of scanning."""
+        assert storage._conn is not None
+        cursor = await storage._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM prebuilt_context WHERE expires_at < ?",
+            ("2024-01-01",),
+        )
+        plan = " ".join(row[-1] for row in await cursor.fetchall())
+
+        assert "idx_prebuilt_expires" in plan
+
     async def test_store_and_get(
         self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
     ) -> None:
@@ -69,6 +107,77 @@ class TestPrebuiltContextStorage:
         assert retrieved.gaps == ["No acceptance criteria defined"]
         assert retrieved.source_data_hash == "abc123"
 
+    async def test_store_and_get_without_orjson(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext, monkeypatch
+    ) -> None:
+        """Test that list columns round-trip with the stdlib json fallback."""
+        monkeypatch.setattr("devscontext.storage.orjson", None)
+
+        await storage.store(sample_context)
+        retrieved = await storage.get("TEST-123")
+
+        assert retrieved is not None
+        assert retrieved.sources_used == sample_context.sources_used
+        assert retrieved.gaps == sample_context.gaps
+
+    async def test_get_serves_repeat_lookups_from_memory(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
+    ) -> None:
+        """Test that an unchanged row is not re-read from the database."""
+        await storage.store(sample_context)
+        first = await storage.get("TEST-123")
+
+        assert await storage.get("TEST-123") is first
+
+    async def test_get_misses_memory_after_other_connection_commits(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext, temp_db_path: str
+    ) -> None:
+        """Test that a commit by another process invalidates the memory cache."""
+        await storage.store(sample_context)
+        first = await storage.get("TEST-123")
+
+        other = sqlite3.connect(temp_db_path)
+        other.execute(
+            "UPDATE prebuilt_context SET synthesized = 'Edited' WHERE task_id = 'TEST-123'"
+        )
+        other.commit()
+        other.close()
+
+        second = await storage.get("TEST-123")
+        assert second is not first
+        assert second is not None and second.synthesized == "Edited"
+
+    async def test_concurrent_reads_share_read_connection(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
+    ) -> None:
+        """Test that concurrent gets and searches on worker threads all succeed."""
+        await storage.store(sample_context)
+
+        results = await asyncio.gather(
+            *(storage.get("TEST-123") for _ in range(20)),
+            *(storage.search("test") for _ in range(20)),
+        )
+
+        assert all(r is not None for r in results[:20])
+
+    async def test_get_cache_invalidated_by_writes(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext, temp_db_path: str
+    ) -> None:
+        """Test that commits from this or another connection are seen by get."""
+        await storage.store(sample_context)
+        await storage.get("TEST-123")
+
+        await storage.store(sample_context.model_copy(update={"synthesized": "Updated"}))
+        updated = await storage.get("TEST-123")
+        assert updated is not None and updated.synthesized == "Updated"
+
+        other = sqlite3.connect(temp_db_path)
+        other.execute("DELETE FROM prebuilt_context WHERE task_id = 'TEST-123'")
+        other.commit()
+        other.close()
+
+        assert await storage.get("TEST-123") is None
+
     async def test_get_nonexistent_returns_none(self, storage: PrebuiltContextStorage) -> None:
         """Test that getting a non-existent task returns None."""
         result = await storage.get("NONEXISTENT-999")
@@ -100,6 +209,49 @@ class TestPrebuiltContextStorage:
         assert retrieved.context_quality_score == 0.9
         assert retrieved.source_data_hash == "def456"
 
+    async def test_store_many(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
+    ) -> None:
+        """Test storing several contexts in one call."""
+        other = sample_context.model_copy(update={"task_id": "TEST-456"})
+
+        await storage.store_many([sample_context, other])
+
+        assert (await storage.get("TEST-123")) is not None
+        assert (await storage.get("TEST-456")) is not None
+        assert (await storage.get_stats())["total"] == 2
+
+    async def test_store_many_empty_is_noop(self, storage: PrebuiltContextStorage) -> None:
+        """Test that storing an empty batch does nothing."""
+        await storage.store_many([])
+
+        assert await storage.list_all() == []
+
+    async def test_search_matches_synthesized_text(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
+    ) -> None:
+        """Test that full-text search finds contexts by their content."""
+        webhook = sample_context.model_copy(
+            update={"task_id": "TEST-456", "synthesized": "Retry failed webhooks with backoff."}
+        )
+        await storage.store_many([sample_context, webhook])
+
+        assert await storage.search("webhook retries") == ["TEST-456"]
+        assert await storage.search('"unbalanced') == []
+
+    async def test_search_reflects_replaced_content(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
+    ) -> None:
+        """Test that replacing or deleting a context updates the index."""
+        await storage.store(sample_context)
+        await storage.store(sample_context.model_copy(update={"synthesized": "Payments only."}))
+
+        assert await storage.search("sample") == []
+        assert await storage.search("payments") == ["TEST-123"]
+
+        await storage.delete("TEST-123")
+        assert await storage.search("payments") == []
+
     async def test_is_stale_with_matching_hash(
         self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
     ) -> None:
@@ -178,6 +330,38 @@ class TestPrebuiltContextStorage:
         # Active should still exist
         assert await storage.get("ACTIVE-1") is not None
 
+    async def test_delete_expired_reclaims_pages(self, storage: PrebuiltContextStorage) -> None:
+        """Test that a large expiry sweep returns free pages to the file."""
+        now = datetime.now(UTC)
+        await storage.store_many(
+            [
+                PrebuiltContext(
+                    task_id=f"EXPIRED-{i}",
+                    synthesized="x" * 4000,
+                    sources_used=[],
+                    context_quality_score=0.5,
+                    gaps=[],
+                    built_at=now - timedelta(hours=48),
+                    expires_at=now - timedelta(hours=24),
+                    source_data_hash="old_hash",
+                )
+                for i in range(60)
+            ]
+        )
+        assert storage._conn is not None
+        cursor = await storage._conn.execute("PRAGMA auto_vacuum")
+        assert (await cursor.fetchone()) == (2,)  # INCREMENTAL
+
+        assert await storage.delete_expired() == 60
+
+        cursor = await storage._conn.execute("PRAGMA freelist_count")
+        (free_pages,) = await cursor.fetchone()
+        assert free_pages == 0
+
+    async def test_optimize(self, storage: PrebuiltContextStorage) -> None:
+        """Test that optimize runs on an initialized database."""
+        await storage.optimize()
+
     async def test_list_all(
         self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
     ) -> None:
@@ -204,6 +388,56 @@ class TestPrebuiltContextStorage:
         assert "TEST-123" in task_ids
         assert "TEST-456" in task_ids
 
+    async def test_list_all_reports_gaps_count(
+        self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
+    ) -> None:
+        """Test that list_all reports the number of gaps per context."""
+        await storage.store(sample_context.model_copy(update={"gaps": ["a", "b", "c"]}))
+
+        assert (await storage.list_all())[0]["gaps_count"] == 3
+
+    async def test_initialize_migrates_legacy_schema(self, temp_db_path: str) -> None:
+        """Test that legacy databases get gaps_count and integer timestamps."""
+        conn = sqlite3.connect(temp_db_path)
+        conn.execute(
+            """
+            CREATE TABLE prebuilt_context (
+                task_id TEXT PRIMARY KEY, synthesized TEXT NOT NULL,
+                sources_used TEXT NOT NULL, context_quality_score REAL NOT NULL,
+                gaps TEXT NOT NULL, built_at TEXT NOT NULL, expires_at TEXT NOT NULL,
+                source_data_hash TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO prebuilt_context VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                "OLD-1",
+                "text",
+                "[]",
+                0.5,
+                '["x", "y"]',
+                "2024-01-01T00:00:00+00:00",
+                "2099-01-01T00:00:00+00:00",
+                "h",
+            ),
+        )
+        conn.commit()
+        conn.close()
+
+        storage = PrebuiltContextStorage(temp_db_path)
+        await storage.initialize()
+        listed = await storage.list_all()
+        migrated = await storage.get("OLD-1")
+        found = await storage.search("text")
+        await storage.close()
+
+        assert listed[0]["gaps_count"] == 2
+        assert found == ["OLD-1"]
+        assert migrated is not None
+        assert migrated.built_at == datetime(2024, 1, 1, tzinfo=UTC)
+        assert not migrated.is_expired()
+
     async def test_get_stats(
         self, storage: PrebuiltContextStorage, sample_context: PrebuiltContext
     ) -> None:
@@ -217,6 +451,18 @@ class TestPrebuiltContextStorage:
         assert stats["avg_quality"] == 0.8
         assert stats["last_build"] is not None
 
+    async def test_get_stats_empty(self, storage: PrebuiltContextStorage) -> None:
+        """Test statistics for an empty database."""
+        stats = await storage.get_stats()
+
+        assert stats == {
+            "total": 0,
+            "active": 0,
+            "expired": 0,
+            "avg_quality": 0.0,
+            "last_build": None,
+        }
+
 
 class TestPrebuiltContextModel:
     """Tests for PrebuiltContext model."""
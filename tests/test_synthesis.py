@@ -1,10 +1,18 @@
 """Tests for the synthesis module."""
 
+import asyncio
+import json
+import sys
 from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
+from pydantic import ValidationError
+from pytest_httpx import HTTPXMock
 
+from devscontext.constants import LLM_SDK_TIMEOUT_SECONDS
 from devscontext.models import (
     DocsContext,
     DocSection,
@@ -18,10 +26,18 @@ from devscontext.models import (
 )
 from devscontext.plugins.base import SourceContext
 from devscontext.synthesis import (
+    SYNTHESIS_PROMPT,
     AnthropicProvider,
+    LLMProvider,
     OllamaProvider,
     OpenAIProvider,
+    PassthroughSynthesisPlugin,
     SynthesisEngine,
+    _collect_typed_contexts,
+    _fallback_reason,
+    _partition_docs,
+    _render_prompt,
+    create_http_client,
     create_provider,
 )
 
@@ -203,6 +219,40 @@ class TestCreateProvider:
             create_provider(config)
 
 
+class TestRenderPrompt:
+    """Tests for precompiled prompt rendering."""
+
+    def test_matches_str_format(self) -> None:
+        """Test that the default prompt renders exactly like str.format."""
+        values = {"task_id": "PROJ-1", "title": "Add {retries}", "raw_data": "data {x}"}
+
+        assert _render_prompt(SYNTHESIS_PROMPT, **values) == SYNTHESIS_PROMPT.format(**values)
+
+    def test_instructions_and_raw_data_precede_task(self) -> None:
+        """Test that the task line is rendered after the instructions and raw data."""
+        first = _render_prompt(SYNTHESIS_PROMPT, task_id="A-1", title="One", raw_data="x")
+        second = _render_prompt(SYNTHESIS_PROMPT, task_id="B-2", title="Two", raw_data="x")
+
+        first_prefix = first.partition("Task: A-1")[0]
+
+        assert first_prefix == second.partition("Task: B-2")[0]
+        assert "### Related Work" in first_prefix
+        assert first_prefix.endswith("---\nx\n---\n\n")
+
+    def test_escaped_braces(self) -> None:
+        """Test that doubled braces render as literal braces."""
+        assert _render_prompt("{{json}} {task_id}", task_id="T-1") == "{json} T-1"
+
+    def test_format_spec_falls_back(self) -> None:
+        """Test that templates with format specs still render via str.format."""
+        assert _render_prompt("{task_id:>5}", task_id="T") == "    T"
+
+    def test_missing_value_raises(self) -> None:
+        """Test that an unknown placeholder raises KeyError like str.format."""
+        with pytest.raises(KeyError):
+            _render_prompt("{unknown}", task_id="T")
+
+
 class TestSynthesisEngine:
     """Tests for SynthesisEngine."""
 
@@ -253,7 +303,9 @@ class TestSynthesisEngine:
         sample_docs_context: DocsContext,
     ) -> None:
         """Test coding standards formatting."""
-        result = synthesis_engine._format_coding_standards(sample_docs_context)
+        result = synthesis_engine._format_coding_standards(
+            _partition_docs(sample_docs_context.sections)["standards"]
+        )
 
         assert "Authentication Guide" in result
         assert "docs/auth.md" in result
@@ -264,7 +316,7 @@ class TestSynthesisEngine:
         synthesis_engine: SynthesisEngine,
     ) -> None:
         """Test coding standards formatting with empty sections."""
-        result = synthesis_engine._format_coding_standards(DocsContext())
+        result = synthesis_engine._format_coding_standards([])
 
         assert result == ""
 
@@ -283,12 +335,56 @@ class TestSynthesisEngine:
                 ),
             ]
         )
-        result = synthesis_engine._format_architecture_docs(docs_context)
+        result = synthesis_engine._format_architecture_docs(docs_context.sections)
 
         assert "ARCHITECTURE DOCS" in result
         assert "Webhook Flow" in result
         assert "SQS queue" in result
 
+    def test_partition_docs_groups_in_order(self) -> None:
+        """Test that sections are bucketed by type and ADRs join other docs."""
+        sections = [
+            DocSection(file_path="a.md", content="a", doc_type="adr"),
+            DocSection(file_path="b.md", content="b", doc_type="architecture"),
+            DocSection(file_path="c.md", content="c", doc_type="other"),
+            DocSection(file_path="d.md", content="d", doc_type="standards"),
+        ]
+
+        by_type = _partition_docs(sections)
+
+        assert [s.file_path for s in by_type["architecture"]] == ["b.md"]
+        assert [s.file_path for s in by_type["standards"]] == ["d.md"]
+        assert [s.file_path for s in by_type["other"]] == ["a.md", "c.md"]
+
+    def test_prompts_share_docs_prefix_across_tasks(
+        self,
+        synthesis_engine: SynthesisEngine,
+        sample_jira_context: JiraContext,
+        sample_docs_context: DocsContext,
+    ) -> None:
+        """Test that prompts for different tasks with the same docs share the docs block."""
+        other_ticket = sample_jira_context.ticket.model_copy(
+            update={"ticket_id": "PROJ-999", "title": "Rotate API keys"}
+        )
+        other_jira = sample_jira_context.model_copy(update={"ticket": other_ticket})
+
+        first = synthesis_engine._build_prompt(
+            "PROJ-123", {"jira": sample_jira_context, "docs": sample_docs_context}
+        )
+        second = synthesis_engine._build_prompt(
+            "PROJ-999", {"jira": other_jira, "docs": sample_docs_context}
+        )
+        assert first is not None
+        assert second is not None
+
+        docs_block = synthesis_engine._build_raw_data(None, None, sample_docs_context)
+        before_docs, found, _ = first.partition(docs_block)
+        shared = before_docs + docs_block
+
+        assert found
+        assert second.startswith(shared)
+        assert "PROJ-123" not in shared
+
     def test_build_raw_data_combines_all_sources(
         self,
         synthesis_engine: SynthesisEngine,
@@ -308,6 +404,39 @@ class TestSynthesisEngine:
         assert "CODING STANDARDS" in result  # standards doc_type maps here
         assert "PROJ-123" in result
 
+    def test_build_raw_data_puts_stable_sources_first(
+        self,
+        synthesis_engine: SynthesisEngine,
+        sample_jira_context: JiraContext,
+        sample_meeting_context: MeetingContext,
+        sample_docs_context: DocsContext,
+    ) -> None:
+        """Test that repo docs precede the ticket and meetings."""
+        result = synthesis_engine._build_raw_data(
+            jira_context=sample_jira_context,
+            meeting_context=sample_meeting_context,
+            docs_context=sample_docs_context,
+        )
+
+        assert (
+            result.index("CODING STANDARDS")
+            < result.index("JIRA TICKET")
+            < result.index("MEETING TRANSCRIPTS")
+        )
+
+    def test_collect_typed_contexts_skips_empty_and_unknown(
+        self,
+        sample_jira_context: JiraContext,
+    ) -> None:
+        """Test that typed contexts are keyed by slot and empty ones dropped."""
+        contexts = make_source_contexts(jira_context=sample_jira_context)
+        contexts["empty"] = SourceContext(source_name="empty", source_type="meeting")
+        contexts["custom"] = SourceContext(
+            source_name="custom", source_type="other", data={"x": 1}, raw_text="x"
+        )
+
+        assert _collect_typed_contexts(contexts) == {"jira": sample_jira_context}
+
     def test_build_raw_data_empty_context(
         self,
         synthesis_engine: SynthesisEngine,
@@ -397,6 +526,191 @@ class TestSynthesisEngine:
         assert "Synthesized content" in result
         mock_provider.generate.assert_called_once()
 
+    async def test_synthesize_reuses_result_for_identical_prompt(
+        self,
+        sample_jira_context: JiraContext,
+    ) -> None:
+        """Test that unchanged source data does not call the LLM again."""
+        config = SynthesisConfig(provider="anthropic", model="claude-haiku-4-5", api_key="k")
+        engine = SynthesisEngine(config)
+        mock_provider = AsyncMock()
+        mock_provider.generate.return_value = "Synthesized content"
+        engine._provider = mock_provider
+        contexts = make_source_contexts(jira_context=sample_jira_context)
+
+        first = await engine.synthesize(task_id="PROJ-123", source_contexts=contexts)
+        second = await engine.synthesize(task_id="PROJ-123", source_contexts=contexts)
+
+        assert first == second == "Synthesized content"
+        mock_provider.generate.assert_called_once()
+
+    async def test_synthesize_does_not_cache_fallback(
+        self,
+        sample_jira_context: JiraContext,
+    ) -> None:
+        """Test that a failed LLM call is retried on the next synthesis."""
+        config = SynthesisConfig(provider="anthropic", model="claude-haiku-4-5", api_key="k")
+        engine = SynthesisEngine(config)
+        mock_provider = AsyncMock()
+        mock_provider.generate.side_effect = [RuntimeError("boom"), "Synthesized content"]
+        engine._provider = mock_provider
+        contexts = make_source_contexts(jira_context=sample_jira_context)
+
+        await engine.synthesize(task_id="PROJ-123", source_contexts=contexts)
+        result = await engine.synthesize(task_id="PROJ-123", source_contexts=contexts)
+
+        assert result == "Synthesized content"
+        assert mock_provider.generate.call_count == 2
+
+    @pytest.mark.parametrize(("threshold", "expect_small"), [(100_000, True), (10, False)])
+    async def test_synthesize_routes_small_prompts(
+        self,
+        sample_jira_context: JiraContext,
+        threshold: int,
+        expect_small: bool,
+    ) -> None:
+        """Test that prompts under the token threshold go to the small model."""
+        config = SynthesisConfig(
+            provider="anthropic",
+            model="claude-sonnet-4-5",
+            api_key="k",
+            small_model="claude-haiku-4-5",
+            small_model_threshold_tokens=threshold,
+        )
+        engine = SynthesisEngine(config)
+        large, small = AsyncMock(), AsyncMock()
+        large.generate.return_value = "large"
+        small.generate.return_value = "small"
+        engine._provider = large
+        engine._small_provider = small
+
+        result = await engine.synthesize(
+            task_id="PROJ-123",
+            source_contexts=make_source_contexts(jira_context=sample_jira_context),
+        )
+
+        assert result == ("small" if expect_small else "large")
+
+    def test_small_provider_uses_small_model(self) -> None:
+        """Test that the small provider is built from the small model settings."""
+        config = SynthesisConfig(
+            provider="anthropic",
+            model="claude-sonnet-4-5",
+            api_key="k",
+            small_model="llama3",
+            small_provider="ollama",
+        )
+        engine = SynthesisEngine(config)
+
+        provider = engine._get_small_provider()
+
+        assert isinstance(provider, OllamaProvider)
+        assert provider._model == "llama3"
+        assert engine._get_small_provider() is provider
+
+    def test_cross_provider_small_model_uses_small_api_key(self) -> None:
+        """Test that a small model on another keyed provider gets its own key."""
+        config = SynthesisConfig(
+            provider="anthropic",
+            model="claude-sonnet-4-5",
+            api_key="anthropic-key",
+            small_model="gpt-4o-mini",
+            small_provider="openai",
+            small_api_key="openai-key",
+        )
+        engine = SynthesisEngine(config)
+
+        provider = engine._get_small_provider()
+
+        assert isinstance(provider, OpenAIProvider)
+        assert provider._api_key == "openai-key"
+
+    def test_cross_provider_small_model_without_key_rejected(self) -> None:
+        """Test that a keyless small provider fails at config load, not per call."""
+        with pytest.raises(ValidationError, match="small_api_key"):
+            SynthesisConfig(
+                provider="anthropic",
+                api_key="anthropic-key",
+                small_model="gpt-4o-mini",
+                small_provider="openai",
+            )
+
+    def test_prompt_template_resolved_once(self, tmp_path, monkeypatch) -> None:
+        """Test that a missing custom template falls back once without re-checking."""
+        from pathlib import Path
+
+        checks = 0
+        real_exists = Path.exists
+
+        def counting_exists(self: Path) -> bool:
+            nonlocal checks
+            checks += 1
+            return real_exists(self)
+
+        monkeypatch.setattr(Path, "exists", counting_exists)
+        engine = SynthesisEngine(SynthesisConfig(prompt_template=str(tmp_path / "missing.txt")))
+
+        assert engine._get_prompt_template() == SYNTHESIS_PROMPT
+        assert engine._get_prompt_template() == SYNTHESIS_PROMPT
+        assert checks == 1
+
+    def test_custom_prompt_template_loaded(self, tmp_path) -> None:
+        """Test that an existing custom template file is used."""
+        template = tmp_path / "prompt.txt"
+        template.write_text("Custom {task_id}: {raw_data}")
+        engine = SynthesisEngine(SynthesisConfig(prompt_template=str(template)))
+
+        assert engine._get_prompt_template() == "Custom {task_id}: {raw_data}"
+
+    @pytest.mark.parametrize(
+        ("error", "reason"),
+        [
+            (ModuleNotFoundError("anthropic"), "LLM provider not available, using fallback"),
+            (ValueError("bad key"), "LLM configuration error, using fallback"),
+            (RuntimeError("boom"), "LLM synthesis failed, using fallback"),
+        ],
+    )
+    def test_fallback_reason_by_error_type(self, error: Exception, reason: str) -> None:
+        """Test that fallback log messages follow the error type, including subclasses."""
+        assert _fallback_reason(error) == reason
+
+
+class FakeSDKClient:
+    """Stand-in for AsyncAnthropic/AsyncOpenAI that records constructor arguments."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+
+
+class TestSDKClientTimeout:
+    """Tests for the SDK clients built over the shared HTTP client."""
+
+    @pytest.mark.parametrize(
+        ("module", "class_name", "provider_class"),
+        [
+            ("anthropic", "AsyncAnthropic", AnthropicProvider),
+            ("openai", "AsyncOpenAI", OpenAIProvider),
+        ],
+    )
+    async def test_shared_client_keeps_sdk_timeout(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        module: str,
+        class_name: str,
+        provider_class: type[AnthropicProvider] | type[OpenAIProvider],
+    ) -> None:
+        """Test that a shared HTTP client doesn't shorten the SDK request timeout."""
+        monkeypatch.setitem(sys.modules, module, SimpleNamespace(**{class_name: FakeSDKClient}))
+        shared = create_http_client()
+        provider = provider_class(api_key="k", model="m", http_client=shared)
+
+        client = provider._get_client()
+
+        assert client.kwargs["http_client"] is shared
+        assert client.kwargs["timeout"] == LLM_SDK_TIMEOUT_SECONDS
+        assert shared.follow_redirects
+        await shared.aclose()
+
 
 class TestAnthropicProvider:
     """Tests for AnthropicProvider."""
@@ -445,3 +759,178 @@ class TestOllamaProvider:
         provider = OllamaProvider(model="llama2", base_url="http://custom:11434")
 
         assert provider._base_url == "http://custom:11434"
+
+    async def test_generate_uses_shared_client(self, httpx_mock: HTTPXMock) -> None:
+        """Test that an injected client is used and left open on close."""
+        httpx_mock.add_response(
+            url="http://custom:11434/api/generate", json={"response": "Generated"}
+        )
+        shared = create_http_client()
+        provider = OllamaProvider(
+            model="llama2", base_url="http://custom:11434/", http_client=shared
+        )
+
+        result = await provider.generate("prompt", max_tokens=10)
+        await provider.close()
+
+        assert result == "Generated"
+        assert not shared.is_closed
+        await shared.aclose()
+
+    async def test_generate_stream_yields_chunks(self, httpx_mock: HTTPXMock) -> None:
+        """Test that streamed NDJSON lines are yielded as text chunks."""
+        lines = [
+            {"response": "Hel", "done": False},
+            {"response": "lo", "done": False},
+            {"response": "", "done": True},
+        ]
+        httpx_mock.add_response(
+            url="http://ollama.test/api/generate",
+            content="\n".join(json.dumps(line) for line in lines).encode(),
+        )
+        provider = OllamaProvider(model="llama2", base_url="http://ollama.test")
+
+        chunks = [chunk async for chunk in provider.generate_stream("prompt", max_tokens=10)]
+        await provider.close()
+
+        assert chunks == ["Hel", "lo"]
+        assert json.loads(httpx_mock.get_requests()[0].content)["stream"] is True
+
+
+class FakeOpenAICompletions:
+    """Stand-in for the OpenAI chat completions resource when streaming."""
+
+    async def create(self, **kwargs):
+        assert kwargs["stream"] is True
+
+        async def chunks():
+            for text in ["Hel", None, "lo"]:
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+                )
+
+        return chunks()
+
+
+class TestGenerateStream:
+    """Tests for streaming generation."""
+
+    async def test_openai_stream_skips_empty_deltas(self) -> None:
+        """Test that OpenAI stream chunks without content are skipped."""
+        provider = OpenAIProvider(api_key="k", model="gpt-4")
+        provider._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=FakeOpenAICompletions())
+        )
+
+        chunks = [chunk async for chunk in provider.generate_stream("prompt", max_tokens=10)]
+
+        assert chunks == ["Hel", "lo"]
+
+    async def test_generate_batch_bounds_concurrency(self, monkeypatch) -> None:
+        """Test that batched prompts keep order and respect the concurrency cap."""
+        monkeypatch.setattr("devscontext.synthesis.LLM_BATCH_CONCURRENCY", 2)
+        in_flight = 0
+        peak = 0
+
+        class EchoProvider(LLMProvider):
+            async def generate(self, prompt: str, max_tokens: int) -> str:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return prompt.upper()
+
+        results = await EchoProvider().generate_batch(["a", "b", "c", "d"], max_tokens=1)
+
+        assert results == ["A", "B", "C", "D"]
+        assert peak == 2
+
+    async def test_default_stream_yields_full_response(self) -> None:
+        """Test that providers without native streaming yield one chunk."""
+
+        class StaticProvider(LLMProvider):
+            async def generate(self, prompt: str, max_tokens: int) -> str:
+                return "full text"
+
+        chunks = [chunk async for chunk in StaticProvider().generate_stream("p", max_tokens=1)]
+
+        assert chunks == ["full text"]
+
+    async def test_synthesize_stream_yields_chunks_and_caches(
+        self, sample_jira_context: JiraContext
+    ) -> None:
+        """Test that synthesize_stream relays provider chunks and caches the result."""
+
+        class ChunkProvider(LLMProvider):
+            async def generate(self, prompt: str, max_tokens: int) -> str:
+                raise AssertionError("synthesize_stream should not call generate")
+
+            async def generate_stream(self, prompt: str, max_tokens: int):
+                for chunk in ("## Task", " summary"):
+                    yield chunk
+
+        engine = SynthesisEngine(SynthesisConfig(provider="anthropic", api_key="k"))
+        engine._provider = ChunkProvider()
+        contexts = make_source_contexts(jira_context=sample_jira_context)
+
+        chunks = [c async for c in engine.synthesize_stream("PROJ-123", contexts)]
+
+        assert chunks == ["## Task", " summary"]
+        assert await engine.synthesize("PROJ-123", contexts) == "## Task summary"
+
+    async def test_synthesize_stream_falls_back_before_output(
+        self, sample_jira_context: JiraContext
+    ) -> None:
+        """Test that a stream failing before any output yields the fallback."""
+
+        class FailingProvider(LLMProvider):
+            async def generate(self, prompt: str, max_tokens: int) -> str:
+                raise RuntimeError("boom")
+
+        engine = SynthesisEngine(SynthesisConfig(provider="anthropic", api_key="k"))
+        engine._provider = FailingProvider()
+        contexts = make_source_contexts(jira_context=sample_jira_context)
+
+        chunks = [c async for c in engine.synthesize_stream("PROJ-123", contexts)]
+
+        assert len(chunks) == 1
+        assert "PROJ-123" in chunks[0]
+
+
+class TestSynthesisPluginLifecycle:
+    """Tests for the synthesis plugin's HTTP client lifecycle."""
+
+    async def test_provider_shares_plugin_client(self) -> None:
+        """Test that the provider reuses the plugin's client and close releases it."""
+        engine = SynthesisEngine(SynthesisConfig(provider="ollama", model="llama2"))
+
+        provider = engine._get_provider()
+        client = engine._http_client
+
+        assert engine._get_provider() is provider
+        assert provider._get_client() is client
+
+        await engine.close()
+
+        assert client is not None and client.is_closed
+        assert engine._http_client is None
+
+
+class TestPassthroughSynthesisPlugin:
+    """Tests for PassthroughSynthesisPlugin."""
+
+    async def test_dispatches_by_context_type(self, sample_jira_context: JiraContext) -> None:
+        """Test that typed data uses its formatter and untyped data its raw text."""
+        contexts = make_source_contexts(jira_context=sample_jira_context)
+        contexts["notes"] = SourceContext(
+            source_name="notes", source_type="documentation", raw_text="Plain notes"
+        )
+
+        result = await PassthroughSynthesisPlugin(SynthesisConfig()).synthesize(
+            "PROJ-123", contexts
+        )
+
+        assert f"**{sample_jira_context.ticket.ticket_id}**" in result
+        assert "### Source: notes (documentation)" in result
+        assert "Plain notes" in result
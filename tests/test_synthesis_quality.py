@@ -28,7 +28,7 @@ from devscontext.models import (
     SynthesisConfig,
 )
 from devscontext.plugins.base import SourceContext
-from devscontext.synthesis import SynthesisEngine
+from devscontext.synthesis import SynthesisEngine, _partition_docs
 
 
 def make_source_contexts(
@@ -358,14 +358,16 @@ class TestRawDataFormatting:
         docs_context: DocsContext,
     ) -> None:
         """Test docs context formatting splits by doc type."""
+        by_type = _partition_docs(docs_context.sections)
+
         # Test architecture docs
-        arch_result = synthesis_engine._format_architecture_docs(docs_context)
+        arch_result = synthesis_engine._format_architecture_docs(by_type["architecture"])
         assert "## ARCHITECTURE DOCS" in arch_result
         assert "**Source:**" in arch_result
         assert "auth-service" in arch_result
 
         # Test coding standards
-        standards_result = synthesis_engine._format_coding_standards(docs_context)
+        standards_result = synthesis_engine._format_coding_standards(by_type["standards"])
         assert "## CODING STANDARDS" in standards_result
         assert "PKCE" in standards_result
 
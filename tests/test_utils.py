@@ -1,6 +1,12 @@
 """Tests for utility functions."""
 
-from devscontext.utils import extract_keywords, format_duration, truncate_text
+from devscontext.utils import (
+    clip_text,
+    extract_keywords,
+    format_duration,
+    split_markdown_sections,
+    truncate_text,
+)
 
 
 class TestExtractKeywords:
@@ -104,6 +110,18 @@ class TestExtractKeywords:
         assert "api" in result
 
 
+class TestClipText:
+    """Tests for clip_text function."""
+
+    def test_short_text_unchanged(self):
+        """Text within the limit is returned without a suffix."""
+        assert clip_text("short", 10) == "short"
+
+    def test_long_text_clipped_with_suffix(self):
+        """Text over the limit is hard-cut and suffixed."""
+        assert clip_text("abcdefghij", 4) == "abcd..."
+
+
 class TestTruncateText:
     """Tests for truncate_text function."""
 
@@ -170,6 +188,40 @@ class TestTruncateText:
         assert result.endswith("... [truncated]")
 
 
+class TestSplitMarkdownSections:
+    """Tests for split_markdown_sections function."""
+
+    def test_short_text_is_one_chunk(self):
+        """Text within the limit should be returned as a single chunk."""
+        assert split_markdown_sections("# Title\n\n## A\nbody", 100) == ["# Title\n\n## A\nbody"]
+
+    def test_splits_before_level_two_headings(self):
+        """Chunks should start at ## headings and rejoin to the original."""
+        text = "# Title\n\n## A\n" + "a" * 20 + "\n## B\n" + "b" * 20 + "\n"
+
+        chunks = split_markdown_sections(text, 30)
+
+        assert len(chunks) == 3
+        assert chunks[1].startswith("## A")
+        assert chunks[2].startswith("## B")
+        assert "".join(chunks) == text
+
+    def test_packs_small_sections_together(self):
+        """Sections that fit together should share a chunk."""
+        text = "## A\na\n## B\nb\n## C\n" + "c" * 40
+
+        chunks = split_markdown_sections(text, 20)
+
+        assert chunks[0] == "## A\na\n## B\nb\n"
+        assert "".join(chunks) == text
+
+    def test_does_not_split_level_three_headings(self):
+        """Oversized sections are kept whole rather than cut mid-section."""
+        text = "## A\n### Sub\n" + "a" * 50
+
+        assert split_markdown_sections(text, 10) == [text]
+
+
 class TestFormatDuration:
     """Tests for format_duration function."""
 
@@ -142,7 +142,7 @@ class TestJiraWatcher:
 
     async def test_poll_once_disabled_jira_returns_empty(self, config: DevsContextConfig) -> None:
         """Test polling with disabled Jira returns empty list."""
-        config.sources.jira.enabled = False
+        config.sources.jira = config.sources.jira.model_copy(update={"enabled": False})
         pipeline = AsyncMock()
         watcher = JiraWatcher(config, pipeline)
 